@@ -0,0 +1,80 @@
+"""Measures size of the encoded payload, encoding, decoding and parsing of the payload into actor
+arguments by every converter, for every codec which is installed.
+
+Run with: `python benchmarks/codecs.py`
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock
+
+from repid import MessageData
+from repid.codecs import CborCodec, CodecT, JsonCodec, MsgpackCodec
+from repid.converter import BasicConverter, ConverterT, MsgspecConverter, PydanticConverter
+from repid.data import ActorExecutionContext
+from repid.serializer import default_serializer
+
+ITERATIONS = 20_000
+
+PAYLOAD = {
+    "device_id": 42,
+    "readings": [{"sensor": f"s{i}", "value": 20.5 + i, "ok": True} for i in range(20)],
+    "tags": ["indoor", "floor-2"],
+}
+
+CONTEXT = ActorExecutionContext(
+    server=AsyncMock(),
+    publish=AsyncMock(),
+    default_serializer=default_serializer,
+)
+
+
+async def telemetry(device_id: int, readings: list[dict[str, Any]], tags: list[str]) -> None: ...
+
+
+def bench(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def bench_converter(converter: ConverterT, message: MessageData) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await converter.convert_inputs(
+            message=message,  # type: ignore[arg-type]
+            actor=None,  # type: ignore[arg-type]
+            actor_context=CONTEXT,
+        )
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    codecs: list[CodecT] = [JsonCodec(), MsgpackCodec(), CborCodec()]
+    converters: list[type[ConverterT]] = [BasicConverter, PydanticConverter, MsgspecConverter]
+    print(
+        f"{'codec':>20} {'bytes':>6} {'encode, us':>11} {'decode, us':>11}",
+        *(f"{converter.__name__ + ', us':>22}" for converter in converters),
+    )
+    for codec in codecs:
+        encoded = codec(PAYLOAD)
+        message = MessageData(payload=encoded, headers=None, content_type=codec.content_type)
+        encode = bench(lambda codec=codec: codec(PAYLOAD))
+        decode = bench(lambda codec=codec, encoded=encoded: codec.decode(encoded))
+        parse = [
+            await bench_converter(converter(telemetry, correlation_id=None), message)
+            for converter in converters
+        ]
+        print(
+            f"{codec.content_type:>20} {len(encoded):>6} {encode:>11.2f} {decode:>11.2f}",
+            *(f"{value:>22.2f}" for value in parse),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
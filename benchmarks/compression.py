@@ -0,0 +1,88 @@
+"""Measures compressed size and time to compress and decompress typical JSON payloads with every
+compression algorithm which is installed, including zstd with a dictionary trained on the channel.
+
+Run with: `python benchmarks/compression.py`
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+
+from repid._utils import is_installed
+from repid.compression import CompressionMiddleware, decompress_payload
+from repid.data import MessageData
+
+ITERATIONS = 5_000
+
+
+def order(i: int) -> bytes:
+    return json.dumps(
+        {
+            "order_id": i,
+            "status": "created",
+            "customer": {"id": i * 7, "email": f"customer{i}@example.com", "tier": "gold"},
+            "items": [{"sku": f"SKU-{i + j:05}", "amount": j, "price": 9.99} for j in range(3)],
+        },
+    ).encode()
+
+
+SMALL = order(1)
+LARGE = json.dumps([json.loads(order(i)) for i in range(200)]).encode()
+
+
+async def bench(middleware: CompressionMiddleware, payload: bytes) -> tuple[int, float, float]:
+    sent: list[MessageData] = []
+
+    async def call_next(
+        _channel: str,
+        message: MessageData,
+        _server_specific_parameters: dict[str, Any] | None,
+    ) -> None:
+        sent.append(message)
+
+    message = MessageData(payload=payload)
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await middleware(call_next, "orders", message, None)
+    compress = (time.perf_counter() - started) / ITERATIONS * 1e6
+
+    compressed = sent[-1]
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        decompress_payload(compressed)  # type: ignore[arg-type]
+    decompress = (time.perf_counter() - started) / ITERATIONS * 1e6
+    return len(compressed.payload), compress, decompress
+
+
+async def main() -> None:
+    middlewares: dict[str, CompressionMiddleware] = {
+        "gzip": CompressionMiddleware("gzip", threshold=0),
+    }
+    if is_installed("lz4"):
+        middlewares["lz4"] = CompressionMiddleware("lz4", threshold=0)
+    if is_installed("zstandard"):
+        import zstandard  # noqa: PLC0415
+
+        dictionary = zstandard.train_dictionary(4096, [order(i) for i in range(2000, 4000)])
+        middlewares["zstd"] = CompressionMiddleware("zstd", threshold=0)
+        middlewares["zstd+dict"] = CompressionMiddleware(
+            "zstd",
+            threshold=0,
+            dictionaries={"orders": dictionary.as_bytes()},
+        )
+
+    print(
+        f"{'algorithm':>10} {'case':>8} {'bytes':>12} {'compress, us':>13} {'decompress, us':>15}",
+    )
+    for case, payload in (("small", SMALL), ("large", LARGE)):
+        for name, middleware in middlewares.items():
+            size, compress, decompress = await bench(middleware, payload)
+            sizes = f"{len(payload)}->{size}"
+            print(f"{name:>10} {case:>8} {sizes:>12} {compress:>13.2f} {decompress:>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
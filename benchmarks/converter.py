@@ -0,0 +1,105 @@
+"""Measures per-message overhead of the converters: parsing of a message and binding of the
+parsed values to arguments of the actor, for actors with and without dependencies.
+
+Run with: `python benchmarks/converter.py`
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Annotated, Any
+from unittest.mock import AsyncMock
+
+from repid import Depends, Header
+from repid._utils import is_installed
+from repid.converter import (
+    BasicConverter,
+    ConverterT,
+    MsgspecConverter,
+    PydanticConverter,
+    PydanticDictConverter,
+)
+from repid.data import ActorExecutionContext, MessageData
+from repid.serializer import default_serializer
+
+ITERATIONS = 50_000
+
+
+async def payload_only(user_id: int, name: str, email: str | None = None) -> None:
+    pass
+
+
+async def with_header(
+    user_id: int,
+    name: str,
+    tenant: Annotated[str, Header(name="X-Tenant")],
+) -> None:
+    pass
+
+
+def _double(user_id: int) -> int:
+    return user_id * 2
+
+
+async def with_depends(user_id: int, name: str, doubled: Annotated[int, Depends(_double)]) -> None:
+    pass
+
+
+async def telemetry(device_id: str, readings: list[dict[str, float]]) -> None:
+    pass
+
+
+MESSAGE = MessageData(
+    payload=b'{"user_id": 1, "name": "John"}',
+    headers={"X-Tenant": "acme"},
+    content_type="application/json",
+)
+
+TELEMETRY_MESSAGE = MessageData(
+    payload=json.dumps(
+        {
+            "device_id": "device-1",
+            "readings": [{"ts": 1700000000.0 + i, "value": i / 3} for i in range(100)],
+        },
+    ).encode(),
+    headers=None,
+    content_type="application/json",
+)
+
+CASES: dict[str, tuple[Any, MessageData]] = {
+    "payload only": (payload_only, MESSAGE),
+    "header": (with_header, MESSAGE),
+    "depends": (with_depends, MESSAGE),
+    "telemetry": (telemetry, TELEMETRY_MESSAGE),
+}
+
+
+async def bench(converter_cls: type[ConverterT], fn: Any, message: Any) -> float:
+    converter = converter_cls(fn, fn_locals=globals(), correlation_id=None)
+    actor: Any = None
+    actor_context = ActorExecutionContext(
+        server=AsyncMock(),
+        publish=AsyncMock(),
+        default_serializer=default_serializer,
+    )
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await converter.convert_inputs(message=message, actor=actor, actor_context=actor_context)
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    print(f"{'converter':>22} {'actor':>14} {'us/msg':>8}")
+    converters: list[Any] = [BasicConverter, PydanticConverter, PydanticDictConverter]
+    if is_installed("msgspec"):
+        converters.append(MsgspecConverter)
+    for converter_cls in converters:
+        for case, (fn, message) in CASES.items():
+            elapsed = await bench(converter_cls, fn, message)
+            print(f"{converter_cls.__name__:>22} {case:>14} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
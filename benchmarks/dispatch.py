@@ -0,0 +1,69 @@
+"""Measures dispatch throughput of the runner: how many messages per second it can pass from
+`InMemoryServer` to a no-op actor, with regular and (on Python 3.12+) eager task execution.
+
+Run with: `python benchmarks/dispatch.py`
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from unittest.mock import AsyncMock
+
+from repid import Router
+from repid._runner import _Runner
+from repid.connections.in_memory import InMemoryServer
+from repid.data import ActorExecutionContext, MessageData
+from repid.serializer import default_serializer
+
+MESSAGES = 50_000
+ROUNDS = 3
+
+
+def make_router() -> Router:
+    router = Router()
+
+    @router.actor(keep_alive=False)
+    async def noop() -> None:
+        pass
+
+    return router
+
+
+async def bench(*, eager_execution: bool) -> float:
+    server = InMemoryServer()
+    router = make_router()
+    async with server.connection():
+        for _ in range(MESSAGES):
+            await server.publish(
+                channel="default",
+                message=MessageData(payload=b"", headers={"topic": "noop"}),
+            )
+        runner = _Runner(
+            actor_context=ActorExecutionContext(
+                server=server,
+                publish=AsyncMock(),
+                default_serializer=default_serializer,
+            ),
+            max_tasks=MESSAGES,
+            eager_execution=eager_execution,
+        )
+        start = time.perf_counter()
+        await runner.run(
+            channels_to_actors=router._actors_per_channel_address,
+            graceful_termination_timeout=10.0,
+        )
+        return MESSAGES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    modes = [False, True] if sys.version_info >= (3, 12) else [False]
+    print(f"{'mode':>8} {'msg/s':>10}")
+    for eager_execution in modes:
+        best = max(asyncio.run(bench(eager_execution=eager_execution)) for _ in range(ROUNDS))
+        print(f"{'eager' if eager_execution else 'regular':>8} {best:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measures encoding and decoding of typical payloads and broker headers with every JSON backend
+which is installed.
+
+Run with: `python benchmarks/json_backend.py`
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from repid._utils import is_installed, json_dumps, json_loads
+from repid.serializer import default_serializer, set_json_backend
+
+ITERATIONS = 50_000
+
+
+@dataclass
+class Order:
+    order_id: uuid.UUID
+    created_at: datetime
+    items: list[dict[str, Any]]
+
+
+SMALL = {"user_id": 1, "name": "John", "email": "john@example.com", "is_active": True}
+LARGE = {
+    "orders": [
+        {"id": i, "sku": f"SKU-{i:05}", "price": 10.5 + i, "tags": ["a", "b", "c"]}
+        for i in range(100)
+    ],
+}
+DATACLASS = Order(
+    order_id=uuid.UUID(int=1),
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    items=[{"sku": "SKU-1", "amount": 2}] * 10,
+)
+HEADERS = {"topic": "my_actor", "X-Tenant": "acme", "priority": "5", "deadline": "1700000000.0"}
+
+
+def bench(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    backends = ["json"] + [name for name in ("orjson", "msgspec") if is_installed(name)]
+    print(f"{'backend':>8} {'case':>18} {'dumps, us':>10} {'loads, us':>10}")
+    for backend in backends:
+        set_json_backend(backend)  # type: ignore[arg-type]
+        for case, data in (
+            ("small payload", SMALL),
+            ("large payload", LARGE),
+            ("dataclass payload", DATACLASS),
+            ("headers", HEADERS),
+        ):
+            encoded = default_serializer(data)
+            dumps = bench(lambda data=data: json_dumps(data))
+            loads = bench(lambda encoded=encoded: json_loads(encoded))
+            print(f"{backend:>8} {case:>18} {dumps:>10.2f} {loads:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measures overhead of the actor middleware pipeline per message with 5 middlewares: rebuilding
+the chain for every message, reusing the compiled chain, and `ActorHookMiddleware` hooks.
+
+Run with: `python benchmarks/middlewares.py`
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any
+
+from repid import ActorHookMiddleware
+from repid.middlewares import _ActorMiddlewarePipeline, _compile_actor_middleware_pipeline
+
+ITERATIONS = 200_000
+MIDDLEWARES = 5
+
+
+def before(_message: Any, _actor: Any) -> None:
+    pass
+
+
+def after(_message: Any, _actor: Any, _result: Any, _exception: BaseException | None) -> None:
+    pass
+
+
+async def middleware(
+    call_next: Callable[[Any, Any], Coroutine[Any, Any, Any]],
+    message: Any,
+    actor: Any,
+) -> Any:
+    # the same work as the hooks do, e.g. start and finish a span
+    before(message, actor)
+    try:
+        result = await call_next(message, actor)
+    except BaseException as exc:
+        after(message, actor, None, exc)
+        raise
+    after(message, actor, result, None)
+    return result
+
+
+async def leaf(message: Any, actor: Any, *, actor_context: Any) -> Any:  # noqa: ARG001
+    return None
+
+
+async def bench(run: Callable[[], Coroutine[Any, Any, Any]]) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await run()
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    middlewares = [middleware] * MIDDLEWARES
+    hooks = [ActorHookMiddleware(before=before, after=after)] * MIDDLEWARES
+    bound_leaf = partial(leaf, actor_context=None)
+
+    assemble = _compile_actor_middleware_pipeline(middlewares)
+    compiled = _ActorMiddlewarePipeline(middlewares)
+    compiled_hooks = _ActorMiddlewarePipeline(hooks)  # type: ignore[arg-type]
+
+    cases: dict[str, Callable[[], Coroutine[Any, Any, Any]]] = {
+        "no middlewares": lambda: bound_leaf(None, None),
+        "rebuilt per message": lambda: assemble(partial(leaf, actor_context=None))(None, None),
+        "compiled once": lambda: compiled(bound_leaf, None, None),  # type: ignore[arg-type]
+        "hooks": lambda: compiled_hooks(bound_leaf, None, None),  # type: ignore[arg-type]
+    }
+
+    print(f"{'pipeline':>20} {'us per message':>15}")
+    for name, run in cases.items():
+        print(f"{name:>20} {await bench(run):>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+"""Measures the cost of picking an actor for a message depending on the amount of actors
+registered on a channel, comparing linear scan of routing strategies with the routing index.
+
+Run with: `python benchmarks/routing.py`
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from repid import Router
+from repid.data import MessageData
+
+ACTOR_COUNTS = (1, 10, 50, 200, 1000)
+ITERATIONS = 100_000
+
+
+def make_router(actors: int) -> Router:
+    router = Router()
+    for i in range(actors):
+
+        async def actor() -> None:
+            pass
+
+        router.actor(actor, name=f"actor_{i}")
+    return router
+
+
+def bench(count: int) -> tuple[float, float]:
+    materialized = make_router(count)._materialize()
+    actors = materialized._actors_per_channel_address["default"]
+    index = materialized._actor_index_per_channel_address["default"]
+    # worst case for the scan: the last registered actor matches
+    message = MessageData(payload=b"", headers={"topic": f"actor_{count - 1}"})
+
+    scan = timeit.timeit(
+        lambda: next(filter(lambda actor: actor.routing_strategy(message), actors), None),
+        number=ITERATIONS,
+    )
+    indexed = timeit.timeit(lambda: index.match(message), number=ITERATIONS)
+    return scan / ITERATIONS * 1e9, indexed / ITERATIONS * 1e9
+
+
+def main() -> None:
+    print(f"{'actors':>8} {'scan, ns/msg':>14} {'index, ns/msg':>14}")
+    for count in ACTOR_COUNTS:
+        scan, indexed = bench(count)
+        print(f"{count:>8} {scan:>14.0f} {indexed:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measures startup cost of an application depending on the amount of actors: materialization
+of the router (converters are built lazily), repeated access to the materialized router and
+building of all of the converters, which is otherwise spread over the first messages.
+
+Run with: `python benchmarks/startup.py`
+"""
+
+from __future__ import annotations
+
+import time
+
+from repid import Router
+
+ACTOR_COUNTS = (10, 100, 500, 1500)
+
+
+def make_router(actors: int) -> Router:
+    router = Router()
+    for i in range(actors):
+
+        async def actor(user_id: int, name: str, email: str | None = None) -> None:
+            pass
+
+        router.actor(actor, name=f"actor_{i}")
+    return router
+
+
+def bench(count: int) -> tuple[float, float, float]:
+    router = make_router(count)
+
+    started = time.perf_counter()
+    materialized = router._materialize()
+    materialize = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(100):
+        router._materialize()
+    cached = (time.perf_counter() - started) / 100
+
+    started = time.perf_counter()
+    for actor in materialized.actors:
+        actor.converter._resolve()  # type: ignore[attr-defined]
+    converters = time.perf_counter() - started
+
+    return materialize * 1e3, cached * 1e3, converters * 1e3
+
+
+def main() -> None:
+    print(f"{'actors':>8} {'materialize, ms':>16} {'cached, ms':>12} {'converters, ms':>16}")
+    for count in ACTOR_COUNTS:
+        materialize, cached, converters = bench(count)
+        print(f"{count:>8} {materialize:>16.1f} {cached:>12.4f} {converters:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Measures time and peak memory of sending and receiving 1 MB messages through AMQP frame
+encoding and decoding, to show how many times the payload is copied on the way.
+
+Peak memory is shown in multiples of the payload size, with the payload itself excluded.
+
+Run with: `python benchmarks/zero_copy.py`
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from repid.connections.amqp._uamqp._decode import bytes_to_performative, transfer_frames_to_message
+from repid.connections.amqp._uamqp._encode import message_to_transfer_frames, performative_to_bytes
+from repid.connections.amqp._uamqp.message import Message
+from repid.connections.amqp.protocol.links import ReceiverLink
+
+ITERATIONS = 50
+PAYLOAD = b'{"data": "' + b"x" * (1024 * 1024 - 12) + b'"}'
+
+
+def send(max_frame_size: int) -> list[bytes]:
+    frames = message_to_transfer_frames(Message(data=[PAYLOAD]), max_frame_size, 0, b"tag", 1)
+    return [performative_to_bytes(frame) for frame in frames]
+
+
+def receive(frames: list[bytes]) -> Any:
+    transfers = [bytes_to_performative(frame) for frame in frames]
+    message = transfer_frames_to_message(transfers)  # type: ignore[arg-type]
+    return ReceiverLink._body_to_payload(message.body)
+
+
+def measure(fn: Callable[[], Any]) -> tuple[float, float]:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    elapsed = (time.perf_counter() - started) / ITERATIONS * 1e3
+
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / len(PAYLOAD)
+
+
+def main() -> None:
+    print(f"{'frame size':>12} {'frames':>7} {'stage':>8} {'time, ms':>9} {'peak, x payload':>16}")
+    for max_frame_size in (64 * 1024, 2 * 1024 * 1024):
+        frames = send(max_frame_size)
+        for stage, fn in (
+            ("send", lambda: send(max_frame_size)),  # noqa: B023
+            ("receive", lambda: receive(frames)),  # noqa: B023
+        ):
+            elapsed, peak = measure(fn)
+            print(f"{max_frame_size:>12} {len(frames):>7} {stage:>8} {elapsed:>9.3f} {peak:>16.2f}")
+
+    payload = receive(send(2 * 1024 * 1024))
+    print(f"single frame message is received as {type(payload).__name__}")
+
+
+if __name__ == "__main__":
+    main()
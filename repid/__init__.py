@@ -1,12 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .asyncapi import AsyncAPIGenerator as AsyncAPIGenerator
 from .asyncapi_server import AsyncAPIServer as AsyncAPIServer
 from .asyncapi_server import AsyncAPIServerSettings as AsyncAPIServerSettings
-from .connections import *  # noqa: F403
+from .claim_check import BlobStoreT as BlobStoreT
+from .claim_check import ClaimCheckActorMiddleware as ClaimCheckActorMiddleware
+from .claim_check import ClaimCheckMiddleware as ClaimCheckMiddleware
+from .claim_check import FileBlobStore as FileBlobStore
+from .claim_check import S3BlobStore as S3BlobStore
+from .codecs import CborCodec as CborCodec
+from .codecs import CodecT as CodecT
+from .codecs import JsonCodec as JsonCodec
+from .codecs import MsgpackCodec as MsgpackCodec
+from .codecs import get_codec as get_codec
+from .codecs import register_codec as register_codec
+from .compression import CompressionMiddleware as CompressionMiddleware
+from .compression import register_compression_dictionary as register_compression_dictionary
+from .compression import set_max_decompressed_size as set_max_decompressed_size
+from .connections import _SERVER_MODULES
 from .connections.abc import BaseMessageT as BaseMessageT
+from .connections.abc import CapabilitiesT as CapabilitiesT
+from .connections.abc import MessageAction as MessageAction
+from .connections.abc import ReceivedMessageT as ReceivedMessageT
+from .connections.abc import SentMessageT as SentMessageT
+from .connections.abc import ServerT as ServerT
+from .connections.abc import SubscriberT as SubscriberT
 from .converter import BasicConverter as BasicConverter
 from .converter import DefaultConverter as DefaultConverter
+from .converter import MsgspecConverter as MsgspecConverter
 from .converter import PydanticConverter as PydanticConverter
-from .data import *  # noqa: F403
+from .converter import PydanticDictConverter as PydanticDictConverter
+from .data import ActorData as ActorData
+from .data import ActorExecutionContext as ActorExecutionContext
+from .data import ActorMessageMetadata as ActorMessageMetadata
+from .data import AutoActionT as AutoActionT
+from .data import Channel as Channel
+from .data import Contact as Contact
+from .data import ConverterInputSchema as ConverterInputSchema
+from .data import CorrelationId as CorrelationId
+from .data import ExternalDocs as ExternalDocs
+from .data import License as License
+from .data import ManualActionT as ManualActionT
+from .data import MessageData as MessageData
+from .data import MessageExample as MessageExample
+from .data import MessageSchema as MessageSchema
+from .data import OnErrorAutoT as OnErrorAutoT
+from .data import OnErrorManualT as OnErrorManualT
+from .data import OnErrorT as OnErrorT
+from .data import RunnerInfo as RunnerInfo
+from .data import SendOperation as SendOperation
+from .data import Tag as Tag
 from .dependencies import Depends as Depends
 from .dependencies import FullPayload as FullPayload
 from .dependencies import Header as Header
@@ -17,10 +62,139 @@ from .health_check_server import HealthCheckServerSettings as HealthCheckServerS
 from .health_check_server import HealthCheckStatus as HealthCheckStatus
 from .logger import logger as logger
 from .main import Repid as Repid
+from .metrics import Metrics as Metrics
+from .metrics import MetricsServer as MetricsServer
+from .metrics import MetricsServerSettings as MetricsServerSettings
+from .middlewares import ActorHookMiddleware as ActorHookMiddleware
+from .profiling import MessageProfile as MessageProfile
+from .profiling import Profiler as Profiler
 from .router import Router as Router
 from .router import catch_all_routing_strategy as catch_all_routing_strategy
+from .router import glob_header_routing_strategy as glob_header_routing_strategy
+from .router import header_routing_strategy as header_routing_strategy
 from .router import topic_based_routing_strategy as topic_based_routing_strategy
 from .serializer import SerializerT as SerializerT
 from .serializer import default_serializer as default_serializer
+from .serializer import get_json_backend as get_json_backend
+from .serializer import set_json_backend as set_json_backend
 from .test_client import TestClient as TestClient
 from .test_client import TestMessage as TestMessage
+
+if TYPE_CHECKING:
+    from .connections import AmqpServer as AmqpServer
+    from .connections import InMemoryServer as InMemoryServer
+    from .connections import KafkaServer as KafkaServer
+    from .connections import NatsServer as NatsServer
+    from .connections import PubsubServer as PubsubServer
+    from .connections import RedisServer as RedisServer
+    from .connections import SqsServer as SqsServer
+
+__all__ = [
+    "ActorData",
+    "ActorExecutionContext",
+    "ActorHookMiddleware",
+    "ActorMessageMetadata",
+    "AmqpServer",
+    "AsyncAPIGenerator",
+    "AsyncAPIServer",
+    "AsyncAPIServerSettings",
+    "AutoActionT",
+    "BaseMessageT",
+    "BasicConverter",
+    "BlobStoreT",
+    "CapabilitiesT",
+    "CborCodec",
+    "Channel",
+    "ClaimCheckActorMiddleware",
+    "ClaimCheckMiddleware",
+    "CodecT",
+    "CompressionMiddleware",
+    "Contact",
+    "ConverterInputSchema",
+    "CorrelationId",
+    "DefaultConverter",
+    "Depends",
+    "ExternalDocs",
+    "FileBlobStore",
+    "FullPayload",
+    "Header",
+    "HealthCheckServer",
+    "HealthCheckServerSettings",
+    "HealthCheckStatus",
+    "InMemoryServer",
+    "JsonCodec",
+    "License",
+    "ManualActionT",
+    "Message",
+    "MessageAction",
+    "MessageData",
+    "MessageDependency",
+    "MessageExample",
+    "MessageProfile",
+    "MessageSchema",
+    "Metrics",
+    "MetricsServer",
+    "MetricsServerSettings",
+    "MsgpackCodec",
+    "MsgspecConverter",
+    "OnErrorAutoT",
+    "OnErrorManualT",
+    "OnErrorT",
+    "Profiler",
+    "PydanticConverter",
+    "PydanticDictConverter",
+    "ReceivedMessageT",
+    "Repid",
+    "Router",
+    "RunnerInfo",
+    "S3BlobStore",
+    "SendOperation",
+    "SentMessageT",
+    "SerializerT",
+    "ServerT",
+    "SubscriberT",
+    "Tag",
+    "TestClient",
+    "TestMessage",
+    "catch_all_routing_strategy",
+    "default_serializer",
+    "get_codec",
+    "get_json_backend",
+    "glob_header_routing_strategy",
+    "header_routing_strategy",
+    "logger",
+    "register_codec",
+    "register_compression_dictionary",
+    "set_json_backend",
+    "set_max_decompressed_size",
+    "topic_based_routing_strategy",
+]
+
+# optional servers are exported only if their libraries are installed, as in `repid.connections`
+if "KafkaServer" in _SERVER_MODULES:
+    __all__ += ["KafkaServer"]
+
+if "NatsServer" in _SERVER_MODULES:
+    __all__ += ["NatsServer"]
+
+if "PubsubServer" in _SERVER_MODULES:
+    __all__ += ["PubsubServer"]
+
+if "RedisServer" in _SERVER_MODULES:
+    __all__ += ["RedisServer"]
+
+if "SqsServer" in _SERVER_MODULES:
+    __all__ += ["SqsServer"]
+
+
+def __getattr__(name: str) -> Any:
+    # servers are loaded lazily by `repid.connections`
+    if name in _SERVER_MODULES:
+        from . import connections  # noqa: PLC0415
+
+        return getattr(connections, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections import deque
+from contextlib import suppress
+
+logger = logging.getLogger("repid")
+
+
+class _AdaptiveLimiter:
+    """Concurrency limiter with a limit, which is adjusted at runtime.
+
+    The limit follows a gradient algorithm: every finished task reports its latency, which is
+    tracked as a short-term and a long-term exponential moving average. While short-term latency
+    stays within `tolerance` of the long-term one, the limit grows by roughly its square root,
+    and it shrinks proportionally once latency starts to rise (i.e. tasks started queueing).
+    On top of that, event loop lag is probed periodically and the limit is halved whenever the
+    loop is lagging behind, as this means that the process is CPU-bound.
+
+    Exposes the same `acquire`/`release`/`locked` interface as `asyncio.Semaphore`."""
+
+    __slots__ = (
+        "_limit",
+        "_long_latency",
+        "_probe_task",
+        "_short_latency",
+        "_waiters",
+        "in_flight",
+        "lag_probe_interval",
+        "lag_threshold",
+        "long_window",
+        "max_limit",
+        "min_limit",
+        "short_window",
+        "smoothing",
+        "tolerance",
+    )
+
+    def __init__(  # noqa: PLR0917
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        lag_threshold: float = 0.1,
+        lag_probe_interval: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Adaptive limits must satisfy 1 <= min <= initial <= max.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.short_window = 10
+        self.long_window = 600
+        self.lag_threshold = lag_threshold
+        self.lag_probe_interval = lag_probe_interval
+
+        self.in_flight = 0
+        self._limit = float(initial_limit)
+        self._short_latency: float | None = None
+        self._long_latency: float | None = None
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._probe_task: asyncio.Task | None = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def locked(self) -> bool:
+        return self.in_flight >= self.limit
+
+    async def acquire(self) -> None:
+        if not self.locked() and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was already handed over to this waiter, pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        # slots are handed over to waiters directly, so that newcomers can't overtake them
+        while self._waiters and not self.locked():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _set_limit(self, limit: float) -> None:
+        previous = self.limit
+        self._limit = min(max(limit, self.min_limit), self.max_limit)
+        if self.limit != previous:
+            logger.debug(
+                "limiter.adaptive.update",
+                extra={"limit": self.limit, "in_flight": self.in_flight},
+            )
+        if self.limit > previous:
+            self._wake_up()
+
+    def observe(self, latency: float) -> None:
+        """Report latency of a finished task."""
+        if self._short_latency is None or self._long_latency is None:
+            self._short_latency = self._long_latency = latency
+            return
+        self._short_latency += (latency - self._short_latency) * 2 / (self.short_window + 1)
+        self._long_latency += (latency - self._long_latency) * 2 / (self.long_window + 1)
+
+        # don't grow the limit, if the current one isn't used anyway
+        if self.in_flight < self._limit / 2 and self._short_latency <= self._long_latency:
+            return
+
+        gradient = max(
+            0.5,
+            min(1.0, self.tolerance * self._long_latency / max(self._short_latency, 1e-9)),
+        )
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+        self._set_limit(self._limit * (1 - self.smoothing) + new_limit * self.smoothing)
+
+    def observe_lag(self, lag: float) -> None:
+        """Report event loop lag, i.e. how late a scheduled callback was executed."""
+        if lag > self.lag_threshold:
+            logger.debug("limiter.adaptive.loop_lag", extra={"lag": lag})
+            self._set_limit(self._limit / 2)
+
+    async def _probe_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_probe_interval
+            await asyncio.sleep(self.lag_probe_interval)
+            self.observe_lag(loop.time() - expected)
+
+    def start(self) -> None:
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop_lag())
+
+    async def stop(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._probe_task
+            self._probe_task = None
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import math
-from collections.abc import Awaitable, Callable
-from contextlib import suppress
+import sys
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
 from functools import partial
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
+from repid._limiter import _AdaptiveLimiter
+from repid._timers import _get_timers
 from repid.connections.abc import SubscriberT
 from repid.data.actor import ActorExecutionContext
 from repid.health_check_server import HealthCheckStatus
+from repid.profiling import _current_profile, _stage
+from repid.router import _ActorIndex
 
 logger = logging.getLogger("repid")
 
@@ -18,10 +25,29 @@ if TYPE_CHECKING:
     from repid.connections.abc import ReceivedMessageT
     from repid.data.actor import ActorData
     from repid.health_check_server import HealthCheckServer
+    from repid.metrics import Metrics
+    from repid.profiling import MessageProfile, Profiler
 
 
 ActorResultT = Any
 
+PRIORITY_HEADER = "priority"
+DEADLINE_HEADER = "deadline"
+
+
+async def _with_timeout(aw: Awaitable[Any], timeout: float) -> Any:
+    async with _get_timers().timeout(timeout):
+        return await aw
+
+
+if sys.version_info >= (3, 12):  # pragma: no cover
+
+    def _create_eager_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        return asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+
+else:  # pragma: no cover
+    _create_eager_task = asyncio.create_task
+
 
 async def _actor_execution(
     message: ReceivedMessageT,
@@ -33,18 +59,8 @@ async def _actor_execution(
         actor=actor,
         actor_context=actor_context,
     )
-    return await actor.fn(*args, **kwargs)
-
-
-async def _keep_alive_loop(message: ReceivedMessageT, interval: float) -> None:
-    while True:
-        await asyncio.sleep(interval)
-        if message.is_acted_on:
-            return
-        try:
-            await message.keep_alive()
-        except Exception:  # noqa: BLE001
-            logger.warning("message.keep_alive.error", extra={"message_id": message.message_id})
+    with _stage("actor"):
+        return await actor.fn(*args, **kwargs)
 
 
 async def _run_with_keepalive(
@@ -63,77 +79,99 @@ async def _run_with_keepalive(
     if not actor_context.server.capabilities["supports_keep_alive"] or interval is None:
         return await _actor_execution(message, actor, actor_context)
 
-    keepalive_task = asyncio.create_task(_keep_alive_loop(message, interval))
+    keep_alive = _get_timers().keep_alive(message, interval)
     try:
         return await _actor_execution(message, actor, actor_context)
     finally:
-        keepalive_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await keepalive_task
+        keep_alive.stop()
+
+
+async def _confirm_error(message: ReceivedMessageT, actor: ActorData, exc: Exception) -> None:
+    if message.is_acted_on:
+        return
+    if actor.confirmation_mode in ("auto", "manual", "manual_explicit"):
+        error_action = actor.on_error if isinstance(actor.on_error, str) else actor.on_error(exc)
+        if error_action == "reject":
+            await message.reject()
+        elif error_action == "nack":
+            await message.nack()
+        elif error_action == "ack":
+            await message.ack()
+    elif actor.confirmation_mode == "always_ack":
+        await message.ack()
 
 
-async def _actor_execution_with_confirmation(  # noqa: C901, PLR0912
+async def _confirm_explicit(message: ReceivedMessageT, actor: ActorData, result: Any) -> None:
+    if result == "reject":
+        await message.reject()
+    elif result == "nack":
+        await message.nack()
+    elif result == "ack":
+        await message.ack()
+    elif result == "no_action":
+        pass
+    else:
+        raise ValueError(
+            f"Actor '{actor.name}' with confirmation_mode='manual_explicit' "
+            f"returned an invalid value: {result!r}. Expected one of: "
+            "'ack', 'nack', 'reject', 'no_action'.",
+        )
+
+
+async def _actor_execution_with_confirmation(
     message: ReceivedMessageT,
     actor: ActorData,
     actor_context: ActorExecutionContext,
 ) -> ActorResultT:
     """Wraps `_actor_execution` to ack/nack the message immediately after the actor fn runs,
     so middlewares unwinding above this leaf can observe `message.action`."""
-    try:
-        if actor.timeout is None or actor.timeout <= 0 or actor.timeout == float("inf"):
-            result = await _run_with_keepalive(message, actor, actor_context)
-        else:
-            result = await asyncio.wait_for(
-                _run_with_keepalive(message, actor, actor_context),
-                timeout=actor.timeout,
-            )
-    except Exception as exc:
-        if not message.is_acted_on:
-            if actor.confirmation_mode in ("auto", "manual", "manual_explicit"):
-                error_action = (
-                    actor.on_error if isinstance(actor.on_error, str) else actor.on_error(exc)
+    with _stage("handler"):
+        try:
+            timeout = _remaining_timeout(actor, (message,))
+            if timeout is None:
+                result = await _run_with_keepalive(message, actor, actor_context)
+            else:
+                result = await _with_timeout(
+                    _run_with_keepalive(message, actor, actor_context),
+                    timeout,
                 )
-                if error_action == "reject":
-                    await message.reject()
-                elif error_action == "nack":
-                    await message.nack()
-                elif error_action == "ack":
-                    await message.ack()
-            elif actor.confirmation_mode == "always_ack":
-                await message.ack()
-        raise
-    else:
-        if not message.is_acted_on:
-            if actor.confirmation_mode in ("auto", "always_ack"):
-                await message.ack()
-            elif actor.confirmation_mode == "manual_explicit":
-                if result == "reject":
-                    await message.reject()
-                elif result == "nack":
-                    await message.nack()
-                elif result == "ack":
-                    await message.ack()
-                elif result == "no_action":
-                    pass
-                else:
-                    raise ValueError(
-                        f"Actor '{actor.name}' with confirmation_mode='manual_explicit' "
-                        f"returned an invalid value: {result!r}. Expected one of: "
-                        "'ack', 'nack', 'reject', 'no_action'.",
-                    )
-        return result
+        except Exception as exc:
+            with _stage("ack"):
+                await _confirm_error(message, actor, exc)
+            raise
+        else:
+            if not message.is_acted_on:
+                with _stage("ack"):
+                    if actor.confirmation_mode in ("auto", "always_ack"):
+                        await message.ack()
+                    elif actor.confirmation_mode == "manual_explicit":
+                        await _confirm_explicit(message, actor, result)
+            return result
+
+
+def _actor_leaf(
+    actor_context: ActorExecutionContext,
+) -> Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, ActorResultT]]:
+    """Innermost call of the middleware pipeline. It's bound once per execution context, so
+    the pipeline compiled for it is reused for every message."""
+    return partial(_actor_execution_with_confirmation, actor_context=actor_context)
 
 
 async def _actor_run(
     actor: ActorData,
     message: ReceivedMessageT,
-    actor_context: ActorExecutionContext,
+    leaf: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, ActorResultT]],
 ) -> ActorResultT | Exception:
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.lap("schedule")
+
     if (
         not message.is_acted_on  # theoretically a server can automatically ack the message on receive
         and actor.confirmation_mode == "ack_first"
     ):
-        await message.ack()
+        with _stage("ack"):
+            await message.ack()
 
     logger_extra = {
         "actor_name": actor.name,
@@ -144,47 +182,281 @@ async def _actor_run(
     exception = None
     result = None
 
-    leaf = partial(
-        _actor_execution_with_confirmation,
-        actor_context=actor_context,
-    )
-
     try:
-        result = await actor.middleware_pipeline(leaf, message, actor)
+        with _stage("middleware"):
+            result = await actor.middleware_pipeline(leaf, message, actor)
     except Exception as exc:
         exception = exc
         logger.debug("actor.run.error", extra=logger_extra, exc_info=exc)
     else:
         logger.debug("actor.run.success", extra=logger_extra)
 
+    if profile is not None:
+        # the handler runs inside of the pipeline, leave only time of the middlewares
+        profile.add("middleware", -profile.stages.get("handler", 0.0))
+
     if not message.is_acted_on and actor.confirmation_mode == "manual":
         logger.warning("actor.ack.manual.unacknowledged", extra=logger_extra)
 
     return exception if exception is not None else result
 
 
-async def _actor_run_with_cancel_event_and_callback(  # noqa: PLR0917
+def _batch_results(actor: ActorData, result: Any, size: int) -> list[Any]:
+    if result is None:
+        return [None] * size
+    if not isinstance(result, list) or len(result) != size:
+        raise ValueError(
+            f"Batch actor '{actor.name}' returned an invalid value: {result!r}. "
+            f"Expected None or a list of {size} per-message results.",
+        )
+    for item_result in result:
+        if item_result not in (None, "ack", "nack", "reject", "no_action") and not isinstance(
+            item_result,
+            Exception,
+        ):
+            raise ValueError(
+                f"Batch actor '{actor.name}' returned an invalid per-message result: "
+                f"{item_result!r}. Expected one of: None, 'ack', 'nack', 'reject', 'no_action' "
+                "or an exception instance.",
+            )
+    return result
+
+
+async def _run_batch_with_keepalive(
+    messages: list[ReceivedMessageT],
+    items: list[Any],
     actor: ActorData,
-    message: ReceivedMessageT,
     actor_context: ActorExecutionContext,
+) -> ActorResultT:
+    if actor.keep_alive is False or not actor_context.server.capabilities["supports_keep_alive"]:
+        with _stage("actor"):
+            return await actor.fn(items)
+
+    timers = _get_timers()
+    keep_alives = []
+    for message in messages:
+        interval = (
+            actor.keep_alive
+            if isinstance(actor.keep_alive, (int, float)) and not isinstance(actor.keep_alive, bool)
+            else message.keep_alive_interval
+        )
+        if interval is not None:
+            keep_alives.append(timers.keep_alive(message, interval))
+    try:
+        with _stage("actor"):
+            return await actor.fn(items)
+    finally:
+        for keep_alive in keep_alives:
+            keep_alive.stop()
+
+
+async def _actor_run_batch(  # noqa: C901, PLR0912, PLR0915
+    actor: ActorData,
+    messages: list[ReceivedMessageT],
+    actor_context: ActorExecutionContext,
+) -> list[ActorResultT | Exception]:
+    """Calls a batch actor once with all messages which were converted successfully,
+    then acts on every message separately, according to its per-message result.
+    Returns results (or exceptions) in the same order as the messages."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.lap("schedule")
+
+    if actor.confirmation_mode == "ack_first":
+        with _stage("ack"):
+            for message in messages:
+                if not message.is_acted_on:
+                    await message.ack()
+
+    outcomes: list[ActorResultT | Exception] = [None] * len(messages)
+    converted: list[int] = []
+    items: list[Any] = []
+    for index, message in enumerate(messages):
+        try:
+            _, kwargs = await actor.converter.convert_inputs(
+                message=message,
+                actor=actor,
+                actor_context=actor_context,
+            )
+        except Exception as exc:  # noqa: BLE001
+            outcomes[index] = exc
+            with _stage("ack"):
+                await _confirm_error(message, actor, exc)
+        else:
+            converted.append(index)
+            items.extend(kwargs.values())
+
+    if not converted:
+        return outcomes
+
+    converted_messages = [messages[index] for index in converted]
+    logger_extra = {
+        "actor_name": actor.name,
+        "time_limit": actor.timeout,
+        "batch_size": len(converted_messages),
+    }
+
+    try:
+        timeout = _remaining_timeout(actor, converted_messages)
+        if timeout is None:
+            result = await _run_batch_with_keepalive(
+                converted_messages,
+                items,
+                actor,
+                actor_context,
+            )
+        else:
+            result = await _with_timeout(
+                _run_batch_with_keepalive(converted_messages, items, actor, actor_context),
+                timeout,
+            )
+        results = _batch_results(actor, result, len(items))
+    except Exception as exc:
+        logger.debug("actor.run.error", extra=logger_extra, exc_info=exc)
+        with _stage("ack"):
+            for index in converted:
+                outcomes[index] = exc
+                await _confirm_error(messages[index], actor, exc)
+        return outcomes
+
+    logger.debug("actor.run.success", extra=logger_extra)
+    with _stage("ack"):
+        for index, item_result in zip(converted, results, strict=True):
+            message = messages[index]
+            outcomes[index] = item_result
+            if isinstance(item_result, Exception):
+                await _confirm_error(message, actor, item_result)
+            elif message.is_acted_on:
+                continue
+            elif item_result is None or actor.confirmation_mode == "always_ack":
+                await message.ack()
+            elif item_result == "reject":
+                await message.reject()
+            elif item_result == "nack":
+                await message.nack()
+            elif item_result == "ack":
+                await message.ack()
+    return outcomes
+
+
+async def _actor_run_with_cancel_event_and_callback(
+    process: Coroutine[Any, Any, Any],
+    messages: Sequence[ReceivedMessageT],
     cancel_event: asyncio.Event,
-    cancel_event_task: asyncio.Task,
     callback: Callable[[], Awaitable],
 ) -> None:
-    process_task = asyncio.create_task(_actor_run(actor, message, actor_context))
-    await asyncio.wait(
-        {cancel_event_task, process_task},
-        return_when=asyncio.FIRST_COMPLETED,
-    )
-    if cancel_event.is_set():
-        process_task.cancel()
-        if not message.is_acted_on:
-            await message.reject()
+    """Runs the process in the current task. Once `cancel_event` is set, the runner cancels
+    the task and messages, which weren't acted on yet, are rejected."""
+    try:
+        if cancel_event.is_set():
+            process.close()
+            raise asyncio.CancelledError
+        await process
+    except asyncio.CancelledError:
+        if not cancel_event.is_set():
+            raise
+        for message in messages:
+            if not message.is_acted_on:
+                await message.reject()
         return
-    await process_task
     await callback()
 
 
+def _payload_size(messages: Sequence[ReceivedMessageT]) -> int:
+    return sum(len(message.payload) for message in messages)
+
+
+def _message_priority(actor: ActorData, message: ReceivedMessageT) -> int:
+    headers = message.headers
+    if headers is not None and (priority := headers.get(PRIORITY_HEADER)) is not None:
+        try:
+            return int(priority)
+        except (TypeError, ValueError):
+            logger.warning(
+                "message.priority.invalid",
+                extra={"message_id": message.message_id, "priority": priority},
+            )
+    return actor.priority or 0
+
+
+def _message_deadline(message: ReceivedMessageT) -> float | None:
+    headers = message.headers
+    if headers is not None and (deadline := headers.get(DEADLINE_HEADER)) is not None:
+        try:
+            return float(deadline)
+        except (TypeError, ValueError):
+            logger.warning(
+                "message.deadline.invalid",
+                extra={"message_id": message.message_id, "deadline": deadline},
+            )
+    return None
+
+
+def _remaining_timeout(actor: ActorData, messages: Sequence[ReceivedMessageT]) -> float | None:
+    """Actor's timeout, shortened to the time left until the earliest deadline of the messages."""
+    timeout = (
+        None
+        if actor.timeout is None or actor.timeout <= 0 or actor.timeout == float("inf")
+        else actor.timeout
+    )
+    deadlines = [
+        deadline for message in messages if (deadline := _message_deadline(message)) is not None
+    ]
+    if not deadlines:
+        return timeout
+    deadline = min(deadlines)
+    remaining = max(deadline - time.time(), 0.0)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class _BatchBuffer:
+    __slots__ = ("actor", "bulkheads", "flush_handle", "messages", "profile")
+
+    def __init__(self, actor: ActorData, bulkheads: tuple[_Bulkhead, ...] = ()) -> None:
+        self.actor = actor
+        self.bulkheads = bulkheads
+        self.messages: list[ReceivedMessageT] = []
+        self.flush_handle: asyncio.TimerHandle | None = None
+        self.profile: MessageProfile | None = None
+
+
+class _Bulkhead:
+    """Concurrency limit for a part of the workload (an actor or a channel), so that it can't
+    starve the rest of the worker. If the bulkhead owns a subscriber, it's paused while
+    the bulkhead is full."""
+
+    __slots__ = ("limit", "limiter", "name", "pause_lock", "subscriber", "was_paused")
+
+    def __init__(self, limit: int, name: str = "") -> None:
+        self.limit = limit
+        self.name = name
+        self.limiter = asyncio.Semaphore(limit)
+        self.subscriber: SubscriberT | None = None
+        self.was_paused = False
+        self.pause_lock = asyncio.Lock()
+
+    async def acquire(self, *, supports_pause: bool) -> bool:
+        """Returns `True`, if the subscriber was paused while waiting."""
+        paused = False
+        if self.limiter.locked() and supports_pause and self.subscriber is not None:
+            async with self.pause_lock:
+                if not self.was_paused:
+                    await self.subscriber.pause()
+                    self.was_paused = paused = True
+        await self.limiter.acquire()
+        return paused
+
+    async def resume(self) -> bool:
+        """Returns `True`, if the subscriber was resumed."""
+        if self.was_paused and self.subscriber is not None:
+            async with self.pause_lock:
+                if self.was_paused:  # double check inside of the lock
+                    await self.subscriber.resume()
+                    self.was_paused = False
+                    return True
+        return False
+
+
 class _Runner:
     """State-management class for consuming messages and ensuring tasks are getting processed.
     It ensures proper concurrency limit with semaphore. It can also track amount of processed tasks.
@@ -193,12 +465,24 @@ class _Runner:
     are single-use only."""
 
     __slots__ = (
+        "_actor_bulkheads",
+        "_actor_leaf",
+        "_batches",
         "_cancel_event_task",
+        "_channel_bulkheads",
+        "_eager_execution",
         "_health_check_server",
+        "_inflight_bytes",
+        "_inflight_bytes_released",
         "_limiter",
+        "_metrics",
+        "_priority_counter",
+        "_priority_handoffs",
+        "_priority_waiters",
         "_processed",
+        "_profiler",
         "_server_subscriber",
-        "_server_subscriber_concurrency_unpause_threshold",
+        "_server_subscriber_concurrency_unpause_percent",
         "_server_subscriber_pause_lock",
         "_server_subscriber_was_paused",
         "_stop_consume_event_task",
@@ -207,6 +491,7 @@ class _Runner:
         "_unrouted_seen_counts",
         "actor_context",
         "cancel_event",
+        "max_inflight_bytes",
         "max_tasks",
         "max_unrouted_retries",
         "server",
@@ -218,40 +503,77 @@ class _Runner:
         *,
         actor_context: ActorExecutionContext,
         max_tasks: int = float("inf"),  # type: ignore[assignment]
-        tasks_concurrency_limit: int = 1000,
+        tasks_concurrency_limit: int | Literal["adaptive"] = 1000,
         concurrency_unpause_percent: float = 0.1,  # 10 percent
         health_check_server: HealthCheckServer | None = None,
         max_unrouted_retries: int = 10,
+        channel_concurrency_limits: dict[str, int] | None = None,
+        eager_execution: bool = False,
+        metrics: Metrics | None = None,
+        profiler: Profiler | None = None,
+        max_inflight_bytes: int | None = None,
     ):
         self.server = actor_context.server
         self._server_subscriber: SubscriberT | None = None
-        self._server_subscriber_concurrency_unpause_threshold = max(
-            math.ceil(tasks_concurrency_limit * concurrency_unpause_percent),
-            1,
-        )
-        if self._server_subscriber_concurrency_unpause_threshold > tasks_concurrency_limit:
+
+        self._limiter: asyncio.Semaphore | _AdaptiveLimiter
+        if tasks_concurrency_limit == "adaptive":
+            self._limiter = _AdaptiveLimiter()
+            self._tasks_concurrency_limit = self._limiter.max_limit
+        else:
+            self._limiter = asyncio.Semaphore(tasks_concurrency_limit)
+            self._tasks_concurrency_limit = tasks_concurrency_limit
+
+        self._server_subscriber_concurrency_unpause_percent = concurrency_unpause_percent
+        if self._server_subscriber_concurrency_unpause_threshold > self._concurrency_limit:
             raise ValueError(
                 "Subscriber will never unpause, because unpause threshold is higher than concurrency limit.",
             )
         self._server_subscriber_was_paused = False
         self._server_subscriber_pause_lock = asyncio.Lock()
 
+        # messages waiting for a slot of the saturated limiter, highest priority first
+        self._priority_waiters: list[tuple[int, float, int, asyncio.Future[None]]] = []
+        self._priority_counter = itertools.count()
+        self._priority_handoffs = 0  # waiters, which were woken up, but didn't take the slot yet
+
+        if any(limit < 1 for limit in (channel_concurrency_limits or {}).values()):
+            raise ValueError("Channel concurrency limits must be at least 1.")
+        self._channel_bulkheads: dict[str, _Bulkhead] = {
+            channel: _Bulkhead(limit, channel)
+            for channel, limit in (channel_concurrency_limits or {}).items()
+        }
+        self._actor_bulkheads: dict[int, _Bulkhead] = {}
+
+        if max_inflight_bytes is not None and max_inflight_bytes < 1:
+            raise ValueError("Max in-flight bytes must be at least 1.")
+        self.max_inflight_bytes = max_inflight_bytes
+        self._inflight_bytes = 0
+        self._inflight_bytes_released = asyncio.Event()
+
         self._processed = 0
         self.max_unrouted_retries = max_unrouted_retries
         self._unrouted_seen_counts: dict[str, int] = {}
 
         self._tasks: set[asyncio.Task] = set()
+        self._eager_execution = eager_execution
+        self._batches: dict[int, _BatchBuffer] = {}
 
         self.stop_consume_event = asyncio.Event()
         self.cancel_event = asyncio.Event()
 
         self.max_tasks = max_tasks
-        self._tasks_concurrency_limit = tasks_concurrency_limit
-        self._limiter = asyncio.Semaphore(tasks_concurrency_limit)
 
         self._health_check_server = health_check_server
 
+        self._metrics = metrics
+        if metrics is not None:
+            self._register_gauges(metrics)
+
+        self._profiler = profiler
+
         self.actor_context = actor_context
+        self._actor_leaf = _actor_leaf(actor_context)
 
     @property
     def processed(self) -> int:
@@ -259,125 +581,438 @@ class _Runner:
 
     @property
     def max_tasks_hit(self) -> bool:
-        return (
-            self.max_tasks
-            - self._processed
-            - (self._tasks_concurrency_limit - self._limiter._value)
-            <= 0
+        return self.max_tasks - self._processed - self._in_flight <= 0
+
+    @property
+    def _concurrency_limit(self) -> int:
+        if isinstance(self._limiter, _AdaptiveLimiter):
+            return self._limiter.limit
+        return self._tasks_concurrency_limit
+
+    @property
+    def _in_flight(self) -> int:
+        if isinstance(self._limiter, _AdaptiveLimiter):
+            return self._limiter.in_flight
+        return self._tasks_concurrency_limit - self._limiter._value
+
+    @property
+    def _server_subscriber_concurrency_unpause_threshold(self) -> int:
+        return max(
+            math.ceil(
+                self._concurrency_limit * self._server_subscriber_concurrency_unpause_percent,
+            ),
+            1,
+        )
+
+    @property
+    def _subscribers(self) -> list[SubscriberT]:
+        subscribers = [
+            bulkhead.subscriber
+            for bulkhead in self._channel_bulkheads.values()
+            if bulkhead.subscriber is not None
+        ]
+        if self._server_subscriber is not None:
+            subscribers.insert(0, self._server_subscriber)
+        return subscribers
+
+    def _register_gauges(self, metrics: Metrics) -> None:
+        metrics.register_gauge(
+            "repid_tasks_in_flight",
+            "Messages, which are currently processed.",
+            lambda: self._in_flight,
+        )
+        metrics.register_gauge(
+            "repid_tasks_concurrency_limit",
+            "Current limit of concurrently processed messages.",
+            lambda: self._concurrency_limit,
         )
+        metrics.register_gauge(
+            "repid_tasks_limiter_saturation",
+            "Ratio of in-flight messages to the concurrency limit.",
+            lambda: self._in_flight / self._concurrency_limit,
+        )
+        if self.max_inflight_bytes is not None:
+            metrics.register_gauge(
+                "repid_inflight_bytes",
+                "Payload bytes of the messages, which are currently processed.",
+                lambda: self._inflight_bytes,
+            )
 
     @property
     def cancel_event_task(self) -> asyncio.Task:
         if not hasattr(self, "_cancel_event_task"):
-            self._cancel_event_task = asyncio.create_task(self.cancel_event.wait())
+            self._cancel_event_task = asyncio.create_task(self._cancel_tasks_on_event())
         return self._cancel_event_task
 
+    def _create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        if self._eager_execution:
+            return _create_eager_task(coro)
+        return asyncio.create_task(coro)
+
+    def _create_message_task(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        profile: MessageProfile | None,
+    ) -> asyncio.Task:
+        if profile is None:
+            return self._create_task(coro)
+        # the task copies current context, so the profile is visible only inside of it
+        token = _current_profile.set(profile)
+        try:
+            return self._create_task(coro)
+        finally:
+            _current_profile.reset(token)
+
+    async def _cancel_tasks_on_event(self) -> None:
+        # a single cancel scope for all of the tasks, instead of every task watching the event
+        await self.cancel_event.wait()
+        for task in self._tasks:
+            task.cancel()
+
     @property
     def stop_consume_event_task(self) -> asyncio.Task:
         if not hasattr(self, "_stop_consume_event_task"):
             self._stop_consume_event_task = asyncio.create_task(self.stop_consume_event.wait())
         return self._stop_consume_event_task
 
-    def _task_callback(self, task: asyncio.Task) -> None:
+    def _task_callback(
+        self,
+        task: asyncio.Task,
+        *,
+        actor: ActorData,
+        messages: Sequence[ReceivedMessageT],
+        started_at: float,
+        bulkheads: Sequence[_Bulkhead] = (),
+        profile: MessageProfile | None = None,
+    ) -> None:
         self._tasks.discard(task)
-        self._limiter.release()
-        self._processed += 1
+        if profile is not None and self._profiler is not None:
+            self._profiler._export(profile)
+        if isinstance(self._limiter, _AdaptiveLimiter) or self._metrics is not None:
+            latency = asyncio.get_running_loop().time() - started_at
+            if isinstance(self._limiter, _AdaptiveLimiter):
+                self._limiter.observe(latency)
+            if self._metrics is not None:
+                self._metrics.observe_processed(actor.name, messages, latency)
+        self._release(messages, bulkheads)
+        self._processed += len(messages)
         if self.max_tasks_hit:
             self.stop_consume_event.set()
 
-    async def _actor_run_callback(self) -> None:
+    def _release(
+        self,
+        messages: Sequence[ReceivedMessageT],
+        bulkheads: Sequence[_Bulkhead] = (),
+    ) -> None:
+        for _ in messages:
+            self._limiter.release()
+            for bulkhead in bulkheads:
+                bulkhead.limiter.release()
+        self._wake_waiters()
+        if self.max_inflight_bytes is not None:
+            self._inflight_bytes -= _payload_size(messages)
+            if self._inflight_bytes < self.max_inflight_bytes:
+                self._inflight_bytes_released.set()
+
+    async def _actor_run_callback(
+        self,
+        bulkheads: Sequence[_Bulkhead] = (),
+        payload_size: int = 0,
+    ) -> None:
+        if not self.stop_consume_event.is_set():
+            for bulkhead in bulkheads:
+                if await bulkhead.resume() and self._metrics is not None:
+                    self._metrics.subscriber_resumes[bulkhead.name] += 1
         if (
             self._server_subscriber_was_paused
             and self._server_subscriber is not None
-            and self._tasks_concurrency_limit - self._limiter._value
-            > self._server_subscriber_concurrency_unpause_threshold
+            and (
+                self._in_flight > self._server_subscriber_concurrency_unpause_threshold
+                or not self._limiter.locked()
+            )
+            and (
+                # the payload of the finished message is released right after this callback
+                self.max_inflight_bytes is None
+                or self._inflight_bytes - payload_size < self.max_inflight_bytes
+            )
         ):
             async with self._server_subscriber_pause_lock:
                 if self._server_subscriber_was_paused:  # double check inside of the lock
                     await self._server_subscriber.resume()
                     self._server_subscriber_was_paused = False
+                    if self._metrics is not None:
+                        self._metrics.subscriber_resumes["*"] += 1
 
-    async def _message_handler(self, actors: list[ActorData], message: ReceivedMessageT) -> None:
-        actor = next(filter(lambda actor: actor.routing_strategy(message), actors), None)
-        if actor is None:
-            logger.warning("actor.route.not_found", extra={"channel": message.channel})
-            msg_id = message.message_id
-            if msg_id is not None:
-                count = self._unrouted_seen_counts.get(msg_id, 0) + 1
-                if count >= self.max_unrouted_retries:
-                    del self._unrouted_seen_counts[msg_id]
-                    logger.error(
-                        "actor.route.poison_message",
-                        extra={"channel": message.channel, "message_id": msg_id},
-                    )
-                    await message.nack()
-                else:
-                    self._unrouted_seen_counts[msg_id] = count
-                    await message.reject()
+    async def _unrouted_message_handler(self, message: ReceivedMessageT) -> None:
+        logger.warning("actor.route.not_found", extra={"channel": message.channel})
+        if self._metrics is not None:
+            self._metrics.unrouted_messages[message.channel] += 1
+        msg_id = message.message_id
+        if msg_id is not None:
+            count = self._unrouted_seen_counts.get(msg_id, 0) + 1
+            if count >= self.max_unrouted_retries:
+                del self._unrouted_seen_counts[msg_id]
+                logger.error(
+                    "actor.route.poison_message",
+                    extra={"channel": message.channel, "message_id": msg_id},
+                )
+                if self._metrics is not None:
+                    self._metrics.poison_messages[message.channel] += 1
+                await message.nack()
             else:
+                self._unrouted_seen_counts[msg_id] = count
                 await message.reject()
+        else:
+            await message.reject()
+
+    async def _expired_message_handler(
+        self,
+        actor: ActorData,
+        message: ReceivedMessageT,
+        deadline: float,
+    ) -> None:
+        logger.warning(
+            "message.expired",
+            extra={
+                "actor_name": actor.name,
+                "message_id": message.message_id,
+                "deadline": deadline,
+            },
+        )
+        if self._metrics is not None:
+            self._metrics.expired_messages[actor.name] += 1
+        await message.nack()
+
+    async def _message_handler(self, actors: _ActorIndex, message: ReceivedMessageT) -> None:
+        profile = (
+            self._profiler._sample(message.channel, message.message_id)
+            if self._profiler is not None
+            else None
+        )
+        actor = actors.match(message)
+        if actor is None:
+            await self._unrouted_message_handler(message)
+            return
+        if profile is not None:
+            profile.actor_name = actor.name
+            profile.lap("route")
+
+        deadline = _message_deadline(message)
+        if deadline is not None and deadline <= time.time():
+            await self._expired_message_handler(actor, message, deadline)
+            return
+
+        if self._metrics is not None:
+            self._metrics.messages_received[actor.name] += 1
+
+        bulkheads = await self._acquire(actor, message, deadline)
+        if profile is not None:
+            profile.lap("admission")
+
+        if deadline is not None and deadline <= time.time():
+            # expired while waiting for a free slot
+            await self._expired_message_handler(actor, message, deadline)
+            await self._actor_run_callback(
+                bulkheads,
+                _payload_size((message,)) if self.max_inflight_bytes is not None else 0,
+            )
+            self._release((message,), bulkheads)
             return
 
+        if actor.batch_size is not None:
+            self._add_to_batch(actor, message, bulkheads, profile)
+            return
+
+        t = self._create_message_task(
+            _actor_run_with_cancel_event_and_callback(
+                _actor_run(actor, message, self._actor_leaf),
+                (message,),
+                self.cancel_event,
+                partial(
+                    self._actor_run_callback,
+                    bulkheads,
+                    _payload_size((message,)) if self.max_inflight_bytes is not None else 0,
+                ),
+            ),
+            profile,
+        )
+        self._tasks.add(t)
+        t.add_done_callback(
+            partial(
+                self._task_callback,
+                actor=actor,
+                messages=(message,),
+                started_at=asyncio.get_running_loop().time(),
+                bulkheads=bulkheads,
+                profile=profile,
+            ),
+        )
+
+    async def _acquire(
+        self,
+        actor: ActorData,
+        message: ReceivedMessageT,
+        deadline: float | None = None,
+    ) -> tuple[_Bulkhead, ...]:
+        """Waits for a free slot in the bulkheads of the message and in the global limiter.
+        Returns the bulkheads, which have to be released once the message is processed."""
+        if self.max_inflight_bytes is not None:
+            await self._acquire_bytes(message)
+
+        bulkheads = self._bulkheads_for(actor, message.channel)
+        for bulkhead in bulkheads:
+            paused = await bulkhead.acquire(
+                supports_pause=self.server.capabilities["supports_lightweight_pause"],
+            )
+            if paused and self._metrics is not None:
+                self._metrics.subscriber_pauses[bulkhead.name] += 1
+
+        if self._limiter.locked() or self._priority_waiters or self._priority_handoffs:
+            if self._metrics is not None:
+                self._metrics.limiter_waits += 1
+            await self._pause_server_subscriber()
+            await self._wait_for_slot(_message_priority(actor, message), deadline)
+        await self._limiter.acquire()
+        return bulkheads
+
+    async def _wait_for_slot(self, priority: int, deadline: float | None = None) -> None:
+        """Waits in the queue for a free slot of the limiter. Once it's saturated, messages
+        are admitted by their priority (higher first), then by their deadline (earliest first)
+        and in arrival order otherwise."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._priority_waiters,
+            (
+                -priority,
+                math.inf if deadline is None else deadline,
+                next(self._priority_counter),
+                future,
+            ),
+        )
+        self._wake_waiters()  # the limit of the adaptive limiter could have grown in between
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # woken up, but cancelled before taking the slot - pass it on
+                self._priority_handoffs -= 1
+                self._wake_waiters()
+            raise
+        self._priority_handoffs -= 1
+
+    def _wake_waiters(self) -> None:
+        while (
+            self._priority_waiters
+            and self._concurrency_limit - self._in_flight > self._priority_handoffs
+        ):
+            *_, future = heapq.heappop(self._priority_waiters)
+            if not future.done():
+                future.set_result(None)
+                self._priority_handoffs += 1
+
+    async def _acquire_bytes(self, message: ReceivedMessageT) -> None:
+        """Waits until payloads of the messages in flight fit into `max_inflight_bytes`.
+        A message is admitted while the limit isn't reached yet, so a single message, which is
+        bigger than the limit, can still be processed."""
+        while (
+            self.max_inflight_bytes is not None and self._inflight_bytes >= self.max_inflight_bytes
+        ):
+            self._inflight_bytes_released.clear()
+            await self._pause_server_subscriber()
+            await self._inflight_bytes_released.wait()
+        self._inflight_bytes += _payload_size((message,))
+
+    async def _pause_server_subscriber(self) -> None:
         if (
-            self._limiter.locked()
-            and self.server.capabilities["supports_lightweight_pause"]
+            self.server.capabilities["supports_lightweight_pause"]
             and self._server_subscriber is not None
         ):
             async with self._server_subscriber_pause_lock:
                 if not self._server_subscriber_was_paused:
                     await self._server_subscriber.pause()
                     self._server_subscriber_was_paused = True
-            await self._limiter.acquire()
-        else:
-            await self._limiter.acquire()
+                    if self._metrics is not None:
+                        self._metrics.subscriber_pauses["*"] += 1
+
+    def _bulkheads_for(self, actor: ActorData, channel: str) -> tuple[_Bulkhead, ...]:
+        channel_bulkhead = self._channel_bulkheads.get(channel)
+        if actor.max_concurrency is None:
+            return () if channel_bulkhead is None else (channel_bulkhead,)
+        actor_bulkhead = self._actor_bulkheads.get(id(actor))
+        if actor_bulkhead is None:
+            actor_bulkhead = self._actor_bulkheads[id(actor)] = _Bulkhead(
+                actor.max_concurrency,
+                actor.name,
+            )
+        if channel_bulkhead is None:
+            return (actor_bulkhead,)
+        return (channel_bulkhead, actor_bulkhead)
 
-        t = asyncio.create_task(
+    def _add_to_batch(
+        self,
+        actor: ActorData,
+        message: ReceivedMessageT,
+        bulkheads: tuple[_Bulkhead, ...] = (),
+        profile: MessageProfile | None = None,
+    ) -> None:
+        batch = self._batches.get(id(actor))
+        if batch is None:
+            batch = self._batches[id(actor)] = _BatchBuffer(actor, bulkheads)
+        batch.messages.append(message)
+        if batch.profile is None:
+            batch.profile = profile
+        if actor.batch_size is not None and len(batch.messages) >= actor.batch_size:
+            self._flush_batch(batch)
+        elif batch.flush_handle is None:
+            batch.flush_handle = asyncio.get_running_loop().call_later(
+                actor.batch_linger,
+                self._flush_batch,
+                batch,
+            )
+
+    def _flush_batch(self, batch: _BatchBuffer) -> None:
+        if batch.flush_handle is not None:
+            batch.flush_handle.cancel()
+            batch.flush_handle = None
+        if not batch.messages:
+            return
+        messages, batch.messages = batch.messages, []
+        profile, batch.profile = batch.profile, None
+        if profile is not None:
+            profile.batch_size = len(messages)
+
+        t = self._create_message_task(
             _actor_run_with_cancel_event_and_callback(
-                actor,
-                message,
-                self.actor_context,
+                _actor_run_batch(batch.actor, messages, self.actor_context),
+                messages,
                 self.cancel_event,
-                self.cancel_event_task,
-                self._actor_run_callback,
+                partial(
+                    self._actor_run_callback,
+                    batch.bulkheads,
+                    _payload_size(messages) if self.max_inflight_bytes is not None else 0,
+                ),
             ),
+            profile,
         )
         self._tasks.add(t)
-        t.add_done_callback(self._task_callback)
+        t.add_done_callback(
+            partial(
+                self._task_callback,
+                actor=batch.actor,
+                messages=messages,
+                started_at=asyncio.get_running_loop().time(),
+                bulkheads=batch.bulkheads,
+                profile=profile,
+            ),
+        )
 
-    async def run(
+    async def _finish_tasks(
         self,
-        channels_to_actors: dict[str, list[ActorData]],
         graceful_termination_timeout: float,
-        cancellation_timeout: float = 1.0,
+        cancellation_timeout: float,
     ) -> None:
-        self._server_subscriber = await self.server.subscribe(
-            channels_to_callbacks={
-                channel: partial(self._message_handler, actors)
-                for channel, actors in channels_to_actors.items()
-            },
-            concurrency_limit=self._tasks_concurrency_limit,
-        )
-        subscriber_task = self._server_subscriber.task
-        await asyncio.wait(
-            {self.stop_consume_event_task, subscriber_task},
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-        if (
-            subscriber_task.done()
-            and not subscriber_task.cancelled()
-            and (exc := subscriber_task.exception()) is not None
-        ):
-            logger.critical("runner.consumer.error", exc_info=exc)
-            if self._health_check_server is not None:
-                self._health_check_server.health_status = HealthCheckStatus.UNHEALTHY
-
-        logger.debug("runner.shutdown.start")
-        try:
-            await self._server_subscriber.pause()
-        except Exception as exc:
-            logger.exception("runner.subscriber.pause.error", exc_info=exc)
-
-        self.stop_consume_event.set()
+        for batch in self._batches.values():
+            self._flush_batch(batch)
         if self._tasks:
             _, pending = await asyncio.wait(
                 self._tasks,
@@ -399,9 +1034,77 @@ class _Runner:
             if self._tasks:
                 logger.error("runner.shutdown.tasks_unfinished")
 
-        try:
-            await self._server_subscriber.close()
-        except Exception as exc:
-            logger.exception("runner.subscriber.close.error", exc_info=exc)
+    async def _subscribe(self, channels_to_actors: dict[str, list[ActorData]]) -> None:
+        channels_to_callbacks: dict[
+            str,
+            Callable[[ReceivedMessageT], Coroutine[None, None, None]],
+        ] = {
+            channel: partial(self._message_handler, _ActorIndex(actors))
+            for channel, actors in channels_to_actors.items()
+        }
+        shared_channels_to_callbacks = {
+            channel: callback
+            for channel, callback in channels_to_callbacks.items()
+            if channel not in self._channel_bulkheads
+        }
+        if shared_channels_to_callbacks:
+            self._server_subscriber = await self.server.subscribe(
+                channels_to_callbacks=shared_channels_to_callbacks,
+                concurrency_limit=self._tasks_concurrency_limit,
+            )
+        # channels with a quota get a subscriber of their own, so they can be paused separately
+        for channel, bulkhead in self._channel_bulkheads.items():
+            if channel in channels_to_callbacks:
+                bulkhead.subscriber = await self.server.subscribe(
+                    channels_to_callbacks={channel: channels_to_callbacks[channel]},
+                    concurrency_limit=bulkhead.limit,
+                )
+
+    async def run(
+        self,
+        channels_to_actors: dict[str, list[ActorData]],
+        graceful_termination_timeout: float,
+        cancellation_timeout: float = 1.0,
+    ) -> None:
+        if isinstance(self._limiter, _AdaptiveLimiter):
+            self._limiter.start()
+        # running tasks are cancelled all at once by this task, when cancel_event is set
+        cancel_event_task = self.cancel_event_task
+        await self._subscribe(channels_to_actors)
+        subscribers = self._subscribers
+        subscriber_tasks = {subscriber.task for subscriber in subscribers}
+        await asyncio.wait(
+            {self.stop_consume_event_task, *subscriber_tasks},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for subscriber_task in subscriber_tasks:
+            if (
+                subscriber_task.done()
+                and not subscriber_task.cancelled()
+                and (exc := subscriber_task.exception()) is not None
+            ):
+                logger.critical("runner.consumer.error", exc_info=exc)
+                if self._health_check_server is not None:
+                    self._health_check_server.health_status = HealthCheckStatus.UNHEALTHY
+
+        logger.debug("runner.shutdown.start")
+        for subscriber in subscribers:
+            try:
+                await subscriber.pause()
+            except Exception as exc:
+                logger.exception("runner.subscriber.pause.error", exc_info=exc)
+
+        self.stop_consume_event.set()
+        await self._finish_tasks(graceful_termination_timeout, cancellation_timeout)
+        await cancel_event_task
+
+        for subscriber in subscribers:
+            try:
+                await subscriber.close()
+            except Exception as exc:
+                logger.exception("runner.subscriber.close.error", exc_info=exc)
+
+        if isinstance(self._limiter, _AdaptiveLimiter):
+            await self._limiter.stop()
 
         logger.debug("runner.shutdown.complete")
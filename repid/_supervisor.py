@@ -0,0 +1,484 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from repid.asyncapi_server import AsyncAPIServer
+from repid.health_check_server import HealthCheckServer, HealthCheckStatus
+from repid.metrics import Metrics, MetricsServer
+
+logger = logging.getLogger("repid")
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from repid._worker import _Worker
+    from repid.asyncapi import AsyncAPI3Schema
+    from repid.asyncapi_server import AsyncAPIServerSettings
+    from repid.connections.abc import ServerT
+    from repid.health_check_server import HealthCheckServerSettings
+    from repid.metrics import MetricsServerSettings
+
+
+class _ChildHealthReporter(HealthCheckServer):
+    """Health check server replacement used inside of worker processes.
+    Instead of serving HTTP, it forwards every status change to the supervisor."""
+
+    def __init__(self, conn: Connection) -> None:
+        super().__init__()
+        self._conn = conn
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @property
+    def health_status(self) -> HealthCheckStatus:
+        return self._health_status
+
+    @health_status.setter
+    def health_status(self, new_health_status: HealthCheckStatus) -> None:
+        self._health_status = new_health_status
+        self._conn.send(("health", int(new_health_status)))
+
+
+def _stop_on_supervisor_exit(
+    loop: asyncio.AbstractEventLoop,
+    lifeline: int,
+    stop_signal: signal.Signals,
+) -> None:  # pragma: no cover
+    # nothing is ever written to the lifeline, so it only becomes readable on EOF,
+    # i.e. once the supervisor has exited, no matter how
+    loop.remove_reader(lifeline)
+    logger.error("worker.supervisor.exited")
+    signal.raise_signal(stop_signal)
+
+
+class _ChildMetricsReporter(MetricsServer):
+    """Metrics server replacement used inside of worker processes.
+    Instead of serving HTTP, it periodically sends snapshots of the metrics to the supervisor."""
+
+    def __init__(self, metrics: Metrics, conn: Connection, interval: float) -> None:
+        super().__init__(metrics)
+        self._conn = conn
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._report_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._report()
+
+    async def _report_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            self._report()
+
+    def _report(self) -> None:
+        self._conn.send(("metrics", self.metrics._snapshot()))
+
+
+class _CombinedMetrics(Metrics):
+    """Metrics of all the worker processes, as reported to the supervisor.
+
+    Own counters hold the totals of the processes which have exited, so that the combined
+    counters don't go down when a process is restarted. Gauges are labelled by worker slot."""
+
+    __slots__ = ("_children",)
+
+    def __init__(self, children: dict[int, _ChildProcess]) -> None:
+        super().__init__()
+        self._children = children
+
+    def _render_lines(self) -> Iterator[str]:
+        combined = Metrics(self.latency_buckets)
+        combined._merge(self)
+        gauges: dict[str, tuple[str, list[tuple[int, float]]]] = {}
+        for slot, child in sorted(self._children.items()):
+            combined._merge(child.metrics)
+            for name, (description, value) in child.gauges.items():
+                gauges.setdefault(name, (description, []))[1].append((slot, value))
+        yield from combined._render_lines()
+        for name, (description, values) in gauges.items():
+            yield f"# HELP {name} {description}\n"
+            yield f"# TYPE {name} gauge\n"
+            for slot, value in values:
+                yield f'{name}{{worker="{slot}"}} {value}\n'
+
+
+async def _run_child_worker(  # noqa: PLR0917
+    server: ServerT,
+    worker_factory: Callable[[], _Worker],
+    conn: Connection,
+    lifeline: int,
+    stop_signal: signal.Signals,
+    metrics_interval: float | None,
+) -> int:  # pragma: no cover
+    loop = asyncio.get_running_loop()
+    loop.add_reader(lifeline, _stop_on_supervisor_exit, loop, lifeline, stop_signal)
+    async with server.connection():
+        worker = worker_factory()
+        worker.health_check_server = _ChildHealthReporter(conn)
+        if metrics_interval is not None:
+            worker.metrics = Metrics()
+            worker.metrics_server = _ChildMetricsReporter(worker.metrics, conn, metrics_interval)
+        runner = await worker.run()
+    return runner.processed
+
+
+def _child_main(  # noqa: PLR0917
+    server: ServerT,
+    worker_factory: Callable[[], _Worker],
+    conn: Connection,
+    lifeline: tuple[int, int],
+    register_signals: frozenset[signal.Signals],
+    metrics_interval: float | None,
+) -> None:  # pragma: no cover
+    # Signals are forwarded by the supervisor, so leave the terminal's process group
+    # to avoid receiving e.g. Ctrl+C twice.
+    os.setpgrp()
+    # Nothing else would stop the child if the supervisor is killed, so watch the supervisor's
+    # end of the lifeline pipe instead. The inherited copy of that end must be closed for it.
+    lifeline_reader, lifeline_writer = lifeline
+    os.close(lifeline_writer)
+    # Forked process inherits supervisor's signal handlers and the event loop wakeup fd,
+    # which would deliver child's signals to the supervisor's loop.
+    signal.set_wakeup_fd(-1)
+    for sig in register_signals:
+        signal.signal(sig, signal.default_int_handler if sig == signal.SIGINT else signal.SIG_DFL)
+    # the supervisor forks with the signals blocked, deliver the ones which arrived in between
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, register_signals)
+
+    # stop gracefully if the worker handles SIGTERM (or any other signal), terminate otherwise
+    stop_signal = (
+        signal.SIGTERM
+        if signal.SIGTERM in register_signals or not register_signals
+        else next(iter(register_signals))
+    )
+    processed = asyncio.run(
+        _run_child_worker(
+            server,
+            worker_factory,
+            conn,
+            lifeline_reader,
+            stop_signal,
+            metrics_interval,
+        ),
+    )
+    conn.send(("exit", processed))
+    conn.close()
+
+
+@dataclass(slots=True, kw_only=True)
+class _ChildProcess:
+    process: BaseProcess
+    conn: Connection
+    started_at: float = field(default_factory=time.monotonic)
+    health_status: HealthCheckStatus = field(default=HealthCheckStatus.OK)
+    metrics: Metrics = field(default_factory=Metrics)
+    gauges: dict[str, tuple[str, float]] = field(default_factory=dict)
+
+
+class _WorkerSupervisor:
+    """Preforks worker processes and keeps them running.
+
+    The application is imported and the router is materialized in the supervisor, after which
+    `gc.freeze()` is called and children are forked, so they share all of that memory
+    copy-on-write. The initial children are forked before the supervisor starts its event loop.
+    Every child runs its own event loop and opens its own broker connection.
+    Children stop once the supervisor exits, even if it was killed.
+    Crashed children are restarted with an exponential backoff, children which exited
+    successfully (e.g. because `messages_limit` was hit) are not. Health status is reported
+    to the supervisor and is served as a combined status of all the children, same goes for
+    metrics."""
+
+    def __init__(  # noqa: PLR0917
+        self,
+        processes: int,
+        server: ServerT,
+        worker_factory: Callable[[], _Worker],
+        graceful_shutdown_time: float = 25.0,
+        register_signals: Iterable[signal.Signals] | None = None,
+        health_check_server: HealthCheckServerSettings | None = None,
+        asyncapi_server: AsyncAPIServerSettings | None = None,
+        asyncapi_schema: AsyncAPI3Schema | None = None,
+        metrics_server: MetricsServerSettings | None = None,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("Amount of worker processes must be at least 1.")
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Worker processes require 'fork' support from the platform.")
+
+        self.processes = processes
+        self.server = server
+        self.worker_factory = worker_factory
+
+        self.graceful_shutdown_time = graceful_shutdown_time
+        self.graceful_children_finish_time: float = 5.0
+        self.monitor_interval: float = 0.1
+        self.restart_backoff: float = 0.1
+        self.max_restart_backoff: float = 30.0
+        self.metrics_report_interval: float = 1.0
+
+        self.register_signals: frozenset[signal.Signals] = (
+            frozenset(
+                [signal.SIGINT, signal.SIGTERM] if register_signals is None else register_signals,
+            )
+            if sys.platform != "emscripten"
+            else frozenset()
+        )
+
+        self.health_check_server: HealthCheckServer | None = None
+        if health_check_server is not None:
+            self.health_check_server = HealthCheckServer(health_check_server)
+
+        self.asyncapi_server: AsyncAPIServer | None = None
+        if asyncapi_server is not None:
+            if asyncapi_schema is None:  # pragma: no cover
+                raise ValueError("AsyncAPI schema is required if AsyncAPI server is enabled.")
+            self.asyncapi_server = AsyncAPIServer(asyncapi_schema, asyncapi_server)
+
+        self._mp_context = multiprocessing.get_context("fork")
+        self._children: dict[int, _ChildProcess] = {}
+
+        self.metrics: _CombinedMetrics | None = None
+        self.metrics_server: MetricsServer | None = None
+        if metrics_server is not None:
+            self.metrics = _CombinedMetrics(self._children)
+            self.metrics_server = MetricsServer(self.metrics, metrics_server)
+        self._crashes: dict[int, int] = {}
+        self._pending_restarts: dict[int, float] = {}
+        self._signal_mask: set[int | signal.Signals] | None = None
+        self._lifeline: tuple[int, int] | None = None
+        self._processed = 0
+        self._restarts = 0
+        self._stop_deadline: float | None = None
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    @property
+    def restarts(self) -> int:
+        return self._restarts
+
+    @property
+    def health_status(self) -> HealthCheckStatus:
+        if self._pending_restarts:
+            return HealthCheckStatus.UNHEALTHY
+        if any(c.health_status != HealthCheckStatus.OK for c in self._children.values()):
+            return HealthCheckStatus.UNHEALTHY
+        return HealthCheckStatus.OK
+
+    def run(self) -> int:
+        logger.info("supervisor.run.start", extra={"processes": self.processes})
+        # Fork before the event loop exists, so that children are copies of a single-threaded
+        # process. Signals stay blocked until the supervisor's handlers are registered, otherwise
+        # a signal which arrives in between would terminate it and orphan the children.
+        self._signal_mask = signal.pthread_sigmask(signal.SIG_BLOCK, self.register_signals)
+        self._lifeline = os.pipe()
+        try:
+            for slot in range(self.processes):
+                self._children[slot] = self._spawn(slot)
+            asyncio.run(self._supervise())
+        finally:
+            self._restore_signal_mask()
+            # children are left running only if supervising has failed, e.g. a port is taken
+            self._terminate_children()
+            for fd in self._lifeline:
+                os.close(fd)
+            self._lifeline = None
+        logger.info("supervisor.run.exit", extra={"processed": self._processed})
+        return self._processed
+
+    def _spawn(self, slot: int) -> _ChildProcess:
+        # move everything allocated so far out of GC tracking, so that collections in children
+        # don't touch (and therefore don't copy) pages inherited from the supervisor
+        gc.freeze()
+        reader, writer = self._mp_context.Pipe(duplex=False)
+        process = self._mp_context.Process(
+            target=_child_main,
+            args=(
+                self.server,
+                self.worker_factory,
+                writer,
+                self._lifeline,
+                self.register_signals,
+                self.metrics_report_interval if self.metrics is not None else None,
+            ),
+            name=f"repid-worker-{slot}",
+        )
+        # signals are blocked around fork, so that the child can't receive one before it has
+        # reset the inherited handlers
+        previous_mask = signal.pthread_sigmask(signal.SIG_BLOCK, self.register_signals)
+        try:
+            process.start()
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
+        writer.close()
+        logger.info("supervisor.child.start", extra={"slot": slot, "pid": process.pid})
+        return _ChildProcess(process=process, conn=reader)
+
+    def _collect_reports(self, child: _ChildProcess) -> None:
+        try:
+            while child.conn.poll():
+                kind, value = child.conn.recv()
+                if kind == "health":
+                    child.health_status = HealthCheckStatus(value)
+                elif kind == "metrics":
+                    child.metrics, child.gauges = value
+                elif kind == "exit":
+                    self._processed += value
+        except (EOFError, OSError):
+            pass
+
+    def _restore_signal_mask(self) -> None:
+        if self._signal_mask is not None:
+            signal.pthread_sigmask(signal.SIG_SETMASK, self._signal_mask)
+            self._signal_mask = None
+
+    def _restart_delay(self, slot: int, child: _ChildProcess) -> float:
+        # a child which kept running for longer than the maximum backoff is considered recovered
+        if time.monotonic() - child.started_at > self.max_restart_backoff:
+            self._crashes[slot] = 0
+        crashes = self._crashes[slot] = self._crashes.get(slot, 0) + 1
+        return min(self.restart_backoff * 2.0 ** (crashes - 1), self.max_restart_backoff)
+
+    def _restart_pending(self) -> None:
+        now = time.monotonic()
+        for slot, restart_at in list(self._pending_restarts.items()):
+            if restart_at <= now:
+                del self._pending_restarts[slot]
+                self._restarts += 1
+                self._children[slot] = self._spawn(slot)
+
+    def _check_children(self) -> None:
+        for slot, child in list(self._children.items()):
+            self._collect_reports(child)
+            if child.process.is_alive():
+                continue
+            child.process.join()
+            self._collect_reports(child)
+            child.conn.close()
+            exitcode = child.process.exitcode
+            del self._children[slot]
+            if self.metrics is not None:
+                self.metrics._merge(child.metrics)
+            if exitcode != 0 and self._stop_deadline is None:
+                delay = self._restart_delay(slot, child)
+                logger.error(
+                    "supervisor.child.crashed",
+                    extra={
+                        "slot": slot,
+                        "pid": child.process.pid,
+                        "exitcode": exitcode,
+                        "restart_in": delay,
+                    },
+                )
+                self._pending_restarts[slot] = time.monotonic() + delay
+            else:
+                logger.info(
+                    "supervisor.child.exit",
+                    extra={"slot": slot, "pid": child.process.pid, "exitcode": exitcode},
+                )
+        if self._stop_deadline is None:
+            self._restart_pending()
+
+    def _stop_children(self, sig: signal.Signals) -> None:
+        loop = asyncio.get_running_loop()
+        self._stop_deadline = (
+            loop.time() + self.graceful_shutdown_time + self.graceful_children_finish_time
+        )
+        self._pending_restarts.clear()
+        for child in self._children.values():
+            if child.process.is_alive() and child.process.pid is not None:
+                os.kill(child.process.pid, sig)
+
+    def _kill_children(self) -> None:
+        logger.error("supervisor.shutdown.children_timeout")
+        for child in self._children.values():
+            if child.process.is_alive():
+                child.process.kill()
+
+    def _terminate_children(self) -> None:
+        alive = [child for child in self._children.values() if child.process.is_alive()]
+        for child in alive:
+            child.process.terminate()
+        deadline = time.monotonic() + self.graceful_shutdown_time
+        for child in alive:
+            child.process.join(max(deadline - time.monotonic(), 0.0))
+            if child.process.is_alive():
+                logger.error("supervisor.child.kill", extra={"pid": child.process.pid})
+                child.process.kill()
+                child.process.join()
+        for child in self._children.values():
+            child.conn.close()
+        self._children.clear()
+        self._pending_restarts.clear()
+
+    async def _supervise(self) -> None:
+        if self.health_check_server is not None:
+            await self.health_check_server.start()
+
+        if self.asyncapi_server is not None:
+            await self.asyncapi_server.start()
+
+        if self.metrics_server is not None:
+            await self.metrics_server.start()
+
+        loop = asyncio.get_running_loop()
+        self._register_signals(loop)
+        # signals which arrived while the children were forked are delivered to the handlers now
+        self._restore_signal_mask()
+
+        while self._children or self._pending_restarts:
+            await asyncio.sleep(self.monitor_interval)
+            self._check_children()
+            if self._stop_deadline is not None and loop.time() > self._stop_deadline:
+                self._kill_children()
+            if self.health_check_server is not None:
+                self.health_check_server.health_status = self.health_status
+
+        if self.health_check_server is not None:
+            await self.health_check_server.stop()
+
+        if self.asyncapi_server is not None:
+            await self.asyncapi_server.stop()
+
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+
+        self._unregister_signals(loop)
+
+    def _register_signals(self, loop: asyncio.AbstractEventLoop) -> None:
+        def signal_handler(sig: signal.Signals) -> None:
+            logger.info("supervisor.signal.stop", extra={"signal": sig})
+            self._stop_children(sig)
+            self._unregister_signals(loop)
+
+        for sig in self.register_signals:
+            loop.add_signal_handler(sig, signal_handler, sig)
+
+    def _unregister_signals(self, loop: asyncio.AbstractEventLoop) -> None:
+        for sig in self.register_signals:
+            loop.remove_signal_handler(sig)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import sys
+from collections.abc import Callable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from repid.connections.abc import ReceivedMessageT
+
+logger = logging.getLogger("repid")
+
+# same as in asyncio: the heap is rebuilt once this many timers in it are cancelled...
+_MIN_CANCELLED_TIMERS = 100
+# ...and they make up at least this fraction of the heap
+_MIN_CANCELLED_TIMERS_FRACTION = 0.5
+
+
+class _Timer:
+    __slots__ = ("args", "callback", "cancelled", "timers", "when")
+
+    def __init__(
+        self,
+        timers: _Timers,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        self.timers = timers
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        if not self.cancelled:
+            self.cancelled = True
+            self.timers._timer_cancelled()
+
+
+class _Timeout:
+    """Async context manager, which cancels the current task once the deadline is reached
+    and raises `asyncio.TimeoutError` instead of `asyncio.CancelledError`."""
+
+    __slots__ = ("_expired", "_task", "_timer", "delay", "timers")
+
+    def __init__(self, timers: _Timers, delay: float) -> None:
+        self.timers = timers
+        self.delay = delay
+        self._expired = False
+        self._task: asyncio.Task | None = None
+        self._timer: _Timer | None = None
+
+    async def __aenter__(self) -> None:
+        self._task = asyncio.current_task()
+        if self._task is None:  # pragma: no cover
+            raise RuntimeError("Timeout should be used inside a task.")
+        self._timer = self.timers.call_later(self.delay, self._expire)
+
+    @property
+    def _cancel_message(self) -> str:
+        return f"repid.timeout.{id(self)}"
+
+    def _expire(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._expired = True
+            self._task.cancel(msg=self._cancel_message)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if not self._expired or self._task is None:
+            return
+        if sys.version_info >= (3, 11):
+            if self._task.uncancel() > 0:  # pragma: no cover
+                return  # the task was also cancelled by someone else
+        elif exc is not None and exc.args != (self._cancel_message,):  # pragma: no cover
+            # there is no `Task.uncancel` before 3.11, but a later cancel replaces the message
+            return
+        if exc_type is asyncio.CancelledError:
+            raise asyncio.TimeoutError from exc
+
+
+class _KeepAlive:
+    __slots__ = ("interval", "message", "stopped", "timer")
+
+    def __init__(self, message: ReceivedMessageT, interval: float) -> None:
+        self.message = message
+        self.interval = interval
+        self.stopped = False
+        self.timer: _Timer | None = None
+
+    def stop(self) -> None:
+        self.stopped = True
+        if self.timer is not None:
+            self.timer.cancel()
+
+
+class _Timers:
+    """Deadline heap, which drives actor timeouts and message keep-alives of an event loop
+    with a single loop timer, instead of a timer handle (or a task) per message.
+
+    Deadlines are rounded up to `resolution`, so that everything, which is due around the same
+    time, is processed at once. Keep-alives, which are due at once, are sent from a single task."""
+
+    __slots__ = (
+        "_cancelled",
+        "_counter",
+        "_due_keep_alives",
+        "_handle",
+        "_handle_when",
+        "_heap",
+        "_keep_alive_tasks",
+        "loop",
+        "resolution",
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, resolution: float = 0.01) -> None:
+        self.loop = loop
+        self.resolution = resolution
+        self._heap: list[tuple[float, int, _Timer]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_when = math.inf
+        self._due_keep_alives: list[_KeepAlive] = []
+        self._keep_alive_tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def call_at(self, when: float, callback: Callable[..., Any], *args: Any) -> _Timer:
+        when = math.ceil(when / self.resolution) * self.resolution
+        timer = _Timer(self, when, callback, args)
+        heapq.heappush(self._heap, (when, next(self._counter), timer))
+        if when < self._handle_when:
+            self._schedule()
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> _Timer:
+        return self.call_at(self.loop.time() + delay, callback, *args)
+
+    def timeout(self, delay: float) -> _Timeout:
+        return _Timeout(self, delay)
+
+    def keep_alive(self, message: ReceivedMessageT, interval: float) -> _KeepAlive:
+        """Periodically call `message.keep_alive()`, until the message is acted on
+        or the returned handle is stopped."""
+        keep_alive = _KeepAlive(message, interval)
+        keep_alive.timer = self.call_later(interval, self._keep_alive_due, keep_alive)
+        return keep_alive
+
+    def _timer_cancelled(self) -> None:
+        self._cancelled += 1
+        if (
+            self._cancelled > _MIN_CANCELLED_TIMERS
+            and self._cancelled > len(self._heap) * _MIN_CANCELLED_TIMERS_FRACTION
+        ):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _schedule(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._handle_when = math.inf
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+        if self._heap:
+            self._handle_when = self._heap[0][0]
+            self._handle = self.loop.call_at(self._handle_when, self._run, self._handle_when)
+
+    def _run(self, until: float) -> None:
+        self._handle = None
+        self._handle_when = -math.inf  # timers added by callbacks are scheduled at the end
+        while self._heap and self._heap[0][0] <= until:
+            _, _, timer = heapq.heappop(self._heap)
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            timer.cancelled = True  # makes cancel() after the call a no-op
+            try:
+                timer.callback(*timer.args)
+            except Exception:  # pragma: no cover
+                logger.exception("timers.callback.error")
+        self._schedule()
+
+    def _keep_alive_due(self, keep_alive: _KeepAlive) -> None:
+        if keep_alive.stopped or keep_alive.message.is_acted_on:
+            return
+        if not self._due_keep_alives:
+            task = self.loop.create_task(self._send_keep_alives())
+            self._keep_alive_tasks.add(task)
+            task.add_done_callback(self._keep_alive_tasks.discard)
+        self._due_keep_alives.append(keep_alive)
+
+    async def _send_keep_alives(self) -> None:
+        due, self._due_keep_alives = self._due_keep_alives, []
+        results = await asyncio.gather(
+            *(keep_alive.message.keep_alive() for keep_alive in due),
+            return_exceptions=True,
+        )
+        for keep_alive, result in zip(due, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "message.keep_alive.error",
+                    extra={"message_id": keep_alive.message.message_id},
+                )
+            if not keep_alive.stopped and not keep_alive.message.is_acted_on:
+                keep_alive.timer = self.call_later(
+                    keep_alive.interval,
+                    self._keep_alive_due,
+                    keep_alive,
+                )
+
+
+_loop_timers: WeakKeyDictionary[asyncio.AbstractEventLoop, _Timers] = WeakKeyDictionary()
+
+
+def _get_timers() -> _Timers:
+    """Returns timers, which are shared by all of the runners of the running event loop."""
+    loop = asyncio.get_running_loop()
+    timers = _loop_timers.get(loop)
+    if timers is None:
+        timers = _loop_timers[loop] = _Timers(loop)
+    return timers
@@ -1,4 +1,6 @@
 from .asyncify_ import asyncify as asyncify
 from .is_installed import is_installed as is_installed
+from .json_backend import json_dumps as json_dumps
+from .json_backend import json_loads as json_loads
 from .json_encoder import JSON_ENCODER as JSON_ENCODER
 from .not_set import NotSet as NotSet
@@ -18,7 +18,10 @@ _operators = {
 
 @lru_cache
 def is_installed(dependency: str, version_constraints: str | None = None) -> bool:
-    spec = importlib.util.find_spec(dependency)
+    try:
+        spec = importlib.util.find_spec(dependency)
+    except ModuleNotFoundError:  # parent package of a submodule (e.g. `google.auth`) is missing
+        return False
     if spec is None:
         return False
 
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any, Literal
+
+from repid._utils.is_installed import is_installed
+from repid._utils.json_encoder import JSON_ENCODER
+
+if is_installed("orjson"):
+    import orjson
+
+if is_installed("msgspec"):
+    import msgspec
+
+JsonBackendT = Literal["auto", "json", "orjson", "msgspec"]
+
+# orjson decodes integers outside of 64 bits as floats instead of raising, look for them upfront
+_BIG_INT_BYTES = re.compile(rb"[0-9]{20}|-[0-9]{19}")
+_BIG_INT_STR = re.compile(r"[0-9]{20}|-[0-9]{19}")
+
+
+def _json_dumps(data: Any) -> bytes:
+    return JSON_ENCODER.encode(data).encode()
+
+
+def _json_loads(data: bytes | memoryview | str) -> Any:
+    # the standard library doesn't accept buffers other than bytes and bytearray
+    return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+
+def _orjson_dumps(data: Any) -> bytes:
+    try:
+        encoded = orjson.dumps(data, default=JSON_ENCODER.default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # e.g. integers over 64 bits, which are supported by the standard library
+        return _json_dumps(data)
+    if not encoded.isascii():
+        # the standard library escapes non-ASCII characters, keep the output the same
+        return _json_dumps(data)
+    return encoded
+
+
+def _orjson_loads(data: bytes | memoryview | str) -> Any:
+    big_int = _BIG_INT_STR.search(data) if isinstance(data, str) else _BIG_INT_BYTES.search(data)
+    if big_int is not None:
+        return _json_loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # the standard library is more lenient (NaN, UTF-16), let it decide
+        return _json_loads(data)
+
+
+def _msgspec_loads(data: bytes | memoryview | str) -> Any:
+    try:
+        return _MSGSPEC_DECODER.decode(data)
+    except msgspec.DecodeError:
+        return _json_loads(data)
+
+
+class _JsonBackend:
+    """JSON functions in use by the serializer, converters and brokers."""
+
+    __slots__ = ("dumps", "loads", "name")
+
+    def __init__(self) -> None:
+        self.name: str = "json"
+        self.dumps: Callable[[Any], bytes] = _json_dumps
+        self.loads: Callable[[bytes | memoryview | str], Any] = _json_loads
+
+
+_JSON_BACKEND = _JsonBackend()
+
+
+def set_json_backend(backend: JsonBackendT = "auto") -> None:
+    """Set JSON library for encoding and decoding of payloads and broker headers.
+
+    The output is compatible with the standard library, with the exception of floats in
+    exponent notation (e.g. `1e16` instead of `1e+16`) and NaN or infinity, which are
+    encoded as `null`. msgspec formats dates differently, so it is only used for decoding.
+
+    Args:
+        backend (JsonBackendT, optional): Name of the library. "auto" picks orjson, then
+        msgspec, if installed, and falls back to the standard library. Defaults to "auto".
+    """
+    if backend == "auto":
+        backend = (
+            "orjson" if is_installed("orjson") else "msgspec" if is_installed("msgspec") else "json"
+        )
+    if backend not in ("json", "orjson", "msgspec"):
+        raise ValueError(f"Unknown JSON backend '{backend}'.")
+    if backend != "json" and not is_installed(backend):
+        raise ValueError(f"JSON backend '{backend}' is not installed.")
+
+    _JSON_BACKEND.name = backend
+    _JSON_BACKEND.dumps = _orjson_dumps if backend == "orjson" else _json_dumps
+    _JSON_BACKEND.loads = {
+        "json": _json_loads,
+        "orjson": _orjson_loads,
+        "msgspec": _msgspec_loads,
+    }[backend]
+
+
+def get_json_backend() -> str:
+    """Name of the JSON library in use."""
+    return _JSON_BACKEND.name
+
+
+def json_dumps(data: Any) -> bytes:
+    return _JSON_BACKEND.dumps(data)
+
+
+def json_loads(data: bytes | memoryview | str) -> Any:
+    return _JSON_BACKEND.loads(data)
+
+
+if is_installed("msgspec"):
+    _MSGSPEC_DECODER = msgspec.json.Decoder()
+
+set_json_backend()
@@ -5,12 +5,14 @@ import logging
 import signal
 import sys
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from repid._runner import _Runner
 from repid.asyncapi_server import AsyncAPIServer
-from repid.data.actor import ActorExecutionContext
+from repid.converter import _LazyConverter
+from repid.data.actor import ActorData, ActorExecutionContext
 from repid.health_check_server import HealthCheckServer
+from repid.metrics import Metrics, MetricsServer
 from repid.router import _MaterializedRouter
 
 logger = logging.getLogger("repid")
@@ -18,7 +20,25 @@ logger = logging.getLogger("repid")
 if TYPE_CHECKING:
     from repid.asyncapi import AsyncAPI3Schema
     from repid.asyncapi_server import AsyncAPIServerSettings
+    from repid.dependencies import Depends
     from repid.health_check_server import HealthCheckServerSettings
+    from repid.metrics import MetricsServerSettings
+    from repid.profiling import Profiler
+
+
+def _worker_dependencies(actors: Iterable[ActorData]) -> list[Depends]:
+    dependencies: list[Depends] = []
+    for actor in actors:
+        converter = actor.converter
+        if isinstance(converter, _LazyConverter):
+            # only the signature is inspected, the converter itself is still built lazily
+            dependencies.extend(converter._check())
+            continue
+        # custom converters might not compile dependencies into a plan
+        plan = getattr(converter, "_dependency_plan", None)
+        if plan is not None:
+            dependencies.extend(plan.worker_dependencies)
+    return dependencies
 
 
 class _Worker:
@@ -28,23 +48,34 @@ class _Worker:
         router: _MaterializedRouter,
         graceful_shutdown_time: float = 25.0,
         messages_limit: int = float("inf"),  # type: ignore[assignment]
-        tasks_limit: int = 1000,
+        tasks_limit: int | Literal["adaptive"] = 1000,
+        channel_concurrency_limits: dict[str, int] | None = None,
         register_signals: Iterable[signal.Signals] | None = None,
         health_check_server: HealthCheckServerSettings | None = None,
         asyncapi_server: AsyncAPIServerSettings | None = None,
         asyncapi_schema: AsyncAPI3Schema | None = None,
+        *,
+        eager_execution: bool = False,
+        metrics_server: MetricsServerSettings | None = None,
+        profiler: Profiler | None = None,
+        max_inflight_bytes: int | None = None,
     ):
         self.actor_context = actor_context
         self.server = actor_context.server
         self.centralized_router = router
 
-        self.tasks_limit: int = tasks_limit
+        self.tasks_limit: int | Literal["adaptive"] = tasks_limit
         self.messages_limit: int = messages_limit
+        self.channel_concurrency_limits: dict[str, int] | None = channel_concurrency_limits
+        self.max_inflight_bytes: int | None = max_inflight_bytes
+        self.eager_execution: bool = eager_execution
+        self.profiler: Profiler | None = profiler
 
         self.graceful_shutdown_time: float = graceful_shutdown_time
         self.graceful_consumer_finish_time: float = 5.0
         self.graceful_health_check_server_finish_time: float = 1.0
         self.graceful_asyncapi_server_finish_time: float = 1.0
+        self.graceful_metrics_server_finish_time: float = 1.0
 
         self.register_signals: frozenset[signal.Signals] = (
             frozenset(
@@ -64,6 +95,12 @@ class _Worker:
                 raise ValueError("AsyncAPI schema is required if AsyncAPI server is enabled.")
             self.asyncapi_server = AsyncAPIServer(asyncapi_schema, asyncapi_server)
 
+        self.metrics: Metrics | None = None
+        self.metrics_server: MetricsServer | None = None
+        if metrics_server is not None:
+            self.metrics = Metrics()
+            self.metrics_server = MetricsServer(self.metrics, metrics_server)
+
     async def run(self) -> _Runner:
         logger.info(
             "worker.run.start",
@@ -74,33 +111,36 @@ class _Worker:
             },
         )
 
-        if self.health_check_server is not None:
-            await self.health_check_server.start()
-
-        if self.asyncapi_server is not None:
-            await self.asyncapi_server.start()
+        await self._start_servers()
 
         runner = _Runner(
             actor_context=self.actor_context,
             max_tasks=self.messages_limit,
             tasks_concurrency_limit=self.tasks_limit,
             health_check_server=self.health_check_server,
+            channel_concurrency_limits=self.channel_concurrency_limits,
+            max_inflight_bytes=self.max_inflight_bytes,
+            eager_execution=self.eager_execution,
+            metrics=self.metrics,
+            profiler=self.profiler,
         )
 
         if not self.centralized_router.actors:
             logger.info("worker.run.exit.no_actors")
-            if self.health_check_server is not None:  # pragma: no cover
-                await self.health_check_server.stop()
-            if self.asyncapi_server is not None:  # pragma: no cover
-                await self.asyncapi_server.stop()
+            await self._stop_servers()
             return runner
 
         loop = asyncio.get_running_loop()
         self._register_signals(loop, runner)
 
-        logger.info("worker.consumer.start")
+        worker_scope = self.actor_context.worker_scope
 
         try:
+            if worker_scope is not None:
+                await worker_scope.start(_worker_dependencies(self.centralized_router.actors))
+
+            logger.info("worker.consumer.start")
+
             await runner.run(
                 channels_to_actors=self.centralized_router._actors_per_channel_address,
                 graceful_termination_timeout=self.graceful_shutdown_time,
@@ -108,7 +148,29 @@ class _Worker:
         except asyncio.CancelledError as exc:
             logger.critical("worker.cancelled", exc_info=exc)
             raise
+        finally:
+            if worker_scope is not None:
+                await worker_scope.close()
+
+        await self._stop_servers()
+
+        self._unregister_signals(loop)
+
+        logger.info("worker.run.exit")
 
+        return runner
+
+    async def _start_servers(self) -> None:
+        if self.health_check_server is not None:
+            await self.health_check_server.start()
+
+        if self.asyncapi_server is not None:
+            await self.asyncapi_server.start()
+
+        if self.metrics_server is not None:
+            await self.metrics_server.start()
+
+    async def _stop_servers(self) -> None:
         if self.health_check_server is not None:
             await asyncio.wait_for(
                 self.health_check_server.stop(),
@@ -121,11 +183,11 @@ class _Worker:
                 timeout=self.graceful_asyncapi_server_finish_time,
             )
 
-        self._unregister_signals(loop)
-
-        logger.info("worker.run.exit")
-
-        return runner
+        if self.metrics_server is not None:
+            await asyncio.wait_for(
+                self.metrics_server.stop(),
+                timeout=self.graceful_metrics_server_finish_time,
+            )
 
     def _register_signals(self, loop: asyncio.AbstractEventLoop, runner: _Runner) -> None:
         def signal_handler() -> None:
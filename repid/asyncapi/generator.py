@@ -270,6 +270,9 @@ class DataExtractor:
 
         input_schema = actor.converter.get_input_schema()
         self._apply_input_schema(msg, input_schema)
+        if actor.message_schema is not None and actor.message_schema.content_type is not None:
+            # e.g. content type of the codec, which producers use for the actor
+            msg["contentType"] = actor.message_schema.content_type
 
         if actor.deprecated:
             msg["deprecated"] = True
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import uuid
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from repid._utils import is_installed
+from repid.connections.abc import MessageAction
+
+if TYPE_CHECKING:
+    from repid.connections.abc import ReceivedMessageT
+    from repid.data import ActorData, MessageData
+
+__all__ = [
+    "CLAIM_CHECK_HEADER",
+    "BlobStoreT",
+    "ClaimCheckActorMiddleware",
+    "ClaimCheckMiddleware",
+    "FileBlobStore",
+    "S3BlobStore",
+]
+
+logger = logging.getLogger("repid")
+
+CLAIM_CHECK_HEADER = "claim-check"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStoreT(Protocol):
+    async def put(self, key: str, data: bytes) -> None: ...
+
+    async def get(self, key: str) -> bytes: ...
+
+    def stream(self, key: str, chunk_size: int = _CHUNK_SIZE) -> AsyncIterator[bytes]: ...
+
+    async def delete(self, key: str) -> None:
+        """Delete the blob. Deleting a blob which doesn't exist isn't an error."""
+
+
+class FileBlobStore:
+    """Stores blobs as files in a directory, e.g. on a volume shared by producers and workers."""
+
+    __slots__ = ("_directory",)
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self._directory = Path(directory).resolve()
+
+    def _path(self, key: str) -> Path:
+        # keys come from message headers, don't let them point outside of the directory
+        path = (self._directory / key).resolve()
+        if path == self._directory or not path.is_relative_to(self._directory):
+            raise ValueError(f"Invalid blob key '{key}'.")
+        return path
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # readers never see a partially written blob
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    async def get(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._path(key).read_bytes)
+
+    async def stream(self, key: str, chunk_size: int = _CHUNK_SIZE) -> AsyncIterator[bytes]:
+        file = await asyncio.to_thread(self._path(key).open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, chunk_size):
+                yield chunk
+        finally:
+            file.close()
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+
+class S3BlobStore:
+    """Stores blobs in an S3-compatible bucket, requires `aiobotocore` package.
+
+    Connect the store before use, e.g. `async with store.connection(): ...`.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        region_name: str | None = None,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        aws_session_token: str | None = None,
+    ) -> None:
+        if not is_installed("aiobotocore"):
+            raise ValueError("S3BlobStore requires 'aiobotocore' package.")
+        # imported lazily, the same as brokers, to keep `import repid` fast
+        from aiobotocore.session import get_session  # noqa: PLC0415
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.endpoint_url = endpoint_url
+        self.region_name = region_name
+        self._aws_access_key_id = aws_access_key_id
+        self._aws_secret_access_key = aws_secret_access_key
+        self._aws_session_token = aws_session_token
+
+        self._session = get_session()
+        self._client: Any = None
+        self._client_cm: Any = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None
+
+    async def connect(self) -> None:
+        if self._client is None:
+            self._client_cm = self._session.create_client(
+                "s3",
+                endpoint_url=self.endpoint_url,
+                region_name=self.region_name,
+                aws_access_key_id=self._aws_access_key_id,
+                aws_secret_access_key=self._aws_secret_access_key,
+                aws_session_token=self._aws_session_token,
+            )
+            self._client = await self._client_cm.__aenter__()
+
+    async def disconnect(self) -> None:
+        if self._client is not None:
+            await self._client_cm.__aexit__(None, None, None)
+            self._client = None
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[S3BlobStore]:
+        await self.connect()
+        try:
+            yield self
+        finally:
+            await self.disconnect()
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            raise RuntimeError("S3 client is not connected.")
+        return self._client
+
+    async def put(self, key: str, data: bytes) -> None:
+        await self._get_client().put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    async def get(self, key: str) -> bytes:
+        response = await self._get_client().get_object(Bucket=self.bucket, Key=self.prefix + key)
+        async with response["Body"] as body:
+            return cast(bytes, await body.read())
+
+    async def stream(self, key: str, chunk_size: int = _CHUNK_SIZE) -> AsyncIterator[bytes]:
+        response = await self._get_client().get_object(Bucket=self.bucket, Key=self.prefix + key)
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    async def delete(self, key: str) -> None:
+        await self._get_client().delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+
+class ClaimCheckMiddleware:
+    """Producer middleware, which offloads payloads larger than the threshold to a blob store.
+
+    The message is sent with an empty payload and the key of the blob in `claim-check` header,
+    `ClaimCheckActorMiddleware` puts the payload back on the consumer side.
+
+    Args:
+        store (BlobStoreT): Store for the payloads.
+        threshold (int, optional): Payloads larger than this size in bytes are offloaded.
+        Defaults to 128 KiB, which leaves room for headers under 256 KiB limit of SQS.
+    """
+
+    __slots__ = ("_store", "_threshold")
+
+    def __init__(self, store: BlobStoreT, *, threshold: int = 128 * 1024) -> None:
+        self._store = store
+        self._threshold = threshold
+
+    async def __call__(
+        self,
+        call_next: Callable[[str, MessageData, dict[str, Any] | None], Coroutine[Any, Any, Any]],
+        channel: str,
+        message: MessageData,
+        server_specific_parameters: dict[str, Any] | None,
+    ) -> Any:
+        headers = message.headers
+        if len(message.payload) <= self._threshold or (
+            headers is not None and CLAIM_CHECK_HEADER in headers
+        ):
+            return await call_next(channel, message, server_specific_parameters)
+
+        key = uuid.uuid4().hex
+        await self._store.put(key, message.payload)
+        try:
+            return await call_next(
+                channel,
+                replace(message, payload=b"", headers={**(headers or {}), CLAIM_CHECK_HEADER: key}),
+                server_specific_parameters,
+            )
+        except BaseException:
+            await _delete_quietly(self._store, key)
+            raise
+
+
+class _ClaimedMessage:
+    """Received message with the payload taken from the blob store."""
+
+    __slots__ = ("_message", "_payload")
+
+    def __init__(self, message: ReceivedMessageT, payload: bytes) -> None:
+        self._message = message
+        self._payload = payload
+
+    @property
+    def payload(self) -> bytes:
+        return self._payload
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._message, name)
+
+
+class ClaimCheckActorMiddleware:
+    """Actor middleware, which fetches payloads offloaded by `ClaimCheckMiddleware`.
+
+    The payload is fetched right before the actor runs, so messages waiting in the worker don't
+    hold it in memory. The blob is deleted once the message is acked, nacked and rejected messages
+    keep it for the next attempt or for inspection.
+
+    Args:
+        store (BlobStoreT): Store for the payloads.
+        fetch (bool, optional): Whether to fetch the payload. Set to False for actors which
+        stream the blob by themselves, using the key from `claim-check` header. Defaults to True.
+        delete_after_ack (bool, optional): Whether to delete the blob once the message is acked.
+        Defaults to True.
+    """
+
+    __slots__ = ("_delete_after_ack", "_fetch", "_store")
+
+    def __init__(
+        self,
+        store: BlobStoreT,
+        *,
+        fetch: bool = True,
+        delete_after_ack: bool = True,
+    ) -> None:
+        self._store = store
+        self._fetch = fetch
+        self._delete_after_ack = delete_after_ack
+
+    async def __call__(
+        self,
+        call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+        message: ReceivedMessageT,
+        actor: ActorData,
+    ) -> Any:
+        headers = message.headers
+        if not headers or (key := headers.get(CLAIM_CHECK_HEADER)) is None:
+            return await call_next(message, actor)
+
+        if self._fetch:
+            message = cast("ReceivedMessageT", _ClaimedMessage(message, await self._store.get(key)))
+        try:
+            return await call_next(message, actor)
+        finally:
+            if self._delete_after_ack and message.action in (
+                MessageAction.acked,
+                MessageAction.replied,
+            ):
+                await _delete_quietly(self._store, key)
+
+
+async def _delete_quietly(store: BlobStoreT, key: str) -> None:
+    try:
+        await store.delete(key)
+    except Exception:
+        logger.exception("claim_check.delete.error", extra={"key": key})
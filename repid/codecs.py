@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+from repid._utils import JSON_ENCODER, is_installed, json_loads
+from repid.serializer import default_serializer
+
+if is_installed("msgpack"):
+    import msgpack
+
+if is_installed("cbor2"):
+    import cbor2
+
+__all__ = [
+    "CborCodec",
+    "CodecT",
+    "JsonCodec",
+    "MsgpackCodec",
+    "get_codec",
+    "register_codec",
+]
+
+
+class CodecT(Protocol):
+    """Serializer, which also knows its content type and how to decode the payload back.
+
+    Codecs can be used anywhere a serializer is expected, e.g. as `Repid.default_serializer`
+    or as `serializer` of `send_message_json`, in which case messages are sent with
+    the content type of the codec.
+
+    Payloads to decode may be a `memoryview` into the data received by the broker, rather than
+    `bytes`.
+    """
+
+    content_type: str
+
+    def __call__(self, data: Any) -> bytes: ...
+
+    def decode(self, payload: bytes | memoryview) -> Any: ...
+
+
+class JsonCodec:
+    """JSON, encoded and decoded with the configured JSON backend."""
+
+    __slots__ = ()
+
+    content_type = "application/json"
+
+    def __call__(self, data: Any) -> bytes:
+        return default_serializer(data)
+
+    def decode(self, payload: bytes | memoryview) -> Any:
+        return json_loads(payload)
+
+
+class MsgpackCodec:
+    """MessagePack, requires `msgpack` package.
+
+    Types which MessagePack doesn't support natively (dates, UUIDs, decimals, dataclasses and
+    pydantic models) are converted the same way as they are converted to JSON.
+    """
+
+    __slots__ = ()
+
+    content_type = "application/msgpack"
+
+    def __init__(self) -> None:
+        if not is_installed("msgpack"):
+            raise ValueError("MsgpackCodec requires 'msgpack' package.")
+
+    def __call__(self, data: Any) -> bytes:
+        return msgpack.packb(data, default=JSON_ENCODER.default)  # type: ignore[no-any-return]
+
+    def decode(self, payload: bytes | memoryview) -> Any:
+        return msgpack.unpackb(payload, strict_map_key=False)
+
+
+class CborCodec:
+    """CBOR, requires `cbor2` package.
+
+    Dates, UUIDs and decimals are encoded with standard CBOR tags (datetimes must be timezone
+    aware), other types, which CBOR doesn't support natively (dataclasses and pydantic models),
+    are converted the same way as they are converted to JSON.
+    """
+
+    __slots__ = ()
+
+    content_type = "application/cbor"
+
+    def __init__(self) -> None:
+        if not is_installed("cbor2"):
+            raise ValueError("CborCodec requires 'cbor2' package.")
+
+    def __call__(self, data: Any) -> bytes:
+        return cbor2.dumps(data, default=_cbor_default)
+
+    def decode(self, payload: bytes | memoryview) -> Any:
+        return cbor2.loads(payload)
+
+
+def _cbor_default(encoder: Any, value: Any) -> None:
+    encoder.encode(JSON_ENCODER.default(value))
+
+
+_CODECS: dict[str, CodecT] = {}
+
+
+def register_codec(codec: CodecT, *, content_type: str | None = None) -> None:
+    """Register codec, which is used to decode payloads of the content type.
+
+    Registering a codec for an already known content type replaces the previous one.
+
+    Args:
+        codec (CodecT): The codec.
+        content_type (str | None, optional): Content type to register the codec for, e.g.
+        an alias. Defaults to None, which will use the content type of the codec.
+    """
+    _CODECS[_normalize(content_type or codec.content_type)] = codec
+
+
+def get_codec(content_type: str | None) -> CodecT:
+    """Get codec registered for the content type. Messages without content type are JSON.
+
+    Raises:
+        ValueError: If there is no codec for the content type.
+    """
+    key = content_type or "application/json"
+    codec = _CODECS.get(key)
+    if codec is None:
+        codec = _CODECS.get(_normalize(key))
+    if codec is None:
+        raise ValueError(f"Unsupported content type: {content_type}")
+    return codec
+
+
+def _normalize(content_type: str) -> str:
+    # drop parameters, e.g. "application/json; charset=utf-8"
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+register_codec(JsonCodec())
+if is_installed("msgpack"):
+    register_codec(MsgpackCodec())
+    register_codec(MsgpackCodec(), content_type="application/x-msgpack")
+    register_codec(MsgpackCodec(), content_type="application/vnd.msgpack")
+if is_installed("cbor2"):
+    register_codec(CborCodec())
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import hashlib
+import zlib
+from collections.abc import Callable, Coroutine, Mapping
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Literal
+
+from repid._utils import is_installed
+
+if is_installed("zstandard"):
+    import zstandard
+
+if is_installed("lz4"):
+    import lz4.frame
+
+if TYPE_CHECKING:
+    from repid.connections.abc import BaseMessageT
+    from repid.data import MessageData
+
+__all__ = [
+    "COMPRESSION_DICTIONARY_HEADER",
+    "CONTENT_ENCODING_HEADER",
+    "CompressionAlgorithmT",
+    "CompressionMiddleware",
+    "decompress_payload",
+    "register_compression_dictionary",
+    "set_max_decompressed_size",
+]
+
+CONTENT_ENCODING_HEADER = "content-encoding"
+COMPRESSION_DICTIONARY_HEADER = "compression-dictionary"
+
+CompressionAlgorithmT = Literal["gzip", "zstd", "lz4"]
+
+_PACKAGES = {"gzip": "zlib", "zstd": "zstandard", "lz4": "lz4"}
+
+# gzip container around deflate stream, compatible with `gzip.compress`
+_GZIP_WBITS = 31
+
+# zstd dictionaries by their id, both for compression and decompression
+_DICTIONARIES: dict[str, zstandard.ZstdCompressionDict] = {}
+_DECOMPRESSORS: dict[str | None, zstandard.ZstdDecompressor] = {}
+
+# protects workers from payloads which decompress to much more than they were sent as
+_DEFAULT_MAX_DECOMPRESSED_SIZE = 64 * 1024 * 1024
+_max_decompressed_size: int | None = _DEFAULT_MAX_DECOMPRESSED_SIZE
+
+
+def set_max_decompressed_size(size: int | None = _DEFAULT_MAX_DECOMPRESSED_SIZE) -> None:
+    """Set the limit of size of decompressed payloads. Messages, which would decompress to
+    a larger payload, fail to convert the same way as invalid payloads do, without being
+    decompressed in full.
+
+    Args:
+        size (int | None, optional): The limit in bytes. None disables the limit.
+        Defaults to 64 MiB.
+    """
+    global _max_decompressed_size  # noqa: PLW0603
+    if size is not None and size < 1:
+        raise ValueError("Max decompressed size must be positive.")
+    _max_decompressed_size = size
+
+
+def register_compression_dictionary(dictionary: bytes) -> str:
+    """Register zstd dictionary, which is used to decompress payloads compressed with it.
+
+    Dictionaries are registered by `CompressionMiddleware` automatically, processes which only
+    consume messages must register the same dictionaries before receiving them.
+
+    Args:
+        dictionary (bytes): The dictionary, e.g. trained with `zstandard.train_dictionary`
+        on typical payloads of the channel.
+
+    Returns:
+        str: Id of the dictionary, which is sent in `compression-dictionary` header.
+    """
+    _check_installed("zstd")
+    dictionary_id = hashlib.sha256(dictionary).hexdigest()[:16]
+    if dictionary_id not in _DICTIONARIES:
+        _DICTIONARIES[dictionary_id] = zstandard.ZstdCompressionDict(dictionary)
+    return dictionary_id
+
+
+def _check_installed(algorithm: str) -> None:
+    package = _PACKAGES.get(algorithm)
+    if package is None:
+        raise ValueError(f"Unknown compression algorithm '{algorithm}'.")
+    if not is_installed(package):
+        raise ValueError(f"Compression algorithm '{algorithm}' requires '{package}' package.")
+
+
+def _zstd_decompressor(dictionary_id: str | None) -> zstandard.ZstdDecompressor:
+    if (decompressor := _DECOMPRESSORS.get(dictionary_id)) is not None:
+        return decompressor
+    if dictionary_id is None:
+        decompressor = zstandard.ZstdDecompressor()
+    elif (dictionary := _DICTIONARIES.get(dictionary_id)) is not None:
+        decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+    else:
+        raise ValueError(f"Unknown compression dictionary '{dictionary_id}'.")
+    _DECOMPRESSORS[dictionary_id] = decompressor
+    return decompressor
+
+
+def _zstd_decompress(
+    decompressor: zstandard.ZstdDecompressor,
+    payload: bytes | memoryview,
+    limit: int | None,
+) -> bytes:
+    if limit is None:
+        return decompressor.decompress(payload)
+    # the size is written into the frame header, unless the payload was compressed as a stream
+    content_size = zstandard.frame_content_size(payload)
+    if content_size > limit:
+        raise _too_large(limit)
+    if content_size >= 0:
+        return decompressor.decompress(payload)
+    try:
+        return decompressor.decompress(payload, max_output_size=limit)
+    except zstandard.ZstdError as exc:
+        raise ValueError(
+            f"Payload can't be decompressed within the limit of {limit} bytes.",
+        ) from exc
+
+
+def _gzip_decompress(payload: bytes | memoryview, limit: int | None) -> bytes:
+    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+    data = decompressor.decompress(payload, 0 if limit is None else limit + 1)
+    if limit is not None and len(data) > limit:
+        raise _too_large(limit)
+    if not decompressor.eof:
+        raise ValueError("Compressed payload is incomplete.")
+    return data
+
+
+def _lz4_decompress(payload: bytes | memoryview, limit: int | None) -> bytes:
+    decompressor = lz4.frame.LZ4FrameDecompressor()
+    data: bytes = decompressor.decompress(payload, max_length=-1 if limit is None else limit + 1)
+    if limit is not None and len(data) > limit:
+        raise _too_large(limit)
+    if not decompressor.eof:
+        raise ValueError("Compressed payload is incomplete.")
+    return data
+
+
+def _too_large(limit: int) -> ValueError:
+    return ValueError(f"Decompressed payload exceeds the limit of {limit} bytes.")
+
+
+def decompress_payload(message: BaseMessageT) -> bytes | memoryview:
+    """Payload of the message, decompressed according to its `content-encoding` header.
+
+    Raises:
+        ValueError: If the encoding or the dictionary is unknown, or the payload exceeds
+        the limit set by `set_max_decompressed_size` once decompressed.
+    """
+    headers = message.headers
+    if not headers or (encoding := headers.get(CONTENT_ENCODING_HEADER)) is None:
+        return message.payload
+    if encoding == "identity" or not message.payload:
+        return message.payload
+    if encoding == "zstd" and is_installed("zstandard"):
+        decompressor = _zstd_decompressor(headers.get(COMPRESSION_DICTIONARY_HEADER))
+        return _zstd_decompress(decompressor, message.payload, _max_decompressed_size)
+    if encoding == "gzip":
+        return _gzip_decompress(message.payload, _max_decompressed_size)
+    if encoding == "lz4" and is_installed("lz4"):
+        return _lz4_decompress(message.payload, _max_decompressed_size)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+class CompressionMiddleware:
+    """Producer middleware, which compresses payloads larger than the threshold.
+
+    Compressed messages carry `content-encoding` header, converters decompress them before
+    decoding. Payloads which don't get smaller are sent as is.
+
+    Args:
+        algorithm (CompressionAlgorithmT, optional): Compression algorithm. zstd requires
+        `zstandard` and lz4 requires `lz4` package. Defaults to "zstd".
+        threshold (int, optional): Payloads of this size in bytes or larger are compressed.
+        Defaults to 1024.
+        level (int | None, optional): Compression level. Defaults to None, which will use
+        the default level of the algorithm.
+        dictionaries (Mapping[str, bytes] | None, optional): zstd dictionaries per channel,
+        which improve compression of small payloads with repetitive structure. Defaults to None.
+    """
+
+    __slots__ = ("_algorithm", "_compress", "_compressors", "_dictionary_ids", "_threshold")
+
+    def __init__(
+        self,
+        algorithm: CompressionAlgorithmT = "zstd",
+        *,
+        threshold: int = 1024,
+        level: int | None = None,
+        dictionaries: Mapping[str, bytes] | None = None,
+    ) -> None:
+        _check_installed(algorithm)
+        if dictionaries and algorithm != "zstd":
+            raise ValueError("Compression dictionaries are only supported with zstd.")
+        self._algorithm = algorithm
+        self._threshold = threshold
+        self._dictionary_ids: dict[str, str] = {}
+        # compressors are reused, as creating zstd context is more expensive than small payloads
+        self._compressors: dict[str, Callable[[bytes], bytes]] = {}
+        if algorithm == "zstd":
+            zstd_level = level if level is not None else 3
+            self._compress = zstandard.ZstdCompressor(level=zstd_level).compress
+            for channel, dictionary in (dictionaries or {}).items():
+                dictionary_id = register_compression_dictionary(dictionary)
+                self._dictionary_ids[channel] = dictionary_id
+                self._compressors[channel] = zstandard.ZstdCompressor(
+                    level=zstd_level,
+                    dict_data=_DICTIONARIES[dictionary_id],
+                ).compress
+        elif algorithm == "gzip":
+            gzip_level = level if level is not None else zlib.Z_DEFAULT_COMPRESSION
+            self._compress = lambda data: zlib.compress(data, gzip_level, wbits=_GZIP_WBITS)
+        else:
+            lz4_level = level if level is not None else 0
+            self._compress = lambda data: lz4.frame.compress(data, compression_level=lz4_level)
+
+    async def __call__(
+        self,
+        call_next: Callable[[str, MessageData, dict[str, Any] | None], Coroutine[Any, Any, Any]],
+        channel: str,
+        message: MessageData,
+        server_specific_parameters: dict[str, Any] | None,
+    ) -> Any:
+        headers = message.headers
+        if len(message.payload) < self._threshold or (
+            headers is not None and CONTENT_ENCODING_HEADER in headers
+        ):
+            return await call_next(channel, message, server_specific_parameters)
+
+        compressed = self._compressors.get(channel, self._compress)(message.payload)
+        if len(compressed) >= len(message.payload):
+            return await call_next(channel, message, server_specific_parameters)
+
+        headers = {**(headers or {}), CONTENT_ENCODING_HEADER: self._algorithm}
+        if (dictionary_id := self._dictionary_ids.get(channel)) is not None:
+            headers[COMPRESSION_DICTIONARY_HEADER] = dictionary_id
+        return await call_next(
+            channel,
+            replace(message, payload=compressed, headers=headers),
+            server_specific_parameters,
+        )
@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from repid._utils import is_installed
 from repid.connections.abc import (
     BaseMessageT,
@@ -8,8 +13,15 @@ from repid.connections.abc import (
     ServerT,
     SubscriberT,
 )
-from repid.connections.amqp import AmqpServer
-from repid.connections.in_memory import InMemoryServer
+
+if TYPE_CHECKING:
+    from repid.connections.amqp import AmqpServer
+    from repid.connections.in_memory import InMemoryServer
+    from repid.connections.kafka import KafkaServer
+    from repid.connections.nats import NatsServer
+    from repid.connections.pubsub import PubsubServer
+    from repid.connections.redis import RedisServer
+    from repid.connections.sqs import SqsServer
 
 __all__ = [
     "AmqpServer",
@@ -23,38 +35,48 @@ __all__ = [
     "SubscriberT",
 ]
 
+# servers are imported on the first access, so that only the brokers which are in use
+# (and their client libraries) are imported
+_SERVER_MODULES: dict[str, str] = {
+    "AmqpServer": "repid.connections.amqp",
+    "InMemoryServer": "repid.connections.in_memory",
+}
 
 if is_installed("redis"):
-    from repid.connections.redis import RedisServer
+    _SERVER_MODULES["RedisServer"] = "repid.connections.redis"
 
     __all__ += ["RedisServer"]
 
 if is_installed("aiokafka"):
-    from repid.connections.kafka import KafkaServer
+    _SERVER_MODULES["KafkaServer"] = "repid.connections.kafka"
 
     __all__ += ["KafkaServer"]
 
-# check via try-import because pubsub is a sub-package of gcloud.aio
-imported_pubsub = False
-try:
-    import google.auth
-    import grpc.aio
-except ImportError:  # pragma: no cover
-    imported_pubsub = False
-else:
-    imported_pubsub = True
-
-if imported_pubsub:
-    from repid.connections.pubsub import PubsubServer
+# pubsub is a sub-package of gcloud.aio, so check for its own dependencies instead
+if is_installed("google.auth") and is_installed("grpc"):
+    _SERVER_MODULES["PubsubServer"] = "repid.connections.pubsub"
 
     __all__ += ["PubsubServer"]
 
 if is_installed("nats"):
-    from repid.connections.nats import NatsServer
+    _SERVER_MODULES["NatsServer"] = "repid.connections.nats"
 
     __all__ += ["NatsServer"]
 
 if is_installed("aiobotocore"):
-    from repid.connections.sqs import SqsServer
+    _SERVER_MODULES["SqsServer"] = "repid.connections.sqs"
 
     __all__ += ["SqsServer"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _SERVER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    server = getattr(importlib.import_module(module), name)
+    globals()[name] = server
+    return server
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -23,7 +23,9 @@ class MessageAction(str, Enum):
 
 class BaseMessageT(Protocol):
     @property
-    def payload(self) -> bytes: ...
+    def payload(self) -> bytes | memoryview:
+        """Raw payload. Brokers may return a view into the received data instead of copying it,
+        use `bytes(payload)` where a `bytes` object is required."""
 
     @property
     def headers(self) -> dict[str, str] | None: ...
@@ -36,7 +38,8 @@ class BaseMessageT(Protocol):
 
 
 class SentMessageT(BaseMessageT, Protocol):
-    pass
+    @property
+    def payload(self) -> bytes: ...
 
 
 MessagePublisherT: TypeAlias = Callable[
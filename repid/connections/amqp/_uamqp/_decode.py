@@ -167,6 +167,16 @@ def _decode_binary_large(buffer: memoryview) -> tuple[memoryview, bytes]:
     return buffer[length_index:], buffer[4:length_index].tobytes()
 
 
+def _decode_binary_small_view(buffer: memoryview) -> tuple[memoryview, memoryview]:
+    length_index = buffer[0] + 1
+    return buffer[length_index:], buffer[1:length_index]
+
+
+def _decode_binary_large_view(buffer: memoryview) -> tuple[memoryview, memoryview]:
+    length_index = c_unsigned_long.unpack(buffer[:4])[0] + 4
+    return buffer[length_index:], buffer[4:length_index]
+
+
 def _decode_list_small(buffer: memoryview) -> tuple[memoryview, list[Any]]:
     count = buffer[1]
     buffer = buffer[2:]
@@ -369,8 +379,14 @@ def bytes_to_performative(data: bytes) -> performatives.Performative:
     body_start = doff * 4
     if size < body_start:
         raise ValueError(f"Frame size {size} smaller than data offset {body_start}")
-    body_buffer = buffer[body_start:size]
+    return frame_body_to_performative(buffer[body_start:size])
 
+
+def frame_body_to_performative(body_buffer: memoryview) -> performatives.Performative:
+    """Decode the body of a frame, which header has already been parsed and validated.
+
+    Payload of a transfer frame is kept as a view into the frame, not copied.
+    """
     if len(body_buffer) == 0:
         return performatives.EmptyFrame()
 
@@ -409,12 +425,19 @@ def bytes_to_performative(data: bytes) -> performatives.Performative:
     # Payload
     # If TransferFrame, remaining body_buffer is payload.
     if isinstance(performative, performatives.TransferFrame) and len(body_buffer) > 0:
-        performative.payload = body_buffer.tobytes()
+        performative.payload = body_buffer
 
     return performative
 
 
-def _construct_message(payload: bytes) -> Message:  # noqa: C901, PLR0912
+# Binary decoders for data sections, which keep the message body as a view into the frame
+_DATA_DECODE_MAP: dict[int, Callable] = {
+    0x000000A0: _decode_binary_small_view,
+    0x000000B0: _decode_binary_large_view,
+}
+
+
+def _construct_message(payload: bytes | memoryview) -> Message:  # noqa: C901, PLR0912
     buffer = memoryview(payload)
     message = Message()
 
@@ -435,7 +458,10 @@ def _construct_message(payload: bytes) -> Message:  # noqa: C901, PLR0912
 
         # Value
         constructor = buffer[0]
-        decoder = _DECODE_MAP[constructor]
+        if descriptor == 0x00000075 and constructor in _DATA_DECODE_MAP:  # noqa: PLR2004
+            decoder = _DATA_DECODE_MAP[constructor]
+        else:
+            decoder = _DECODE_MAP[constructor]
         if decoder is None:
             raise ValueError(f"Unknown constructor: {constructor}")
         buffer, value = decoder(buffer[1:])
@@ -468,11 +494,11 @@ def _construct_message(payload: bytes) -> Message:  # noqa: C901, PLR0912
 
 
 def transfer_frames_to_message(frames: list[performatives.TransferFrame]) -> Message:
-    payload = bytearray()
-    for frame in frames:
-        if frame.payload:
-            payload.extend(frame.payload)
-    return _construct_message(bytes(payload))
+    payloads = [frame.payload for frame in frames if frame.payload]
+    if len(payloads) == 1:
+        # the whole message is in a single frame, decode it in place
+        return _construct_message(payloads[0])
+    return _construct_message(b"".join(payloads))
 
 
 def decode_frame(data: bytes) -> tuple[int, performatives.Performative]:
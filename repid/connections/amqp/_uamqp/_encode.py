@@ -979,11 +979,8 @@ def performative_to_bytes(performative: EncodableT, channel: int = 0) -> bytes:
     if isinstance(performative, performatives.EmptyFrame):
         return b"\x00\x00\x00\x08\x02\x00" + channel.to_bytes(2, "big")
 
-    output = bytearray()
-    output.extend(_encode_performative_body(performative))
-
-    if hasattr(performative, "payload") and performative.payload:
-        output.extend(performative.payload)
+    body = _encode_performative_body(performative)
+    payload = getattr(performative, "payload", None) or b""
 
     # Header
     # SIZE (4) DOFF (1) TYPE (1) CHANNEL (2)
@@ -991,14 +988,16 @@ def performative_to_bytes(performative: EncodableT, channel: int = 0) -> bytes:
     # TYPE = performative.FRAME_TYPE (0x00 or 0x01)
     # CHANNEL = channel
 
-    frame_size = len(output) + 8
-    header = bytearray()
-    header.extend(frame_size.to_bytes(4, "big"))
-    header.append(2)  # DOFF
-    header.extend(performative.FRAME_TYPE)
-    header.extend(channel.to_bytes(2, "big"))
+    frame_size = len(body) + len(payload) + 8
+    output = bytearray()
+    output.extend(frame_size.to_bytes(4, "big"))
+    output.append(2)  # DOFF
+    output.extend(performative.FRAME_TYPE)
+    output.extend(channel.to_bytes(2, "big"))
+    output.extend(body)
+    output.extend(payload)
 
-    return bytes(header + output)
+    return bytes(output)
 
 
 def message_to_transfer_frames(  # noqa: C901, PLR0912, PLR0915, PLR0917
@@ -1068,11 +1067,12 @@ def message_to_transfer_frames(  # noqa: C901, PLR0912, PLR0915, PLR0917
         _encode_ulong(payload, 0x00000078)
         _encode_annotations(payload, message.footer)
 
-    # Split into frames
-    remaining_payload = bytes(payload)
+    # Split into frames, chunks are views into the encoded message, not copies of its tail
+    view = memoryview(payload)
+    offset = 0
     first = True
 
-    while remaining_payload or first:
+    while offset < len(view) or first:
         # Construct Transfer
         transfer = performatives.TransferFrame(
             handle=handle,
@@ -1098,10 +1098,10 @@ def message_to_transfer_frames(  # noqa: C901, PLR0912, PLR0915, PLR0917
         if available <= 0:
             raise ValueError("Frame size too small for Transfer frame overhead")
 
-        chunk = remaining_payload[:available]
-        remaining_payload = remaining_payload[available:]
+        chunk = view[offset : offset + available]
+        offset += len(chunk)
 
-        if not remaining_payload:
+        if offset >= len(view):
             transfer.more = more
         else:
             transfer.more = True
@@ -1110,5 +1110,5 @@ def message_to_transfer_frames(  # noqa: C901, PLR0912, PLR0915, PLR0917
         yield transfer
 
         first = False
-        if not remaining_payload:
+        if offset >= len(view):
             break
@@ -226,13 +226,13 @@ class Message:
     message_annotations: dict[str, Any] | None = None
     properties: Properties | None = None
     application_properties: dict[str, Any] | None = None
-    data: list[bytes] | None = None
+    data: list[bytes | memoryview] | None = None
     sequence: list[list[Any]] | None = None
     value: Any = field(default_factory=lambda: _ABSENT)
     footer: dict[str, Any] | None = None
 
     @property
-    def body(self) -> list[bytes] | list[list[Any]] | Any | None:
+    def body(self) -> list[bytes | memoryview] | list[list[Any]] | Any | None:
         if self.data is not None:
             return self.data
         if self.sequence is not None:
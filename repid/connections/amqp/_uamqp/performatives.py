@@ -409,7 +409,7 @@ class TransferFrame(Performative):
     resume: Annotated[bool, AMQPTAnnotation(AMQPTypes.boolean)] = False
     aborted: Annotated[bool, AMQPTAnnotation(AMQPTypes.boolean)] = False
     batchable: Annotated[bool, AMQPTAnnotation(AMQPTypes.boolean)] = False
-    payload: bytes | None = None
+    payload: bytes | memoryview | None = None
 
 
 @dataclass(slots=True, kw_only=True)
@@ -21,7 +21,7 @@ class AmqpReceivedMessage:
     def __init__(
         self,
         *,
-        payload: bytes,
+        payload: bytes | memoryview,
         headers: dict[str, Any] | None,
         link: ReceiverLink,
         delivery_id: int,
@@ -44,7 +44,7 @@ class AmqpReceivedMessage:
         self._settlement_lock = asyncio.Lock()
 
     @property
-    def payload(self) -> bytes:
+    def payload(self) -> bytes | memoryview:
         return self._payload
 
     @property
@@ -521,7 +521,14 @@ class ReceiverLink(Link):
         address: str,
         handle: int,
         callback: Callable[
-            [bytes, dict[str, Any] | None, int, bytes, ReceiverLink, Properties | None],
+            [
+                bytes | memoryview,
+                dict[str, Any] | None,
+                int,
+                bytes,
+                ReceiverLink,
+                Properties | None,
+            ],
             Any,
         ],
         prefetch: int = 100,
@@ -652,7 +659,7 @@ class ReceiverLink(Link):
 
             delivery_tag = first_transfer.delivery_tag or b""
 
-            body = self._body_to_bytes(msg.body)
+            body = self._body_to_payload(msg.body)
             headers = (
                 dict(msg.application_properties) if msg.application_properties is not None else None
             )
@@ -688,10 +695,12 @@ class ReceiverLink(Link):
         await self.release_delivery_credit(delivery_id)
 
     @staticmethod
-    def _body_to_bytes(body: Any) -> bytes:
+    def _body_to_payload(body: Any) -> bytes | memoryview:
         if isinstance(body, list):
-            if body and isinstance(body[0], bytes):
-                return b"".join(cast(list[bytes], body))
+            if body and isinstance(body[0], (bytes, memoryview)):
+                # a single data section is a view into the received frames, pass it on as is
+                sections = cast(list[bytes | memoryview], body)
+                return sections[0] if len(sections) == 1 else b"".join(sections)
             if body:
                 return json.dumps(body).encode()
         elif isinstance(body, str):
@@ -297,7 +297,14 @@ class ReceiverPool:
         self._callbacks: dict[
             str,
             Callable[
-                [bytes, dict[str, Any] | None, int, bytes, ReceiverLink, Properties | None],
+                [
+                    bytes | memoryview,
+                    dict[str, Any] | None,
+                    int,
+                    bytes,
+                    ReceiverLink,
+                    Properties | None,
+                ],
                 Any,
             ],
         ] = {}
@@ -317,7 +324,14 @@ class ReceiverPool:
         self,
         address: str,
         callback: Callable[
-            [bytes, dict[str, Any] | None, int, bytes, ReceiverLink, Properties | None],
+            [
+                bytes | memoryview,
+                dict[str, Any] | None,
+                int,
+                bytes,
+                ReceiverLink,
+                Properties | None,
+            ],
             Any,
         ],
         name: str | None = None,
@@ -351,7 +365,14 @@ class ReceiverPool:
         self,
         address: str,
         callback: Callable[
-            [bytes, dict[str, Any] | None, int, bytes, ReceiverLink, Properties | None],
+            [
+                bytes | memoryview,
+                dict[str, Any] | None,
+                int,
+                bytes,
+                ReceiverLink,
+                Properties | None,
+            ],
             Any,
         ],
         name: str,
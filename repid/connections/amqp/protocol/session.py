@@ -516,7 +516,14 @@ class Session:
         self,
         address: str,
         callback: Callable[
-            [bytes, dict[str, Any] | None, int, bytes, ReceiverLink, Properties | None],
+            [
+                bytes | memoryview,
+                dict[str, Any] | None,
+                int,
+                bytes,
+                ReceiverLink,
+                Properties | None,
+            ],
             Any,
         ],
         name: str | None = None,
@@ -573,7 +580,14 @@ class Session:
         address: str,
         name: str,
         callback: Callable[
-            [bytes, dict[str, Any] | None, int, bytes, ReceiverLink, Properties | None],
+            [
+                bytes | memoryview,
+                dict[str, Any] | None,
+                int,
+                bytes,
+                ReceiverLink,
+                Properties | None,
+            ],
             Any,
         ],
     ) -> ReceiverLink:
@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING
 
 from typing_extensions import Self
 
-from repid.connections.amqp._uamqp._decode import bytes_to_performative
+from repid.connections.amqp._uamqp._decode import frame_body_to_performative
 from repid.connections.amqp._uamqp._encode import performative_to_bytes
 from repid.connections.amqp._uamqp.performatives import Performative
 
@@ -121,11 +121,14 @@ class FrameBuffer:
 
     def peek(self, n: int) -> bytes:
         """Peek at the first n bytes without consuming."""
-        return bytes(self._buffer[:n])
+        with memoryview(self._buffer) as view:
+            return view[:n].tobytes()
 
     def consume(self, n: int) -> bytes:
         """Consume and return the first n bytes."""
-        data = bytes(self._buffer[:n])
+        # slicing bytearray would copy the bytes twice, once into a new bytearray
+        with memoryview(self._buffer) as view:
+            data = view[:n].tobytes()
         del self._buffer[:n]
         return data
 
@@ -476,9 +479,10 @@ class AmqpTransport:
             else:
                 payload = b""
 
-            # Decode performative
-            full_frame = header_data + payload
-            performative = bytes_to_performative(full_frame)
+            # Decode performative, the header is already parsed, don't copy the body to join them
+            performative = frame_body_to_performative(
+                memoryview(payload)[body_start - FRAME_HEADER_SIZE :],
+            )
 
             if frame_type == 0 and performative.FRAME_TYPE != b"\x00":
                 raise FrameError("SASL performative received in AMQP frame")
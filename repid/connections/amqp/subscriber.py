@@ -108,7 +108,7 @@ class AmqpSubscriber:
         for queue, callback in queues_to_callbacks.items():
             # Create wrapper callback that handles the message
             async def wrapped_callback(  # noqa: PLR0917
-                payload: bytes,
+                payload: bytes | memoryview,
                 headers: dict[str, Any] | None,
                 delivery_id: int,
                 delivery_tag: bytes,
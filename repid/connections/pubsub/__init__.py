@@ -5,7 +5,7 @@ This module provides a Pub/Sub server implementation with:
 - Automatic emulator detection via PUBSUB_EMULATOR_HOST
 - Resilience mechanisms (exponential backoff, jitter, stability reset)
 - StreamingPull for efficient message delivery
-- Server-side flow control via max_outstanding_messages
+- Server-side flow control via max_outstanding_messages and max_outstanding_bytes
 """
 
 from .helpers import ChannelOverride as ChannelOverride
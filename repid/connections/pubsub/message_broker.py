@@ -73,6 +73,7 @@ class PubsubServer:
         stability_threshold: float = 60.0,
         # Subscriber configuration
         stream_ack_deadline_seconds: int = 300,
+        max_outstanding_bytes: int = 0,
         # Dependency injection for testability
         credentials_provider: CredentialsProvider | None = None,
     ) -> None:
@@ -103,8 +104,9 @@ class PubsubServer:
             reconnect_jitter_factor: Jitter factor (0.0-1.0) for retry delays.
             stability_threshold: Seconds of stability before resetting retry counter.
             stream_ack_deadline_seconds: Ack deadline for StreamingPull.
-            max_outstanding_messages: Flow control for outstanding messages.
-            max_outstanding_bytes: Flow control for outstanding bytes (0=unlimited).
+            max_outstanding_bytes: Server-side flow control for payload bytes, which were
+                delivered, but not yet acked (0=unlimited). Useful together with worker's
+                `max_inflight_bytes`, as the subscriber can't be paused cheaply.
             credentials_provider: Custom credentials provider for auth. Overrides
                 automatic credential selection.
             channel_factory: Custom gRPC channel factory.
@@ -136,6 +138,7 @@ class PubsubServer:
 
         # Subscriber configuration
         self._stream_ack_deadline_seconds = stream_ack_deadline_seconds
+        self._max_outstanding_bytes = max_outstanding_bytes
 
         # Determine credentials provider
         # Priority: explicit credentials_provider > use_google_auth flag > DSN-based detection
@@ -400,6 +403,7 @@ class PubsubServer:
             stream_ack_deadline_seconds=self._stream_ack_deadline_seconds,
             client_id=self._client_id,
             concurrency_limit=concurrency_limit,
+            max_outstanding_bytes=self._max_outstanding_bytes,
             server=self,
         )
         self._active_subscribers.append(subscriber)
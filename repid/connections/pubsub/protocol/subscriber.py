@@ -30,7 +30,7 @@ class PubsubSubscriber:
     """Pub/Sub subscriber using StreamingPull with resilience.
 
     Uses StreamingPull for efficient message delivery and flow control via
-    max_outstanding_messages. Ack/nack/deadline operations use unary RPCs.
+    max_outstanding_messages and max_outstanding_bytes. Ack/nack/deadline operations use unary RPCs.
     """
 
     def __init__(
@@ -44,6 +44,7 @@ class PubsubSubscriber:
         client_id: str,
         concurrency_limit: int | None,
         server: PubsubServer,
+        max_outstanding_bytes: int = 0,
         heartbeat_interval: float = 25.0,
         error_retry_delay: float = 1.0,
     ) -> None:
@@ -54,6 +55,7 @@ class PubsubSubscriber:
         self._stream_ack_deadline_seconds = stream_ack_deadline_seconds
         self._client_id = client_id
         self._concurrency_limit = concurrency_limit
+        self._max_outstanding_bytes = max_outstanding_bytes
         self._server = server
         self._heartbeat_interval = heartbeat_interval
         self._error_retry_delay = error_retry_delay
@@ -83,6 +85,7 @@ class PubsubSubscriber:
         client_id: str,
         concurrency_limit: int | None,
         server: PubsubServer,
+        max_outstanding_bytes: int = 0,
     ) -> PubsubSubscriber:
         """Create and start a new subscriber."""
         subscriber = cls(
@@ -94,6 +97,7 @@ class PubsubSubscriber:
             client_id=client_id,
             concurrency_limit=concurrency_limit,
             server=server,
+            max_outstanding_bytes=max_outstanding_bytes,
         )
         subscriber._start_background_tasks()
         return subscriber
@@ -189,7 +193,7 @@ class PubsubSubscriber:
             stream_ack_deadline_seconds=self._stream_ack_deadline_seconds,
             client_id=self._client_id,
             max_outstanding_messages=self._concurrency_limit or 0,
-            max_outstanding_bytes=0,
+            max_outstanding_bytes=self._max_outstanding_bytes,
         )
 
         while not self._shutdown_event.is_set():
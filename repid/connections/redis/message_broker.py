@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 import uuid
 from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
@@ -17,6 +16,7 @@ from redis.backoff import ExponentialBackoff
 from redis.exceptions import ResponseError
 from redis.retry import Retry
 
+from repid._utils import json_dumps, json_loads
 from repid.connections.abc import (
     CapabilitiesT,
     MessageAction,
@@ -65,7 +65,7 @@ def _build_message_fields(
     """Build Redis stream message fields from payload, headers, and content type."""
     fields: dict[bytes, bytes | str] = {b"payload": payload}
     if headers:
-        fields[b"headers"] = json.dumps(headers)
+        fields[b"headers"] = json_dumps(headers)
     if content_type:
         fields[b"content_type"] = content_type
     if reply_to:
@@ -84,9 +84,7 @@ def _parse_message_fields(
     headers: dict[str, str] | None = None
     headers_raw = fields.get(b"headers")
     if headers_raw:
-        if isinstance(headers_raw, bytes):
-            headers_raw = headers_raw.decode()
-        headers = json.loads(headers_raw)
+        headers = json_loads(headers_raw)
 
     content_type: str | None = None
     content_type_raw = fields.get(b"content_type")
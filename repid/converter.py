@@ -1,31 +1,65 @@
 from __future__ import annotations
 
-import asyncio
+import copy
 import inspect
 import itertools
-import json
+import logging
 from collections.abc import Callable, Coroutine, Iterable
-from typing import TYPE_CHECKING, Any, Protocol, cast, get_args
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Any, Protocol, cast, get_args, get_origin
 
 from repid._utils import is_installed
+from repid.codecs import MsgpackCodec, get_codec
+from repid.compression import decompress_payload
 from repid.data import ConverterInputSchema
 from repid.data.actor import ActorExecutionContext
+from repid.dependencies._plan import _collect_worker_dependencies, _DependencyPlan
 from repid.dependencies._utils import DependencyContext, get_dependency, get_full_payload_marker
 from repid.dependencies.depends import Depends as DependsClass
 from repid.dependencies.header_dependency import Header
+from repid.profiling import _stage
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
+    from repid.codecs import CodecT
     from repid.connections.abc import ReceivedMessageT
     from repid.data import ActorData, CorrelationId
     from repid.dependencies._utils import DependencyT
 
 if is_installed("pydantic"):
-    from pydantic import BaseModel, Field, create_model
+    from pydantic import BaseModel, Field, RootModel, TypeAdapter, create_model
     from pydantic.fields import FieldInfo
+    from typing_extensions import NotRequired, TypedDict
+
+if is_installed("msgspec"):
+    import msgspec
+
 
+logger = logging.getLogger("repid")
 
 FnParams = tuple[list, dict]
 
+# content types, which are validated straight from JSON, without decoding with a codec first
+_JSON_CONTENT_TYPES = (None, "", "application/json")
+
+
+def _decode(
+    payload: bytes | memoryview,
+    content_type: str | None,
+    codec: CodecT | None = None,
+) -> Any:
+    if not payload:
+        return {}
+    return (codec or get_codec(content_type)).decode(payload)
+
+
+def _json_input(payload: bytes | memoryview) -> bytes:
+    # pydantic only validates JSON from str, bytes or bytearray, copy views at the last moment
+    if not payload:
+        return b"{}"
+    return payload if isinstance(payload, bytes) else payload.tobytes()
+
 
 async def _resolve_dependencies(  # noqa: PLR0917
     message: ReceivedMessageT,
@@ -35,8 +69,11 @@ async def _resolve_dependencies(  # noqa: PLR0917
     parsed_kwargs: dict[str, Any],
     parsed_headers: dict[str, Any],
     headers_id_to_name: dict[int, str],
-    dependencies: dict[str, DependencyT],
+    dependencies: _DependencyPlan,
 ) -> dict[str, Any]:
+    if not dependencies:
+        return {}
+
     context = DependencyContext(
         message=message,
         actor=actor,
@@ -47,18 +84,8 @@ async def _resolve_dependencies(  # noqa: PLR0917
         headers_id_to_name=headers_id_to_name,
     )
 
-    unresolved_dependencies: dict[str, Coroutine] = {
-        dep_name: dep.resolve(context=context) for dep_name, dep in dependencies.items()
-    }
-
-    unresolved_dependencies_names, unresolved_dependencies_values = (
-        unresolved_dependencies.keys(),
-        unresolved_dependencies.values(),
-    )
-
-    resolved = await asyncio.gather(*unresolved_dependencies_values)
-
-    return dict(zip(unresolved_dependencies_names, resolved, strict=False))
+    with _stage("dependencies"):
+        return await dependencies.resolve(context)
 
 
 class ConverterT(Protocol):
@@ -118,6 +145,91 @@ class DefaultConverter:
         raise NotImplementedError  # pragma: no cover
 
 
+class _LazyConverter:
+    """Builds the converter on its first use (the first message for the actor or generation of
+    the schema), so that startup doesn't pay for inspecting all of the actors at once.
+
+    Failure to build the converter is remembered, so that it is logged once and the same error
+    is raised for every following message. `_check` only inspects the signature, which is cheap
+    enough to do for every actor when the worker starts."""
+
+    __slots__ = (
+        "_converter",
+        "_converter_cls",
+        "_correlation_id",
+        "_error",
+        "_error_traceback",
+        "_fn",
+        "_fn_locals",
+    )
+
+    def __init__(
+        self,
+        converter_cls: Callable[..., ConverterT],
+        fn: Callable[..., Coroutine],
+        *,
+        fn_locals: dict[str, Any] | None = None,
+        correlation_id: CorrelationId | None,
+    ) -> None:
+        self._converter_cls = converter_cls
+        self._fn = fn
+        self._fn_locals = fn_locals
+        self._correlation_id = correlation_id
+        self._converter: ConverterT | None = None
+        self._error: Exception | None = None
+        self._error_traceback: TracebackType | None = None
+
+    def _check(self) -> list[DependsClass]:
+        """Evaluate the annotations of the function and collect worker-scoped dependencies
+        from its signature, without building the converter."""
+        local = self._fn_locals.copy() if self._fn_locals is not None else {}
+        local.update(self._fn.__globals__)
+        signature = inspect.signature(
+            self._fn,
+            eval_str=True,
+            locals=local,
+            globals=self._fn.__globals__,
+        )
+        return _collect_worker_dependencies(
+            dep
+            for p in signature.parameters.values()
+            if (dep := get_dependency(p.annotation)) is not None
+        )
+
+    def _resolve(self) -> ConverterT:
+        if self._converter is None:
+            if self._error is not None:
+                raise self._error.with_traceback(self._error_traceback)
+            try:
+                self._converter = self._converter_cls(
+                    self._fn,
+                    fn_locals=self._fn_locals,
+                    correlation_id=self._correlation_id,
+                )
+            except Exception as exc:
+                logger.exception("actor.converter.error")
+                self._error = exc
+                self._error_traceback = exc.__traceback__
+                raise
+        return self._converter
+
+    async def convert_inputs(
+        self,
+        *,
+        message: ReceivedMessageT,
+        actor: ActorData,
+        actor_context: ActorExecutionContext,
+    ) -> FnParams:
+        return await self._resolve().convert_inputs(
+            message=message,
+            actor=actor,
+            actor_context=actor_context,
+        )
+
+    def get_input_schema(self) -> ConverterInputSchema:
+        return self._resolve().get_input_schema()
+
+
 class BasicConverter:
     def __init__(
         self,
@@ -168,6 +280,9 @@ class BasicConverter:
             signature,
             self.dependency_kwargs,
         )
+        self._args_defaults = tuple(self.args.items())
+        self._kwargs_defaults = tuple(self.kwargs.items())
+        self._dependency_plan = _DependencyPlan(self.dependency_kwargs)
 
     @staticmethod
     def _build_headers_id_to_name_mapping(
@@ -203,11 +318,10 @@ class BasicConverter:
         return defaults
 
     def _parse_payload(self, message: ReceivedMessageT) -> dict[str, Any]:
-        if not message.payload:
+        payload = decompress_payload(message)
+        if not payload:
             return {}
-        if message.content_type not in (None, "", "application/json"):
-            raise ValueError(f"Unsupported content type: {message.content_type}")
-        parsed = json.loads(message.payload)
+        parsed = get_codec(message.content_type).decode(payload)
         if not isinstance(parsed, dict):
             raise ValueError("Payload must be a JSON dict object.")
         return cast(dict[str, Any], parsed)
@@ -219,15 +333,19 @@ class BasicConverter:
         actor: ActorData,
         actor_context: ActorExecutionContext,
     ) -> FnParams:
-        loaded = self._parse_payload(message)
+        with _stage("decode"):
+            loaded = self._parse_payload(message)
 
-        args = [loaded.pop(name, self.args[name]) for name in self.args]
-        kwargs = {name: loaded.pop(name, self.kwargs[name]) for name in self.kwargs}
+        args = [loaded.pop(name, default) for name, default in self._args_defaults]
+        kwargs = {name: loaded.pop(name, default) for name, default in self._kwargs_defaults}
         if self.all_kwargs:
             kwargs.update(loaded)
         elif self.all_args:
             args.extend(loaded.values())
 
+        if not self.dependency_kwargs:
+            return (args, kwargs)
+
         resolved = await _resolve_dependencies(
             message=message,
             actor=actor,
@@ -236,7 +354,7 @@ class BasicConverter:
             parsed_kwargs={**kwargs, **loaded},
             parsed_headers={**self.header_defaults, **(message.headers or {})},
             headers_id_to_name=self.headers_id_to_name,
-            dependencies=self.dependency_kwargs,
+            dependencies=self._dependency_plan,
         )
         kwargs.update(resolved)
         return (args, kwargs)
@@ -280,6 +398,22 @@ class PydanticConverter:
             self.dependency_kwargs,
         )
         self.headers_id_to_name = self._build_headers_id_to_name_mapping(self.dependency_kwargs)
+        self.unwrap_root = self.root_arg is not None and not (
+            inspect.isclass(self.root_arg[1]) and issubclass(self.root_arg[1], BaseModel)
+        )
+        # binding plan, which is compiled once instead of being derived for every message
+        self._payload_fields = (
+            tuple(self.payload_pydantic_model.model_fields)
+            if self.payload_pydantic_model is not None
+            else ()
+        )
+        self._headers_fields = (
+            tuple(self.headers_pydantic_model.model_fields)
+            if self.headers_pydantic_model is not None
+            else ()
+        )
+        self._payload_only = not self.dependency_kwargs and self.root_arg is None
+        self._dependency_plan = _DependencyPlan(self.dependency_kwargs)
 
     @staticmethod
     def _parse_signature(
@@ -315,6 +449,33 @@ class PydanticConverter:
         dependency_kwargs: dict[str, DependencyT],
         root_arg: tuple[str, type] | None = None,
     ) -> type[BaseModel] | None:
+        fields = PydanticConverter._collect_payload_fields(signature, dependency_kwargs, root_arg)
+
+        if root_arg is not None:
+            root_type = root_arg[1]
+            if not (inspect.isclass(root_type) and issubclass(root_type, BaseModel)):
+                if fields:
+                    raise ValueError(
+                        "FullPayload() of a non-model type can't be combined with other arguments.",
+                    )
+                return create_model(model_name, __base__=RootModel[root_type])  # type: ignore[valid-type]
+            if not fields:
+                return root_type
+            return create_model(model_name, __base__=root_type, **fields)  # type: ignore[call-overload, no-any-return]
+
+        if not fields:
+            return None
+
+        return create_model(model_name, **fields)  # type: ignore[call-overload, no-any-return]
+
+    @staticmethod
+    def _collect_payload_fields(
+        signature: inspect.Signature,
+        dependency_kwargs: dict[str, DependencyT],
+        root_arg: tuple[str, type] | None = None,
+    ) -> dict[str, tuple[Any, Any]]:
+        """Collects payload fields (as `(annotation, default)` pairs) from the actor's signature
+        and from the payload arguments of its dependencies."""
         root_arg_name = root_arg[0] if root_arg is not None else None
         fields: dict[str, tuple[Any, Any]] = {
             p.name: (
@@ -363,17 +524,7 @@ class PydanticConverter:
                 param.annotation if param.annotation is not inspect.Parameter.empty else Any,
                 param.default if param.default is not inspect.Parameter.empty else Field(),
             )
-
-        if root_arg is not None:
-            root_type = root_arg[1]
-            if not fields:
-                return root_type
-            return create_model(model_name, __base__=root_type, **fields)  # type: ignore[call-overload, no-any-return]
-
-        if not fields:
-            return None
-
-        return create_model(model_name, **fields)  # type: ignore[call-overload, no-any-return]
+        return fields
 
     @staticmethod
     def _build_headers_model(
@@ -381,6 +532,19 @@ class PydanticConverter:
         signature: inspect.Signature,
         dependency_kwargs: dict[str, DependencyT],
     ) -> type[BaseModel] | None:
+        header_fields = PydanticConverter._collect_header_fields(signature, dependency_kwargs)
+        if not header_fields:
+            return None
+
+        return create_model(model_name, **header_fields)  # type: ignore[call-overload, no-any-return]
+
+    @staticmethod
+    def _collect_header_fields(
+        signature: inspect.Signature,
+        dependency_kwargs: dict[str, DependencyT],
+    ) -> dict[str, tuple[Any, Any]]:
+        """Collects header fields (as `(annotation, default)` pairs) from `Header` dependencies
+        of the actor and of its dependencies."""
         header_fields: dict[str, tuple[Any, Any]] = {}
         for name, dependency in dependency_kwargs.items():
             if isinstance(dependency, Header):
@@ -458,11 +622,7 @@ class PydanticConverter:
                         if header_parameter.default is not inspect.Parameter.empty
                         else Field(),
                     )
-
-        if not header_fields:
-            return None
-
-        return create_model(model_name, **header_fields)  # type: ignore[call-overload, no-any-return]
+        return header_fields
 
     @staticmethod
     def _build_headers_id_to_name_mapping(
@@ -480,9 +640,10 @@ class PydanticConverter:
     def _parse_payload(self, message: ReceivedMessageT) -> BaseModel | None:
         if self.payload_pydantic_model is None:
             return None
-        if message.content_type not in (None, "", "application/json"):
-            raise ValueError(f"Unsupported content type: {message.content_type}")
-        return self.payload_pydantic_model.model_validate_json(message.payload or b"{}")
+        payload = decompress_payload(message)
+        if message.content_type in _JSON_CONTENT_TYPES:
+            return self.payload_pydantic_model.model_validate_json(_json_input(payload))
+        return self.payload_pydantic_model.model_validate(_decode(payload, message.content_type))
 
     def _parse_headers(self, message: ReceivedMessageT) -> BaseModel | None:
         if self.headers_pydantic_model is None:
@@ -496,20 +657,33 @@ class PydanticConverter:
         actor: ActorData,
         actor_context: ActorExecutionContext,
     ) -> FnParams:
-        validated_payload = self._parse_payload(message)
-        validated_headers = self._parse_headers(message)
+        if self._payload_only:
+            # without dependencies headers aren't parsed, arguments are taken from the payload
+            with _stage("decode"):
+                validated_payload = self._parse_payload(message)
+            if validated_payload is None:
+                return ([], {})
+            return (
+                [getattr(validated_payload, name) for name in self.args],
+                {name: getattr(validated_payload, name) for name in self.kwargs},
+            )
+
+        with _stage("decode"):
+            validated_payload = self._parse_payload(message)
+            validated_headers = self._parse_headers(message)
         parsed_headers = (
-            {
-                name: getattr(validated_headers, name)
-                for name in self.headers_pydantic_model.model_fields
-            }
-            if validated_headers is not None and self.headers_pydantic_model is not None
+            {name: getattr(validated_headers, name) for name in self._headers_fields}
+            if validated_headers is not None
             else {}
         )
 
         if self.root_arg is not None:
             root_arg_name = self.root_arg[0]
-            fn_kwargs: dict[str, Any] = {root_arg_name: validated_payload}
+            fn_kwargs: dict[str, Any] = {
+                root_arg_name: validated_payload.root  # type: ignore[union-attr]
+                if self.unwrap_root
+                else validated_payload,
+            }
             for name in self.kwargs:
                 fn_kwargs[name] = getattr(validated_payload, name)
             args: list[Any] = (
@@ -523,16 +697,13 @@ class PydanticConverter:
                 parsed_kwargs=fn_kwargs,
                 parsed_headers=parsed_headers,
                 headers_id_to_name=self.headers_id_to_name,
-                dependencies=self.dependency_kwargs,
+                dependencies=self._dependency_plan,
             )
             return (args, {**fn_kwargs, **resolved})
 
         loaded = (
-            {
-                name: getattr(validated_payload, name)
-                for name in self.payload_pydantic_model.model_fields
-            }
-            if validated_payload is not None and self.payload_pydantic_model is not None
+            {name: getattr(validated_payload, name) for name in self._payload_fields}
+            if validated_payload is not None
             else {}
         )
         # if there are positional args - pop them from loaded
@@ -545,7 +716,7 @@ class PydanticConverter:
             parsed_kwargs=loaded,
             parsed_headers=parsed_headers,
             headers_id_to_name=self.headers_id_to_name,
-            dependencies=self.dependency_kwargs,
+            dependencies=self._dependency_plan,
         )
         kwargs = {name: value for name, value in loaded.items() if name in self.kwargs}
         return (args, {**kwargs, **resolved})
@@ -569,3 +740,459 @@ class PydanticConverter:
             ),
             correlation_id=self.correlation_id,
         )
+
+
+class PydanticDictConverter:
+    """Validates the payload with a `TypeAdapter` of a `TypedDict` straight into a dict of
+    arguments, without creating model instances, which `PydanticConverter` does.
+
+    Headers, which are all annotated as `str`, are passed through without validation.
+    `FullPayload()` isn't supported, as there is no model to validate the payload into."""
+
+    def __init__(
+        self,
+        fn: Callable[..., Coroutine],
+        *,
+        fn_locals: dict[str, Any] | None = None,
+        correlation_id: CorrelationId | None,
+    ) -> None:
+        self.fn = fn
+        self.correlation_id = correlation_id
+        local = fn_locals.copy() if fn_locals is not None else {}
+        local.update(fn.__globals__)
+        signature = inspect.signature(
+            fn,
+            eval_str=True,
+            locals=local,
+            globals=fn.__globals__,
+        )
+
+        self.args, self.kwargs, self.dependency_kwargs, root_arg = (
+            PydanticConverter._parse_signature(signature)
+        )
+        if root_arg is not None:
+            raise ValueError("FullPayload() requires PydanticConverter.")
+
+        payload_fields = PydanticConverter._collect_payload_fields(
+            signature,
+            self.dependency_kwargs,
+        )
+        self.payload_adapter, self._payload_defaults = self._build_adapter(
+            f"{fn.__name__}_payload",
+            payload_fields,
+        )
+
+        self._header_fields = PydanticConverter._collect_header_fields(
+            signature,
+            self.dependency_kwargs,
+        )
+        self._headers_adapter: TypeAdapter | None = None
+        self._header_defaults: tuple[tuple[str, FieldInfo], ...] = ()
+        self._raw_headers = all(
+            (get_args(annotation)[0] if get_origin(annotation) is Annotated else annotation)
+            in (str, Any)
+            for annotation, _ in self._header_fields.values()
+        )
+        if self._header_fields and not self._raw_headers:
+            self._headers_adapter, self._header_defaults = self._build_adapter(
+                f"{fn.__name__}_headers",
+                self._header_fields,
+            )
+        self.headers_id_to_name = PydanticConverter._build_headers_id_to_name_mapping(
+            self.dependency_kwargs,
+        )
+        self._dependency_plan = _DependencyPlan(self.dependency_kwargs)
+
+    @staticmethod
+    def _build_adapter(
+        name: str,
+        fields: dict[str, tuple[Any, Any]],
+    ) -> tuple[TypeAdapter | None, tuple[tuple[str, FieldInfo], ...]]:
+        """Builds an adapter of a `TypedDict` with the fields. Fields with defaults are
+        `NotRequired`, their defaults are returned separately to be filled in after validation."""
+        if not fields:
+            return None, ()
+        annotations: dict[str, Any] = {}
+        defaults: list[tuple[str, FieldInfo]] = []
+        for field_name, (annotation, default) in fields.items():
+            field_info = default if isinstance(default, FieldInfo) else Field(default=default)
+            if field_info.is_required():
+                annotations[field_name] = Annotated[annotation, field_info]
+            else:
+                annotations[field_name] = NotRequired[Annotated[annotation, field_info]]
+                defaults.append((field_name, field_info))
+        typed_dict = TypedDict(name, annotations)  # type: ignore[misc]
+        return TypeAdapter(typed_dict), tuple(defaults)
+
+    @staticmethod
+    def _fill_defaults(
+        values: dict[str, Any],
+        defaults: tuple[tuple[str, FieldInfo], ...],
+    ) -> dict[str, Any]:
+        for name, field_info in defaults:
+            if name not in values:
+                values[name] = copy.deepcopy(field_info.get_default(call_default_factory=True))
+        return values
+
+    def _parse_payload(self, message: ReceivedMessageT) -> dict[str, Any]:
+        if self.payload_adapter is None:
+            return {}
+        payload = decompress_payload(message)
+        return self._fill_defaults(
+            self.payload_adapter.validate_json(_json_input(payload))
+            if message.content_type in _JSON_CONTENT_TYPES
+            else self.payload_adapter.validate_python(_decode(payload, message.content_type)),
+            self._payload_defaults,
+        )
+
+    def _parse_headers(self, message: ReceivedMessageT) -> dict[str, Any]:
+        if not self._header_fields:
+            return {}
+        headers = message.headers or {}
+        if self._headers_adapter is not None:
+            return self._fill_defaults(
+                self._headers_adapter.validate_python(headers),
+                self._header_defaults,
+            )
+        parsed: dict[str, Any] = {}
+        for name, (_, default) in self._header_fields.items():
+            if name in headers:
+                parsed[name] = headers[name]
+            elif isinstance(default, FieldInfo) and default.is_required():
+                # let pydantic raise the same validation error, as for validated headers
+                self._get_headers_adapter().validate_python(headers)
+            else:
+                parsed[name] = (
+                    default.get_default(call_default_factory=True)
+                    if isinstance(default, FieldInfo)
+                    else default
+                )
+        return parsed
+
+    def _get_headers_adapter(self) -> TypeAdapter:
+        if self._headers_adapter is None:
+            self._headers_adapter, self._header_defaults = self._build_adapter(
+                f"{self.fn.__name__}_headers",
+                self._header_fields,
+            )
+        return self._headers_adapter  # type: ignore[return-value]
+
+    async def convert_inputs(
+        self,
+        *,
+        message: ReceivedMessageT,
+        actor: ActorData,
+        actor_context: ActorExecutionContext,
+    ) -> FnParams:
+        with _stage("decode"):
+            loaded = self._parse_payload(message)
+            parsed_headers = self._parse_headers(message)
+
+        args = [loaded.pop(name) for name in self.args] if self.args else []
+        if not self.dependency_kwargs:
+            return (args, loaded)
+
+        resolved = await _resolve_dependencies(
+            message=message,
+            actor=actor,
+            actor_context=actor_context,
+            parsed_args=args,
+            parsed_kwargs=loaded,
+            parsed_headers=parsed_headers,
+            headers_id_to_name=self.headers_id_to_name,
+            dependencies=self._dependency_plan,
+        )
+        kwargs = {name: loaded[name] for name in self.kwargs}
+        return (args, {**kwargs, **resolved})
+
+    def get_input_schema(self) -> ConverterInputSchema:
+        headers_adapter = self._get_headers_adapter() if self._header_fields else None
+        return ConverterInputSchema(
+            payload_schema=(
+                self.payload_adapter.json_schema(ref_template="#/components/schemas/{model}")
+                if self.payload_adapter is not None
+                else None
+            ),
+            content_type="application/json" if self.payload_adapter is not None else "",
+            headers_schema=(
+                headers_adapter.json_schema(ref_template="#/components/schemas/{model}")
+                if headers_adapter is not None
+                else None
+            ),
+            correlation_id=self.correlation_id,
+        )
+
+
+class MsgspecConverter:
+    """Decodes the payload in a single pass with a `msgspec.json.Decoder` of a `msgspec.Struct`,
+    which is built from the actor's signature. Headers are converted in lax mode, so that e.g.
+    `"5"` is accepted for an `int` header.
+
+    `FullPayload()` accepts a `msgspec.Struct` subclass, which can be combined with other
+    arguments, or any other type supported by msgspec, which can't."""
+
+    def __init__(
+        self,
+        fn: Callable[..., Coroutine],
+        *,
+        fn_locals: dict[str, Any] | None = None,
+        correlation_id: CorrelationId | None,
+    ) -> None:
+        self.fn = fn
+        self.correlation_id = correlation_id
+        local = fn_locals.copy() if fn_locals is not None else {}
+        local.update(fn.__globals__)
+        signature = inspect.signature(
+            fn,
+            eval_str=True,
+            locals=local,
+            globals=fn.__globals__,
+        )
+
+        self.args, self.kwargs, self.dependency_kwargs, self.root_arg = (
+            PydanticConverter._parse_signature(signature)
+        )
+
+        payload_fields = self._collect_payload_fields(
+            signature,
+            self.dependency_kwargs,
+            self.root_arg,
+        )
+        self.payload_type = self._build_payload_type(
+            f"{fn.__name__}_payload",
+            payload_fields,
+            self.root_arg,
+        )
+        self._payload_decoder = (
+            msgspec.json.Decoder(self.payload_type) if self.payload_type is not None else None
+        )
+        self._msgpack_decoder = (
+            msgspec.msgpack.Decoder(self.payload_type) if self.payload_type is not None else None
+        )
+        self._payload_fields = tuple(payload_fields)
+
+        header_fields = self._collect_header_fields(signature, self.dependency_kwargs)
+        # header names aren't necessarily valid identifiers, so struct fields are renamed
+        self._header_attributes = tuple((f"h{i}", name) for i, name in enumerate(header_fields))
+        self.headers_type = (
+            self._build_struct(
+                f"{fn.__name__}_headers",
+                {attribute: header_fields[name] for attribute, name in self._header_attributes},
+                rename=dict(self._header_attributes),
+            )
+            if header_fields
+            else None
+        )
+
+        self.headers_id_to_name = PydanticConverter._build_headers_id_to_name_mapping(
+            self.dependency_kwargs,
+        )
+        self._payload_only = not self.dependency_kwargs and self.root_arg is None
+        self._dependency_plan = _DependencyPlan(self.dependency_kwargs)
+
+    @staticmethod
+    def _add_field(
+        fields: dict[str, tuple[Any, Any]],
+        name: str,
+        param: inspect.Parameter,
+        conflict_error: str,
+    ) -> None:
+        field = (
+            param.annotation if param.annotation is not inspect.Parameter.empty else Any,
+            param.default if param.default is not inspect.Parameter.empty else msgspec.NODEFAULT,
+        )
+        if name in fields:
+            if fields[name] != field:
+                raise ValueError(conflict_error)
+            # declaration matches, so we can just skip the parameter
+            return
+        fields[name] = field
+
+    @staticmethod
+    def _collect_payload_fields(
+        signature: inspect.Signature,
+        dependency_kwargs: dict[str, DependencyT],
+        root_arg: tuple[str, type] | None,
+    ) -> dict[str, tuple[Any, Any]]:
+        """Collects payload fields (as `(annotation, default)` pairs) from the actor's signature
+        and from the payload arguments of its dependencies."""
+        root_arg_name = root_arg[0] if root_arg is not None else None
+        fields: dict[str, tuple[Any, Any]] = {}
+        for p in signature.parameters.values():
+            if p.name not in dependency_kwargs and p.name != root_arg_name:
+                MsgspecConverter._add_field(fields, p.name, p, "")
+
+        for dependency in dependency_kwargs.values():
+            if isinstance(dependency, DependsClass):
+                for param in dependency._iter_payload_arguments():
+                    MsgspecConverter._add_field(
+                        fields,
+                        param.name,
+                        param,
+                        f"Conflicting field '{param.name}' in Depends and top-level parameters.",
+                    )
+        return fields
+
+    @staticmethod
+    def _collect_header_fields(
+        signature: inspect.Signature,
+        dependency_kwargs: dict[str, DependencyT],
+    ) -> dict[str, tuple[Any, Any]]:
+        """Collects header fields (as `(annotation, default)` pairs) from `Header` dependencies
+        of the actor and of its dependencies."""
+        fields: dict[str, tuple[Any, Any]] = {}
+        for name, dependency in dependency_kwargs.items():
+            if isinstance(dependency, Header):
+                header_name = dependency._name or name
+                MsgspecConverter._add_field(
+                    fields,
+                    header_name,
+                    signature.parameters[name],
+                    f"Conflicting re-declaration of header '{header_name}'.",
+                )
+            elif isinstance(dependency, DependsClass):
+                for header_dependency, param in dependency._iter_header_arguments():
+                    header_name = header_dependency._name or param.name
+                    MsgspecConverter._add_field(
+                        fields,
+                        header_name,
+                        param,
+                        f"Conflicting re-declaration of header '{header_name}' in Depends.",
+                    )
+        return fields
+
+    @staticmethod
+    def _build_struct(
+        name: str,
+        fields: dict[str, tuple[Any, Any]],
+        *,
+        bases: tuple[type, ...] | None = None,
+        rename: dict[str, str] | None = None,
+    ) -> type[msgspec.Struct]:
+        struct_fields: list[tuple[str, Any] | tuple[str, Any, Any]] = []
+        for field_name, (annotation, default) in fields.items():
+            if default is msgspec.NODEFAULT:
+                struct_fields.append((field_name, annotation))
+            elif isinstance(default, list | dict | set | bytearray) and default:
+                # msgspec only copies empty collections for every instance
+                struct_fields.append(
+                    (
+                        field_name,
+                        annotation,
+                        msgspec.field(default_factory=partial(copy.deepcopy, default)),
+                    ),
+                )
+            else:
+                struct_fields.append((field_name, annotation, default))
+        return msgspec.defstruct(name, struct_fields, bases=bases, kw_only=True, rename=rename)
+
+    @staticmethod
+    def _build_payload_type(
+        name: str,
+        fields: dict[str, tuple[Any, Any]],
+        root_arg: tuple[str, type] | None,
+    ) -> Any:
+        if root_arg is not None:
+            root_type = root_arg[1]
+            if not (inspect.isclass(root_type) and issubclass(root_type, msgspec.Struct)):
+                if fields:
+                    raise ValueError(
+                        "FullPayload() of a non-struct type can't be combined with other arguments.",
+                    )
+                return root_type
+            if not fields:
+                return root_type
+            return MsgspecConverter._build_struct(name, fields, bases=(root_type,))
+
+        if not fields:
+            return None
+
+        return MsgspecConverter._build_struct(name, fields)
+
+    def _parse_payload(self, message: ReceivedMessageT) -> Any:
+        if self._payload_decoder is None:
+            return None
+        payload = decompress_payload(message)
+        if message.content_type in _JSON_CONTENT_TYPES:
+            return self._payload_decoder.decode(payload or b"{}")
+        codec = get_codec(message.content_type)
+        if isinstance(codec, MsgpackCodec) and payload:
+            # msgspec validates MessagePack in one pass, same as JSON
+            return self._msgpack_decoder.decode(payload)  # type: ignore[union-attr]
+        return msgspec.convert(_decode(payload, message.content_type, codec), self.payload_type)
+
+    def _parse_headers(self, message: ReceivedMessageT) -> dict[str, Any]:
+        if self.headers_type is None:
+            return {}
+        headers = msgspec.convert(message.headers or {}, self.headers_type, strict=False)
+        return {name: getattr(headers, attribute) for attribute, name in self._header_attributes}
+
+    async def convert_inputs(
+        self,
+        *,
+        message: ReceivedMessageT,
+        actor: ActorData,
+        actor_context: ActorExecutionContext,
+    ) -> FnParams:
+        if self._payload_only:
+            # without dependencies headers aren't parsed, arguments are taken from the payload
+            with _stage("decode"):
+                payload = self._parse_payload(message)
+            if payload is None:
+                return ([], {})
+            return (
+                [getattr(payload, name) for name in self.args],
+                {name: getattr(payload, name) for name in self.kwargs},
+            )
+
+        with _stage("decode"):
+            payload = self._parse_payload(message)
+            parsed_headers = self._parse_headers(message)
+
+        loaded = (
+            {name: getattr(payload, name) for name in self._payload_fields}
+            if payload is not None
+            else {}
+        )
+        args = [loaded.pop(name) for name in self.args] if self.args else []
+        if self.root_arg is not None:
+            loaded[self.root_arg[0]] = payload
+        resolved = await _resolve_dependencies(
+            message=message,
+            actor=actor,
+            actor_context=actor_context,
+            parsed_args=args,
+            parsed_kwargs=loaded,
+            parsed_headers=parsed_headers,
+            headers_id_to_name=self.headers_id_to_name,
+            dependencies=self._dependency_plan,
+        )
+        kwargs = {name: loaded[name] for name in self.kwargs}
+        if self.root_arg is not None:
+            kwargs[self.root_arg[0]] = payload
+        return (args, {**kwargs, **resolved})
+
+    @staticmethod
+    def _json_schema(t: Any) -> dict[str, Any]:
+        ((schema,), components) = msgspec.json.schema_components(
+            [t],
+            ref_template="#/components/schemas/{name}",
+        )
+        if "$ref" in schema:
+            # inline the top-level struct, nested ones are extracted from `$defs` as components
+            schema = components.pop(schema["$ref"].rsplit("/", 1)[1])
+        if components:
+            schema["$defs"] = components
+        return schema
+
+    def get_input_schema(self) -> ConverterInputSchema:
+        return ConverterInputSchema(
+            payload_schema=(
+                self._json_schema(self.payload_type) if self.payload_type is not None else None
+            ),
+            content_type="application/json" if self.payload_type is not None else "",
+            headers_schema=(
+                self._json_schema(self.headers_type) if self.headers_type is not None else None
+            ),
+            correlation_id=self.correlation_id,
+        )
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from repid.converter import ConverterT
     from repid.data import ExternalDocs, Tag
     from repid.data.message_schema import ActorMessageMetadata
+    from repid.dependencies._scope import _WorkerScope
     from repid.serializer import SerializerT
 
 FnReturnT = TypeVar("FnReturnT")
@@ -29,6 +30,7 @@ class ActorExecutionContext:
     server: ServerT
     publish: MessagePublisherT
     default_serializer: SerializerT
+    worker_scope: _WorkerScope | None = None
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -59,3 +61,7 @@ class ActorData:
     bindings: OperationBindingsObject | None = None
     deprecated: bool = False
     message_schema: ActorMessageMetadata | None = None
+    batch_size: int | None = None
+    batch_linger: float = 0.1
+    max_concurrency: int | None = None
+    priority: int | None = None
@@ -58,3 +58,4 @@ class ActorMessageMetadata:
     external_docs: ExternalDocs | None = None
     examples: tuple[MessageExample, ...] | None = None
     bindings: MessageBindingsObject | None = None
+    content_type: str | None = None
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from repid.dependencies.depends import Depends
+from repid.dependencies.header_dependency import Header
+from repid.dependencies.message_dependency import MessageDependency
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from repid.dependencies._utils import DependencyContext, DependencyT
+
+# (inline, concurrent) dependencies of the same depth
+_Level = tuple[list["DependencyT"], list["DependencyT"]]
+
+
+def _is_inline(dependency: DependencyT) -> bool:
+    """Whether the dependency never awaits anything, so running it in a task is pure overhead."""
+    if isinstance(dependency, Depends):
+        return dependency._is_sync
+    return isinstance(dependency, (Header, MessageDependency))
+
+
+def _collect_worker_dependencies(dependencies: Iterable[DependencyT]) -> list[Depends]:
+    """Worker-scoped dependencies of the tree, in the same order as in the compiled plan."""
+    worker_dependencies: list[Depends] = []
+    seen: set[int] = set()
+
+    def visit(dependency: DependencyT) -> None:
+        if id(dependency) in seen or not isinstance(dependency, Depends):
+            return
+        seen.add(id(dependency))
+        if dependency._scope == "worker":
+            # resolved by the worker scope, which takes care of its sub-dependencies
+            worker_dependencies.append(dependency)
+            return
+        for sub in dependency._subdependencies.values():
+            visit(sub)
+
+    for dependency in dependencies:
+        visit(dependency)
+    return worker_dependencies
+
+
+class _DependencyPlan:
+    """Dependency tree of an actor, compiled into levels in topological order.
+
+    Every dependency instance is resolved once per message, even if it appears in several
+    branches of the tree. Dependencies which never await are called inline, the others are
+    gathered only if there is more than one of them on the same level. Worker-scoped dependencies
+    are taken from the worker scope before everything else.
+    """
+
+    __slots__ = ("_compiled_at", "_dependencies", "_levels", "worker_dependencies")
+
+    def __init__(self, dependencies: dict[str, DependencyT]) -> None:
+        self._dependencies = dependencies
+        self._compile()
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    def _compile(self) -> None:
+        self._compiled_at = Depends._overrides
+        depths: dict[int, int] = {}
+        nodes: list[tuple[int, DependencyT]] = []
+        worker_dependencies: list[Depends] = []
+
+        def visit(dependency: DependencyT) -> int:
+            key = id(dependency)
+            if key in depths:
+                return depths[key]
+            depth = 0
+            if isinstance(dependency, Depends) and dependency._scope == "worker":
+                # resolved by the worker scope, which takes care of its sub-dependencies
+                depths[key] = -1
+                worker_dependencies.append(dependency)
+                return -1
+            if isinstance(dependency, Depends):
+                depth = max(
+                    (visit(sub) + 1 for sub in dependency._subdependencies.values()),
+                    default=0,
+                )
+            depths[key] = depth
+            nodes.append((depth, dependency))
+            return depth
+
+        for dependency in self._dependencies.values():
+            visit(dependency)
+
+        levels: list[_Level] = [([], []) for _ in range(max(depths.values(), default=-1) + 1)]
+        for depth, dependency in nodes:
+            inline, concurrent = levels[depth]
+            (inline if _is_inline(dependency) else concurrent).append(dependency)
+        self._levels = levels
+        self.worker_dependencies = worker_dependencies
+
+    async def resolve(self, context: DependencyContext) -> dict[str, Any]:
+        if self._compiled_at != Depends._overrides:
+            self._compile()
+
+        values: dict[int, Any] = {}
+        for worker_dependency in self.worker_dependencies:
+            values[id(worker_dependency)] = await worker_dependency._resolve_in_worker_scope(
+                context,
+            )
+        for inline, concurrent in self._levels:
+            for dependency in inline:
+                values[id(dependency)] = await self._resolve_one(dependency, context, values)
+            if len(concurrent) == 1:
+                dependency = concurrent[0]
+                values[id(dependency)] = await self._resolve_one(dependency, context, values)
+            elif concurrent:
+                resolved = await asyncio.gather(
+                    *(self._resolve_one(dependency, context, values) for dependency in concurrent),
+                )
+                for dependency, value in zip(concurrent, resolved, strict=True):
+                    values[id(dependency)] = value
+
+        return {name: values[id(dependency)] for name, dependency in self._dependencies.items()}
+
+    @staticmethod
+    async def _resolve_one(
+        dependency: DependencyT,
+        context: DependencyContext,
+        values: dict[int, Any],
+    ) -> Any:
+        if isinstance(dependency, Depends):
+            return await dependency._call(
+                context,
+                {name: values[id(sub)] for name, sub in dependency._subdependencies.items()},
+            )
+        return await dependency.resolve(context=context)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from repid.dependencies.depends import Depends
+
+logger = logging.getLogger("repid")
+
+
+class _WorkerScope:
+    """Values of worker-scoped dependencies, which are created once and live as long as the worker.
+
+    Generator dependencies are entered as context managers and exited in the reverse order
+    when the scope is closed.
+    """
+
+    __slots__ = ("_exit_stack", "_lock", "_values")
+
+    def __init__(self) -> None:
+        self._values: dict[int, Any] = {}
+        self._exit_stack = contextlib.AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    async def start(self, dependencies: Iterable[Depends]) -> None:
+        async with self._lock:
+            for dependency in dependencies:
+                await self._enter(dependency)
+
+    async def get(self, dependency: Depends) -> Any:
+        if (key := id(dependency)) in self._values:
+            return self._values[key]
+        # the lock makes sure that concurrent messages don't set up the same dependency twice
+        async with self._lock:
+            return await self._enter(dependency)
+
+    async def close(self) -> None:
+        self._values.clear()
+        exit_stack, self._exit_stack = self._exit_stack, contextlib.AsyncExitStack()
+        try:
+            await exit_stack.aclose()
+        except Exception:
+            logger.exception("worker.dependencies.close.error")
+
+    async def _enter(self, dependency: Depends) -> Any:
+        if (key := id(dependency)) in self._values:
+            return self._values[key]
+
+        kwargs = {
+            name: await self._enter(sub)  # type: ignore[arg-type]
+            for name, sub in dependency._subdependencies.items()
+        }
+        fn = dependency._fn
+        if inspect.isasyncgenfunction(fn):
+            value = await self._exit_stack.enter_async_context(
+                contextlib.asynccontextmanager(fn)(**kwargs),
+            )
+        elif inspect.isgeneratorfunction(fn):
+            value = self._exit_stack.enter_context(contextlib.contextmanager(fn)(**kwargs))
+        elif dependency._is_sync:
+            value = fn(**kwargs)
+        else:
+            value = await fn(**kwargs)
+
+        logger.debug("worker.dependencies.start", extra={"dependency": repr(fn)})
+        self._values[key] = value
+        return value
@@ -4,7 +4,7 @@ import asyncio
 import inspect
 from collections.abc import Callable, Coroutine, Generator
 from concurrent.futures import Executor
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from repid._utils import asyncify
 from repid.dependencies._utils import DependencyT, get_dependency
@@ -14,26 +14,59 @@ if TYPE_CHECKING:
     from repid.dependencies._utils import DependencyContext
 
 
+def _check_options(*, run_in_process: bool, pool_executor: Executor | None, inline: bool) -> None:
+    if run_in_process is True and pool_executor is not None:
+        raise ValueError("Specify either 'run_in_process' or 'pool_executor', not both.")
+    if inline is True and (run_in_process is True or pool_executor is not None):
+        raise ValueError("'inline' can't be combined with 'run_in_process' or 'pool_executor'.")
+
+
 class Depends:
+    """Dependency annotation that indicates that the argument resolves to the result of a function.
+
+    Args:
+        fn (Callable): Function to call. Its arguments can be dependencies themselves or get
+        their values from the payload.
+        run_in_process (bool, optional): Run a synchronous function in a process pool.
+        Defaults to False.
+        pool_executor (Executor | None, optional): Executor to run a synchronous function in.
+        Defaults to None, which means the default thread pool.
+        inline (bool, optional): Call a synchronous function directly on the event loop instead
+        of an executor. Only suitable for functions which never block. Defaults to False.
+        scope (Literal["message", "worker"], optional): Lifetime of the resolved value. Message
+        scoped dependencies are resolved for every message, worker scoped ones - once per
+        worker, when it starts. The latter can be (async) generators, code after `yield` runs
+        on the worker shutdown. Defaults to "message".
+    """
+
     __slots__ = (
         "_fn",
         "_fn_locals",
+        "_is_sync",
         "_params",
         "_payload_arguments",
+        "_scope",
         "_subdependencies",
     )
 
+    # incremented on every override, so that compiled dependency plans know to rebuild
+    _overrides: ClassVar[int] = 0
+
     def __init__(
         self,
         fn: Callable[..., Any | Coroutine],
         *,
         run_in_process: bool = False,
         pool_executor: Executor | None = None,
+        inline: bool = False,
+        scope: Literal["message", "worker"] = "message",
     ) -> None:
-        if run_in_process is True and pool_executor is not None:
-            raise ValueError("Specify either 'run_in_process' or 'pool_executor', not both.")
+        _check_options(run_in_process=run_in_process, pool_executor=pool_executor, inline=inline)
+        if scope not in ("message", "worker"):
+            raise ValueError(f"Unknown dependency scope '{scope}'.")
 
-        self._fn = asyncify(fn, run_in_process=run_in_process, executor=pool_executor)
+        self._scope = scope
+        self._set_fn(fn, run_in_process=run_in_process, pool_executor=pool_executor, inline=inline)
 
         self._fn_locals = None
         current_frame = inspect.currentframe()
@@ -50,26 +83,57 @@ class Depends:
         *,
         run_in_process: bool = False,
         pool_executor: Executor | None = None,
+        inline: bool = False,
     ) -> None:
-        if run_in_process is True and pool_executor is not None:
-            raise ValueError("Specify either 'run_in_process' or 'pool_executor', not both.")
+        _check_options(run_in_process=run_in_process, pool_executor=pool_executor, inline=inline)
 
-        self._fn = asyncify(fn, run_in_process=run_in_process, executor=pool_executor)
+        self._set_fn(fn, run_in_process=run_in_process, pool_executor=pool_executor, inline=inline)
         self._update_subdependencies()
+        Depends._overrides += 1
+
+    def _set_fn(
+        self,
+        fn: Callable[..., Any | Coroutine],
+        *,
+        run_in_process: bool,
+        pool_executor: Executor | None,
+        inline: bool,
+    ) -> None:
+        self._is_sync = inline and not inspect.iscoroutinefunction(fn)
+        if self._is_sync or inspect.isasyncgenfunction(fn) or inspect.isgeneratorfunction(fn):
+            # generators are entered by the worker scope, the executor can't run them
+            self._fn: Callable[..., Any] = fn
+        else:
+            self._fn = asyncify(fn, run_in_process=run_in_process, executor=pool_executor)
 
     async def resolve(self, *, context: DependencyContext) -> Any:
-        unresolved_dependencies: dict[str, Coroutine] = {
-            dep_name: dep.resolve(context=context)
-            for dep_name, dep in self._subdependencies.items()
-        }
+        if self._scope == "worker":
+            return await self._resolve_in_worker_scope(context)
+
+        dependency_kwargs: dict[str, Any] = {}
+        if self._subdependencies:
+            unresolved_dependencies: dict[str, Coroutine] = {
+                dep_name: dep.resolve(context=context)
+                for dep_name, dep in self._subdependencies.items()
+            }
+
+            unresolved_dependencies_names = list(unresolved_dependencies.keys())
+            unresolved_dependencies_values = list(unresolved_dependencies.values())
 
-        unresolved_dependencies_names = list(unresolved_dependencies.keys())
-        unresolved_dependencies_values = list(unresolved_dependencies.values())
+            resolved = await asyncio.gather(*unresolved_dependencies_values)
 
-        resolved = await asyncio.gather(*unresolved_dependencies_values)
+            dependency_kwargs = dict(zip(unresolved_dependencies_names, resolved, strict=False))
 
-        dependency_kwargs = dict(zip(unresolved_dependencies_names, resolved, strict=False))
+        return await self._call(context, dependency_kwargs)
 
+    async def _resolve_in_worker_scope(self, context: DependencyContext) -> Any:
+        worker_scope = context.actor_context.worker_scope
+        if worker_scope is None:
+            raise ValueError("Worker-scoped dependencies can only be resolved inside of a worker.")
+        return await worker_scope.get(self)
+
+    async def _call(self, context: DependencyContext, dependency_kwargs: dict[str, Any]) -> Any:
+        """Call the function with already resolved sub-dependencies."""
         payload_arguments = {}
         for name in self._payload_arguments:
             param = self._params[name]
@@ -80,6 +144,8 @@ class Depends:
             else:
                 raise ValueError(f"Missing required argument '{name}' in payload.")
 
+        if self._is_sync:
+            return self._fn(**{**payload_arguments, **dependency_kwargs})
         return await self._fn(**{**payload_arguments, **dependency_kwargs})
 
     def _update_subdependencies(self) -> None:
@@ -91,7 +157,8 @@ class Depends:
             self._fn,
             eval_str=True,
             locals=self._fn_locals,
-            globals=self._fn.__globals__,
+            # annotations are evaluated in the module of the function, not of the asyncify wrapper
+            globals=inspect.unwrap(self._fn).__globals__,
         )
 
         for p in signature.parameters.values():
@@ -108,6 +175,20 @@ class Depends:
                 else:
                     self._payload_arguments.add(p.name)
 
+        if self._scope == "worker":
+            if self._payload_arguments:
+                raise ValueError("Worker-scoped dependencies can't use arguments from the payload.")
+            if not all(
+                isinstance(dep, Depends) and dep._scope == "worker"
+                for dep in self._subdependencies.values()
+            ):
+                raise ValueError(
+                    "Worker-scoped dependencies can only depend on other worker-scoped "
+                    "dependencies.",
+                )
+        elif inspect.isasyncgenfunction(self._fn) or inspect.isgeneratorfunction(self._fn):
+            raise ValueError("Generator dependencies are only supported with scope='worker'.")
+
     def _iter_payload_arguments(self) -> Generator[inspect.Parameter, None, None]:
         for name in self._payload_arguments:
             yield self._params[name]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Annotated, Any
 
 from repid.data import MessageData
+from repid.serializer import _content_type
 
 if TYPE_CHECKING:
     from repid.connections.abc import MessageAction, MessagePublisherT, ReceivedMessageT, ServerT
@@ -25,7 +26,9 @@ class EnhancedReceivedMessage:
 
     @property
     def payload(self) -> bytes:
-        return self._message.payload
+        payload = self._message.payload
+        # brokers may pass a view into the received data, actors always get bytes
+        return payload if isinstance(payload, bytes) else payload.tobytes()
 
     @property
     def headers(self) -> dict[str, str] | None:
@@ -104,7 +107,7 @@ class EnhancedReceivedMessage:
             MessageData(
                 payload=serializer(payload),
                 headers=headers,
-                content_type="application/json",
+                content_type=_content_type(serializer),
             ),
             server_specific_parameters,
         )
@@ -160,7 +163,7 @@ class EnhancedReceivedMessage:
             payload=serializer(payload),
             headers=headers,
             channel=channel,
-            content_type="application/json",
+            content_type=_content_type(serializer),
             server_specific_parameters=server_specific_parameters,
         )
 
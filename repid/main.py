@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import signal
+import time
 from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING, Any, overload
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from repid._runner import DEADLINE_HEADER, PRIORITY_HEADER
+from repid._supervisor import _WorkerSupervisor
 from repid._worker import _Worker
 from repid.asyncapi import AsyncAPI3Schema, AsyncAPIGenerator
 from repid.asyncapi_server import AsyncAPIServer, get_asyncapi_html
+from repid.converter import _LazyConverter
 from repid.data import ActorExecutionContext, MessageData, RunnerInfo
+from repid.dependencies._scope import _WorkerScope
 from repid.message_registry import MessageRegistry
 from repid.middlewares import (
     ActorMiddlewareT,
@@ -15,6 +21,7 @@ from repid.middlewares import (
     _compile_producer_middleware_pipeline,
 )
 from repid.router import Router
+from repid.serializer import _content_type
 from repid.serializer import default_serializer as repid_default_serializer
 from repid.server_registry import ServerRegistry
 
@@ -22,6 +29,8 @@ if TYPE_CHECKING:
     from repid.asyncapi_server import AsyncAPIServerSettings
     from repid.data import Contact, ExternalDocs, License, Tag
     from repid.health_check_server import HealthCheckServerSettings
+    from repid.metrics import MetricsServerSettings
+    from repid.profiling import Profiler
     from repid.serializer import SerializerT
 
 
@@ -78,10 +87,15 @@ class Repid:
         *,
         graceful_shutdown_time: float = 25.0,
         messages_limit: int = float("inf"),  # type: ignore[assignment]
-        tasks_limit: int = 1000,
+        tasks_limit: int | Literal["adaptive"] = 1000,
+        channel_concurrency_limits: dict[str, int] | None = None,
+        max_inflight_bytes: int | None = None,
+        eager_execution: bool = False,
         register_signals: Iterable[signal.Signals] | None = None,
         health_check_server: HealthCheckServerSettings | None = None,
         asyncapi_server: AsyncAPIServerSettings | None = None,
+        metrics_server: MetricsServerSettings | None = None,
+        profiler: Profiler | None = None,
         server_name: str | None = None,
     ) -> RunnerInfo:
         server = self._servers.get_server(server_name)
@@ -97,19 +111,91 @@ class Repid:
                 server=server,
                 publish=self._producer_middleware_pipeline(server.publish),
                 default_serializer=self.default_serializer,
+                worker_scope=_WorkerScope(),
             ),
             router=self._centralized_router._materialize(),
             graceful_shutdown_time=graceful_shutdown_time,
             messages_limit=messages_limit,
             tasks_limit=tasks_limit,
+            channel_concurrency_limits=channel_concurrency_limits,
+            max_inflight_bytes=max_inflight_bytes,
+            eager_execution=eager_execution,
             register_signals=register_signals,
             health_check_server=health_check_server,
             asyncapi_server=asyncapi_server,
             asyncapi_schema=self.generate_asyncapi_schema() if asyncapi_server else None,
+            metrics_server=metrics_server,
+            profiler=profiler,
         )
         runner = await worker.run()
         return RunnerInfo(processed=runner.processed)
 
+    def run_worker_processes(
+        self,
+        *,
+        processes: int,
+        graceful_shutdown_time: float = 25.0,
+        messages_limit: int = float("inf"),  # type: ignore[assignment]
+        tasks_limit: int | Literal["adaptive"] = 1000,
+        channel_concurrency_limits: dict[str, int] | None = None,
+        max_inflight_bytes: int | None = None,
+        eager_execution: bool = False,
+        register_signals: Iterable[signal.Signals] | None = None,
+        health_check_server: HealthCheckServerSettings | None = None,
+        asyncapi_server: AsyncAPIServerSettings | None = None,
+        metrics_server: MetricsServerSettings | None = None,
+        profiler: Profiler | None = None,
+        server_name: str | None = None,
+    ) -> RunnerInfo:
+        server = self._servers.get_server(server_name)
+        if server is None:
+            raise ValueError(
+                f"Server '{server_name}' not found."
+                if server_name
+                else "No default server configured.",
+            )
+        if server.is_connected:
+            raise ValueError(
+                "Server must not be connected before starting worker processes, "
+                "as every process opens its own connection.",
+            )
+
+        router = self._centralized_router._materialize()
+        # converters are built lazily, build them before forking to share them between processes
+        for actor in router.actors:
+            if isinstance(actor.converter, _LazyConverter):
+                actor.converter._resolve()
+
+        supervisor = _WorkerSupervisor(
+            processes=processes,
+            server=server,
+            worker_factory=partial(
+                _Worker,
+                actor_context=ActorExecutionContext(
+                    server=server,
+                    publish=self._producer_middleware_pipeline(server.publish),
+                    default_serializer=self.default_serializer,
+                    worker_scope=_WorkerScope(),
+                ),
+                router=router,
+                graceful_shutdown_time=graceful_shutdown_time,
+                messages_limit=messages_limit,
+                tasks_limit=tasks_limit,
+                channel_concurrency_limits=channel_concurrency_limits,
+                max_inflight_bytes=max_inflight_bytes,
+                eager_execution=eager_execution,
+                register_signals=register_signals,
+                profiler=profiler,
+            ),
+            graceful_shutdown_time=graceful_shutdown_time,
+            register_signals=register_signals,
+            health_check_server=health_check_server,
+            asyncapi_server=asyncapi_server,
+            asyncapi_schema=self.generate_asyncapi_schema() if asyncapi_server else None,
+            metrics_server=metrics_server,
+        )
+        return RunnerInfo(processed=supervisor.run())
+
     def generate_asyncapi_schema(self) -> AsyncAPI3Schema:
         return AsyncAPIGenerator(
             routers=[self._centralized_router._materialize()],
@@ -162,6 +248,9 @@ class Repid:
         operation_id: str | None = None,
         payload: bytes,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         content_type: str | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -185,6 +274,16 @@ class Repid:
                 else "No default server configured.",
             )
 
+        if deadline is not None and ttl is not None:
+            raise ValueError("Specify either 'deadline' or 'ttl', not both.")
+        if ttl is not None:
+            deadline = time.time() + ttl
+
+        if priority is not None:
+            headers = {**(headers or {}), PRIORITY_HEADER: str(priority)}
+        if deadline is not None:
+            headers = {**(headers or {}), DEADLINE_HEADER: repr(deadline)}
+
         await self._producer_middleware_pipeline(server.publish)(
             channel if channel is not None else operation_channel,
             MessageData(
@@ -202,6 +301,9 @@ class Repid:
         operation_id: str,
         payload: bytes,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         content_type: str | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -214,6 +316,9 @@ class Repid:
         channel: str,
         payload: bytes,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         content_type: str | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -226,6 +331,9 @@ class Repid:
         operation_id: str | None = None,
         payload: bytes,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         content_type: str | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -235,6 +343,9 @@ class Repid:
             operation_id=operation_id,
             payload=payload,
             headers=headers,
+            priority=priority,
+            deadline=deadline,
+            ttl=ttl,
             content_type=content_type,
             server_name=server_name,
             server_specific_parameters=server_specific_parameters,
@@ -247,6 +358,9 @@ class Repid:
         operation_id: str,
         payload: Any,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -259,6 +373,9 @@ class Repid:
         channel: str,
         payload: Any,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -271,6 +388,9 @@ class Repid:
         channel: str | None = None,
         payload: Any,
         headers: dict[str, str] | None = None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         server_name: str | None = None,
         server_specific_parameters: dict[str, Any] | None = None,
@@ -281,7 +401,10 @@ class Repid:
             operation_id=operation_id,
             payload=serializer(payload),
             headers=headers,
-            content_type="application/json",
+            priority=priority,
+            deadline=deadline,
+            ttl=ttl,
+            content_type=_content_type(serializer),
             server_name=server_name,
             server_specific_parameters=server_specific_parameters,
         )
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+from wsgiref.handlers import format_date_time
+
+if TYPE_CHECKING:
+    from repid.connections.abc import ReceivedMessageT
+
+logger = logging.getLogger("repid.metrics")
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+
+class Histogram:
+    """Histogram with fixed buckets. Buckets are upper bounds, `+Inf` is added implicitly."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def _merge(self, other: Histogram) -> None:
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.sum += other.sum
+        self.count += other.count
+
+
+class Metrics:
+    """Runtime metrics of a worker.
+
+    All of the updates happen inside of the worker's event loop, so the counters are plain
+    integers without any locking. Gauges are computed only when metrics are collected.
+    Subscribers are labelled by the channel they own, the shared subscriber is labelled `*`."""
+
+    __slots__ = (
+        "_gauges",
+        "actor_latency",
+        "expired_messages",
+        "latency_buckets",
+        "limiter_waits",
+        "messages_processed",
+        "messages_received",
+        "poison_messages",
+        "subscriber_pauses",
+        "subscriber_resumes",
+        "unrouted_messages",
+    )
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.latency_buckets = tuple(latency_buckets)
+        self.messages_received: defaultdict[str, int] = defaultdict(int)
+        self.messages_processed: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.actor_latency: dict[str, Histogram] = {}
+        self.unrouted_messages: defaultdict[str, int] = defaultdict(int)
+        self.poison_messages: defaultdict[str, int] = defaultdict(int)
+        self.expired_messages: defaultdict[str, int] = defaultdict(int)
+        self.subscriber_pauses: defaultdict[str, int] = defaultdict(int)
+        self.subscriber_resumes: defaultdict[str, int] = defaultdict(int)
+        self.limiter_waits = 0
+        self._gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+
+    def observe_latency(self, actor_name: str, latency: float) -> None:
+        histogram = self.actor_latency.get(actor_name)
+        if histogram is None:
+            histogram = self.actor_latency[actor_name] = Histogram(self.latency_buckets)
+        histogram.observe(latency)
+
+    def observe_processed(
+        self,
+        actor_name: str,
+        messages: Iterable[ReceivedMessageT],
+        latency: float,
+    ) -> None:
+        self.observe_latency(actor_name, latency)
+        for message in messages:
+            action = message.action
+            self.messages_processed[
+                (actor_name, "no_action" if action is None else action.value)
+            ] += 1
+
+    def register_gauge(self, name: str, description: str, fn: Callable[[], float]) -> None:
+        self._gauges[name] = (description, fn)
+
+    def _merge(self, other: Metrics) -> None:
+        """Add up counters and histograms of another instance, e.g. of another process."""
+        labelled_counters: tuple[tuple[defaultdict[Any, int], defaultdict[Any, int]], ...] = (
+            (self.messages_received, other.messages_received),
+            (self.messages_processed, other.messages_processed),
+            (self.unrouted_messages, other.unrouted_messages),
+            (self.poison_messages, other.poison_messages),
+            (self.expired_messages, other.expired_messages),
+            (self.subscriber_pauses, other.subscriber_pauses),
+            (self.subscriber_resumes, other.subscriber_resumes),
+        )
+        for counters, other_counters in labelled_counters:
+            for key, value in other_counters.items():
+                counters[key] += value
+        self.limiter_waits += other.limiter_waits
+        for actor, other_histogram in other.actor_latency.items():
+            histogram = self.actor_latency.get(actor)
+            if histogram is None:
+                histogram = self.actor_latency[actor] = Histogram(other_histogram.buckets)
+            histogram._merge(other_histogram)
+
+    def _snapshot(self) -> tuple[Metrics, dict[str, tuple[str, float]]]:
+        """Copy of counters and histograms along with current gauge values, which (unlike
+        the gauge functions) can be sent to another process."""
+        counters = Metrics(self.latency_buckets)
+        counters._merge(self)
+        gauges = {name: (description, fn()) for name, (description, fn) in self._gauges.items()}
+        return counters, gauges
+
+    def render(self) -> str:
+        """Render metrics in Prometheus text exposition format."""
+        return "".join(self._render_lines())
+
+    def _render_lines(self) -> Iterator[str]:
+        yield from _render_counter(
+            "repid_messages_received_total",
+            "Messages routed to an actor.",
+            ("actor",),
+            (((actor,), value) for actor, value in self.messages_received.items()),
+        )
+        yield from _render_counter(
+            "repid_messages_processed_total",
+            "Messages processed by an actor, by resulting action.",
+            ("actor", "action"),
+            self.messages_processed.items(),
+        )
+        yield from _render_counter(
+            "repid_messages_unrouted_total",
+            "Messages, which didn't match any actor.",
+            ("channel",),
+            (((channel,), value) for channel, value in self.unrouted_messages.items()),
+        )
+        yield from _render_counter(
+            "repid_messages_poison_total",
+            "Unrouted messages, which were nacked after too many retries.",
+            ("channel",),
+            (((channel,), value) for channel, value in self.poison_messages.items()),
+        )
+        yield from _render_counter(
+            "repid_messages_expired_total",
+            "Messages, which were nacked without processing, because their deadline has passed.",
+            ("actor",),
+            (((actor,), value) for actor, value in self.expired_messages.items()),
+        )
+        yield from _render_counter(
+            "repid_subscriber_pauses_total",
+            "Subscriber pauses because of a full concurrency limit.",
+            ("subscriber",),
+            (((name,), value) for name, value in self.subscriber_pauses.items()),
+        )
+        yield from _render_counter(
+            "repid_subscriber_resumes_total",
+            "Subscriber resumes after a pause.",
+            ("subscriber",),
+            (((name,), value) for name, value in self.subscriber_resumes.items()),
+        )
+        yield from _render_counter(
+            "repid_limiter_waits_total",
+            "Messages, which had to wait for a free slot of the tasks limit.",
+            (),
+            [((), self.limiter_waits)],
+        )
+        if self.actor_latency:
+            yield "# HELP repid_actor_latency_seconds Time from scheduling to actor completion.\n"
+            yield "# TYPE repid_actor_latency_seconds histogram\n"
+            for actor, histogram in self.actor_latency.items():
+                label = f'actor="{_escape(actor)}"'
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+                    cumulative += count
+                    yield f'repid_actor_latency_seconds_bucket{{{label},le="{bound}"}} {cumulative}\n'
+                yield (
+                    f'repid_actor_latency_seconds_bucket{{{label},le="+Inf"}} {histogram.count}\n'
+                )
+                yield f"repid_actor_latency_seconds_sum{{{label}}} {histogram.sum}\n"
+                yield f"repid_actor_latency_seconds_count{{{label}}} {histogram.count}\n"
+        for name, (description, fn) in self._gauges.items():
+            yield f"# HELP {name} {description}\n"
+            yield f"# TYPE {name} gauge\n"
+            yield f"{name} {fn()}\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_counter(
+    name: str,
+    description: str,
+    label_names: tuple[str, ...],
+    values: Iterable[tuple[tuple[str, ...], int]],
+) -> Iterator[str]:
+    header_sent = False
+    for label_values, value in values:
+        if not header_sent:
+            yield f"# HELP {name} {description}\n"
+            yield f"# TYPE {name} counter\n"
+            header_sent = True
+        if label_names:
+            labels = ",".join(
+                f'{label}="{_escape(label_value)}"'
+                for label, label_value in zip(label_names, label_values, strict=True)
+            )
+            yield f"{name}{{{labels}}} {value}\n"
+        else:
+            yield f"{name} {value}\n"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MetricsServerSettings:
+    address: str = "0.0.0.0"  # noqa: S104
+    port: int = 8082
+    endpoint_name: str = "/metrics"
+
+
+class MetricsServer:
+    def __init__(
+        self,
+        metrics: Metrics,
+        server_settings: MetricsServerSettings | None = None,
+    ) -> None:
+        self.metrics = metrics
+        self.server_settings = (
+            server_settings if server_settings is not None else MetricsServerSettings()
+        )
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        if self._server is None or not self._server.is_serving():
+            loop = asyncio.get_running_loop()
+            self._server = await loop.create_server(
+                lambda: _HttpServerProtocol(
+                    endpoint_name=self.server_settings.endpoint_name,
+                    metrics=self.metrics,
+                ),
+                host=self.server_settings.address,
+                port=self.server_settings.port,
+                reuse_port=True,
+            )
+            await self._server.start_serving()
+            logger.info("metrics_server.start", extra=asdict(self.server_settings))
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            logger.info("metrics_server.stop")
+
+
+class _HttpServerProtocol(asyncio.Protocol):
+    def __init__(self, endpoint_name: str, metrics: Metrics) -> None:
+        super().__init__()
+        self.endpoint_name = endpoint_name
+        self.metrics = metrics
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport: asyncio.WriteTransport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        message = data.decode()
+
+        headers, _ = message.split("\r\n\r\n", maxsplit=1)
+        http_lines = headers.split("\r\n", maxsplit=1)
+        method, path, _ = http_lines[0].split(" ", maxsplit=2)
+
+        response = self.handle_request(method, path)
+
+        self.transport.write(response)
+        self.transport.close()
+
+    def handle_request(self, method: str, path: str) -> bytes:
+        if method == "GET" and path == self.endpoint_name:
+            status = "200 OK"
+            content = self.metrics.render().encode()
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            status = "404 Not Found"
+            content = status.encode()
+            content_type = "text/plain"
+        return (
+            f"HTTP/1.1 {status}\r\n"
+            f"Date: {format_date_time(time.time())}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(content)}\r\n"
+            f"Connection: close\r\n\r\n"
+        ).encode() + content
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Coroutine, Sequence
-from inspect import isawaitable
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast
 
 if TYPE_CHECKING:
     from repid.connections.abc import ReceivedMessageT
@@ -50,6 +51,118 @@ class _ProducerMiddlewareLastLeaf(Protocol):
     ) -> Any: ...
 
 
+class ActorHookMiddleware:
+    """Actor middleware made of synchronous hooks, which run before and after the actor.
+
+    Hooks don't wrap `call_next`, so consecutive hook middlewares run inside of a single
+    coroutine of the pipeline, instead of a coroutine per middleware. Use a regular middleware
+    to await something or to replace the message or the result.
+
+    Args:
+        before (Callable[[ReceivedMessageT, ActorData], None] | None, optional): Called with
+        the message and the actor before the actor runs. Raise to stop processing of the message.
+        Defaults to None.
+        after (Callable[[ReceivedMessageT, ActorData, Any, BaseException | None], None] | None,
+        optional): Called with the message, the actor, the result and the exception (or None
+        on success) once the actor has finished, also if it has failed. Defaults to None.
+    """
+
+    __slots__ = ("after", "before")
+
+    def __init__(
+        self,
+        *,
+        before: Callable[[ReceivedMessageT, ActorData], None] | None = None,
+        after: Callable[[ReceivedMessageT, ActorData, Any, BaseException | None], None]
+        | None = None,
+    ) -> None:
+        self.before = before
+        self.after = after
+
+    async def __call__(
+        self,
+        call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+        message: ReceivedMessageT,
+        actor: ActorData,
+    ) -> Any:
+        return await _hooks_layer([self], call_next)(message, actor)
+
+
+def _run_after_hooks(
+    afters: Sequence[Callable[[ReceivedMessageT, ActorData, Any, BaseException | None], None]],
+    message: ReceivedMessageT,
+    actor: ActorData,
+    result: Any,
+    exception: BaseException | None,
+) -> None:
+    # same as unwinding of nested middlewares: an error of an inner hook is seen by outer ones
+    error = None
+    for after in afters:
+        try:
+            after(message, actor, result, exception)
+        except BaseException as exc:  # noqa: BLE001
+            result, exception, error = None, exc, exc
+    if error is not None:
+        raise error
+
+
+def _hooks_layer(
+    hooks: Sequence[ActorHookMiddleware],
+    call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+) -> Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]]:
+    befores = [hook.before for hook in hooks]
+    # innermost first
+    afters = [hook.after for hook in reversed(hooks)]
+    defined_afters = [after for after in afters if after is not None]
+
+    async def layer(message: ReceivedMessageT, actor: ActorData) -> Any:
+        entered = 0
+        try:
+            for before in befores:
+                if before is not None:
+                    before(message, actor)
+                entered += 1
+            result = await call_next(message, actor)
+        except BaseException as exc:
+            # hooks, which `before` hasn't run (or has failed), don't run `after` either
+            _run_after_hooks(
+                [after for after in afters[len(afters) - entered :] if after is not None],
+                message,
+                actor,
+                None,
+                exc,
+            )
+            raise
+        _run_after_hooks(defined_afters, message, actor, result, None)
+        return result
+
+    return layer
+
+
+def _is_async_callable(fn: Any) -> bool:
+    # callable objects, e.g. middleware classes, have `async def __call__`
+    return iscoroutinefunction(fn) or iscoroutinefunction(type(fn).__call__)
+
+
+def _async_layer(
+    middleware: ActorMiddlewareT,
+    call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+) -> Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]]:
+    # calling the partial returns coroutine of the middleware, there is no coroutine around it
+    return partial(middleware, call_next)
+
+
+def _sync_layer(
+    middleware: ActorMiddlewareT,
+    call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+) -> Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]]:
+    async def layer(message: ReceivedMessageT, actor: ActorData) -> Any:
+        result = middleware(call_next, message, actor)
+        return await result if isawaitable(result) else result
+
+    return layer
+
+
 def _compile_actor_middleware_pipeline(
     middlewares: Sequence[ActorMiddlewareT] | None,
 ) -> Callable[
@@ -60,34 +173,67 @@ def _compile_actor_middleware_pipeline(
 
     Returns a function that, given a leaf (call_next), produces a coroutine function
     with signature (message, actor) -> Any that runs all middlewares around the leaf.
+    Async middlewares are bound to their call_next with `partial`, without a wrapping coroutine,
+    and consecutive `ActorHookMiddleware`s are merged into a single layer.
     """
     mws: list[ActorMiddlewareT] = list(middlewares or [])
 
+    # layer factories, innermost first, so that assembling doesn't inspect middlewares again
+    layers: list[
+        Callable[
+            [Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]]],
+            Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+        ]
+    ] = []
+    end = len(mws)
+    while end > 0:
+        start = end
+        while start > 0 and isinstance(mws[start - 1], ActorHookMiddleware):
+            start -= 1
+        if start < end:
+            layers.append(partial(_hooks_layer, cast(list[ActorHookMiddleware], mws[start:end])))
+            end = start
+        else:
+            mw = mws[end - 1]
+            layers.append(partial(_async_layer if _is_async_callable(mw) else _sync_layer, mw))
+            end -= 1
+
     def assemble(
         leaf: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
     ) -> Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]]:
-        async def last(msg: ReceivedMessageT, act: ActorData) -> Any:
-            return await leaf(msg, act)
+        next_fn = leaf
+        for layer in layers:
+            next_fn = layer(next_fn)
+        return next_fn
 
-        next_fn: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]] = last
+    return assemble
 
-        for mw in reversed(mws):
-            prev = next_fn
 
-            async def layer(
-                msg: ReceivedMessageT,
-                act: ActorData,
-                _mw: ActorMiddlewareT = mw,
-                _nxt: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]] = prev,
-            ) -> Any:
-                result = _mw(_nxt, msg, act)
-                return await result if isawaitable(result) else result
+class _ActorMiddlewarePipeline:
+    """Middleware pipeline of an actor, compiled once for the leaf it's called with.
 
-            next_fn = layer
+    Workers call it with the same leaf for every message, so the chain is only built again
+    if the leaf changes, e.g. when the same actor is run by another worker.
+    """
 
-        return next_fn
+    __slots__ = ("_assemble", "_chain", "_leaf")
 
-    return assemble
+    def __init__(self, middlewares: Sequence[ActorMiddlewareT] | None) -> None:
+        self._assemble = _compile_actor_middleware_pipeline(middlewares)
+        self._leaf: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]] | None = None
+        self._chain: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]] | None = None
+
+    def __call__(
+        self,
+        call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
+        message: ReceivedMessageT,
+        actor: ActorData,
+    ) -> Coroutine[Any, Any, Any]:
+        chain = self._chain
+        if call_next is not self._leaf or chain is None:
+            chain = self._chain = self._assemble(call_next)
+            self._leaf = call_next
+        return chain(message, actor)
 
 
 def _compile_producer_middleware_pipeline(
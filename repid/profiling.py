@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from types import TracebackType
+
+logger = logging.getLogger("repid.profiling")
+
+ProfilingSinkT = Callable[["MessageProfile"], None]
+
+
+class MessageProfile:
+    """Timings (in seconds) of the stages, which a sampled message went through.
+
+    Stages:
+
+    - `route` - matching the message to an actor
+    - `admission` - waiting for a free slot of the concurrency limits
+    - `schedule` - waiting for the task of the message (or of the batch) to start
+    - `decode` - parsing and validation of the payload and the headers
+    - `dependencies` - resolution of the dependencies
+    - `actor` - the actor function itself
+    - `ack` - acking, nacking or rejecting the message
+    - `handler` - everything above, which runs inside of the middleware pipeline
+    - `middleware` - time spent in the middlewares, outside of the handler
+
+    Batches are profiled as a whole, in which case `message_id` is the id of the first message.
+    """
+
+    __slots__ = ("_lap_at", "actor_name", "batch_size", "channel", "message_id", "stages")
+
+    def __init__(self, channel: str, message_id: str | None) -> None:
+        self.channel = channel
+        self.message_id = message_id
+        self.actor_name: str | None = None
+        self.batch_size = 1
+        self.stages: dict[str, float] = {}
+        self._lap_at = time.perf_counter()
+
+    def add(self, stage: str, duration: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+
+    def lap(self, stage: str) -> None:
+        """Adds time since the previous lap (or creation of the profile) to the stage."""
+        now = time.perf_counter()
+        self.add(stage, now - self._lap_at)
+        self._lap_at = now
+
+
+def log_profile(profile: MessageProfile) -> None:
+    """Sink, which logs every sampled profile with `repid.profiling` logger."""
+    logger.info(
+        "message.profile",
+        extra={
+            "actor_name": profile.actor_name,
+            "channel": profile.channel,
+            "message_id": profile.message_id,
+            "batch_size": profile.batch_size,
+            "stages": profile.stages,
+        },
+    )
+
+
+class Profiler:
+    """Samples every `sample_every`-th message received by the worker, records timings of
+    its stages and passes the resulting `MessageProfile` to the sink."""
+
+    __slots__ = ("_counter", "sample_every", "sink")
+
+    def __init__(self, sink: ProfilingSinkT = log_profile, sample_every: int = 1000) -> None:
+        if sample_every < 1:
+            raise ValueError("Sample rate must be at least 1.")
+        self.sink = sink
+        self.sample_every = sample_every
+        self._counter = 0
+
+    def _sample(self, channel: str, message_id: str | None) -> MessageProfile | None:
+        self._counter += 1
+        if self._counter < self.sample_every:
+            return None
+        self._counter = 0
+        return MessageProfile(channel, message_id)
+
+    def _export(self, profile: MessageProfile) -> None:
+        try:
+            self.sink(profile)
+        except Exception:
+            logger.exception("profiling.sink.error")
+
+
+_current_profile: ContextVar[MessageProfile | None] = ContextVar(
+    "repid_current_profile",
+    default=None,
+)
+
+_NULL_STAGE: AbstractContextManager[None] = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("name", "profile", "started_at")
+
+    def __init__(self, profile: MessageProfile, name: str) -> None:
+        self.profile = profile
+        self.name = name
+        self.started_at = 0.0
+
+    def __enter__(self) -> None:
+        self.started_at = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.profile.add(self.name, time.perf_counter() - self.started_at)
+
+
+def _stage(name: str) -> AbstractContextManager[None]:
+    """Records duration of the block as a stage of the profiled message, if the current task
+    processes one. Otherwise it's a no-op."""
+    profile = _current_profile.get()
+    if profile is None:
+        return _NULL_STAGE
+    return _Stage(profile, name)
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import fnmatch
 import inspect
+import re
 from collections.abc import Callable, Coroutine, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar, overload
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Literal,
+    Protocol,
+    TypeVar,
+    get_args,
+    get_origin,
+    overload,
+)
 
 from repid._utils import NotSet, asyncify
 from repid._utils.not_set import _NotSet
-from repid.converter import DefaultConverter
+from repid.converter import DefaultConverter, _LazyConverter
 from repid.data import (
     ActorData,
     Channel,
@@ -19,13 +31,14 @@ from repid.data import (
     OnErrorT,
 )
 from repid.dependencies._utils import validate_dependency
-from repid.middlewares import ActorMiddlewareT, _compile_actor_middleware_pipeline
+from repid.dependencies.full_payload import FullPayload
+from repid.middlewares import ActorMiddlewareT, _ActorMiddlewarePipeline
 
 if TYPE_CHECKING:
     from concurrent.futures import Executor
 
     from repid.asyncapi.models import OperationBindingsObject
-    from repid.connections.abc import BaseMessageT, ReceivedMessageT
+    from repid.connections.abc import BaseMessageT
     from repid.converter import ConverterT
     from repid.data import Channel, ExternalDocs, Tag
     from repid.data.message_schema import ActorMessageMetadata
@@ -35,13 +48,38 @@ class RoutingStrategyT(Protocol):
     def __call__(self, *, actor_name: str, **kwargs: Any) -> Callable[[BaseMessageT], bool]: ...
 
 
-def topic_based_routing_strategy(*, actor_name: str, **_: Any) -> Callable[[BaseMessageT], bool]:
-    def strategy(message: BaseMessageT) -> bool:
+_GLOB_WILDCARDS = frozenset("*?[")
+
+
+@dataclass(slots=True, frozen=True)
+class _HeaderExactMatcher:
+    header: str
+    value: str
+
+    def __call__(self, message: BaseMessageT) -> bool:
         if message.headers is None:
             return False
-        return message.headers.get("topic") == actor_name
+        return message.headers.get(self.header) == self.value
 
-    return strategy
+
+@dataclass(slots=True, frozen=True)
+class _HeaderGlobMatcher:
+    header: str
+    pattern: str
+    _regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_regex", re.compile(fnmatch.translate(self.pattern)))
+
+    def __call__(self, message: BaseMessageT) -> bool:
+        if message.headers is None:
+            return False
+        value = message.headers.get(self.header)
+        return value is not None and self._regex.match(value) is not None
+
+
+def topic_based_routing_strategy(*, actor_name: str, **_: Any) -> Callable[[BaseMessageT], bool]:
+    return _HeaderExactMatcher("topic", actor_name)
 
 
 def catch_all_routing_strategy(*, actor_name: str, **_: Any) -> Callable[[BaseMessageT], bool]:  # noqa: ARG001
@@ -51,6 +89,103 @@ def catch_all_routing_strategy(*, actor_name: str, **_: Any) -> Callable[[BaseMe
     return strategy
 
 
+def header_routing_strategy(header: str, value: str | None = None) -> RoutingStrategyT:
+    """Route messages, which have `header` equal to `value` (defaults to actor's name).
+
+    Lookups are indexed, so the cost doesn't grow with the amount of actors on the channel."""
+
+    def strategy(*, actor_name: str, **_: Any) -> Callable[[BaseMessageT], bool]:
+        return _HeaderExactMatcher(header, value if value is not None else actor_name)
+
+    return strategy
+
+
+def glob_header_routing_strategy(header: str, pattern: str | None = None) -> RoutingStrategyT:
+    """Route messages, which have `header` matching shell-style `pattern` (defaults to actor's
+    name), e.g. `user.*`. Patterns without wildcards are indexed the same way as exact matches."""
+
+    def strategy(*, actor_name: str, **_: Any) -> Callable[[BaseMessageT], bool]:
+        actual_pattern = pattern if pattern is not None else actor_name
+        if not _GLOB_WILDCARDS.intersection(actual_pattern):
+            return _HeaderExactMatcher(header, actual_pattern)
+        return _HeaderGlobMatcher(header, actual_pattern)
+
+    return strategy
+
+
+class _ActorIndex:
+    """Finds the first actor (in registration order), which matches a message.
+
+    Actors with exact header matching strategies are looked up in a dictionary, others are
+    checked one by one, but only if they were registered before the best indexed match."""
+
+    __slots__ = ("_exact", "_scan", "actors")
+
+    def __init__(self, actors: Sequence[ActorData]) -> None:
+        self.actors = tuple(actors)
+        exact: dict[str, dict[str, int]] = {}
+        self._scan: list[tuple[int, ActorData]] = []
+        for position, actor in enumerate(self.actors):
+            strategy = actor.routing_strategy
+            if isinstance(strategy, _HeaderExactMatcher):
+                exact.setdefault(strategy.header, {}).setdefault(strategy.value, position)
+            else:
+                self._scan.append((position, actor))
+        self._exact = tuple(exact.items())
+
+    def match(self, message: BaseMessageT) -> ActorData | None:
+        best = len(self.actors)
+        headers = message.headers
+        if headers is not None:
+            for header, positions in self._exact:
+                value = headers.get(header)
+                if value is not None:
+                    best = min(best, positions.get(value, best))
+        for position, actor in self._scan:
+            if position >= best:
+                break
+            if actor.routing_strategy(message):
+                return actor
+        return self.actors[best] if best < len(self.actors) else None
+
+
+def _batch_item_fn(
+    fn: Callable[..., Any],
+    fn_locals: dict[str, Any] | None,
+) -> Callable[..., Coroutine[Any, Any, None]]:
+    """Build a stand-in function, which describes a single message of a batch actor,
+    so that the converter can parse & validate every message of a batch separately."""
+    signature = inspect.signature(fn, eval_str=True, locals=fn_locals, globals=fn.__globals__)
+    params = list(signature.parameters.values())
+    if (
+        len(params) != 1
+        or params[0].kind
+        not in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        or get_origin(params[0].annotation) is not list
+        or len(get_args(params[0].annotation)) != 1
+    ):
+        raise ValueError(
+            "Batch actor must accept exactly one positional argument, annotated as `list[T]`.",
+        )
+
+    async def item(**_: Any) -> None:  # pragma: no cover
+        pass
+
+    item.__name__ = fn.__name__
+    item.__qualname__ = fn.__qualname__
+    item.__doc__ = fn.__doc__
+    item.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(
+                params[0].name,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=Annotated[get_args(params[0].annotation)[0], FullPayload()],
+            ),
+        ],
+    )
+    return item
+
+
 YourFunc = TypeVar("YourFunc", bound=Callable)
 ExplicitFunc = TypeVar("ExplicitFunc", bound=Callable[..., Coroutine[Any, Any, ManualActionT]])
 
@@ -81,6 +216,10 @@ class _ActorDefinition:
     correlation_id: CorrelationId | None
     fn_locals: dict[str, Any] | None
     message_schema: ActorMessageMetadata | None
+    batch_size: int | None
+    batch_linger: float
+    max_concurrency: int | None
+    priority: int | None
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -97,6 +236,8 @@ class _RouterDefaults:
     run_in_process: bool | _NotSet
     pool_executor: Executor | _NotSet | None
     converter: type[ConverterT] | _NotSet
+    max_concurrency: int | _NotSet | None
+    priority: int | _NotSet | None
 
     @classmethod
     def empty(cls) -> _RouterDefaults:
@@ -108,24 +249,46 @@ class _RouterDefaults:
             run_in_process=NotSet,
             pool_executor=NotSet,
             converter=NotSet,
+            max_concurrency=NotSet,
+            priority=NotSet,
         )
 
 
+_ROUTER_DEFAULTS = frozenset(
+    (
+        "channel",
+        "converter",
+        "keep_alive",
+        "max_concurrency",
+        "middlewares",
+        "pool_executor",
+        "priority",
+        "run_in_process",
+        "timeout",
+    ),
+)
+
+
 @dataclass(slots=True, kw_only=True, frozen=True)
 class _MaterializedRouter:
     actors: list[ActorData]
     channels: list[Channel]
     _actors_per_channel_address: dict[str, list[ActorData]]
+    _actor_index_per_channel_address: dict[str, _ActorIndex]
 
 
 class Router:
     __slots__ = (
         "_entries",
+        "_materialized",
+        "_parents",
         "channel",
         "converter",
         "keep_alive",
+        "max_concurrency",
         "middlewares",
         "pool_executor",
+        "priority",
         "run_in_process",
         "timeout",
     )
@@ -140,8 +303,14 @@ class Router:
         run_in_process: bool = NotSet,
         pool_executor: Executor | None = NotSet,
         converter: type[ConverterT] = NotSet,
+        max_concurrency: int | None = NotSet,
+        priority: int | None = NotSet,
     ) -> None:
+        if isinstance(max_concurrency, int) and max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1.")
         self._entries: list[_ActorDefinition | _IncludedRouter] = []
+        self._materialized: _MaterializedRouter | None = None
+        self._parents: list[Router] = []
         self.channel = channel
         self.middlewares = middlewares
         self.timeout = timeout
@@ -149,6 +318,8 @@ class Router:
         self.run_in_process = run_in_process
         self.pool_executor = pool_executor
         self.converter = converter
+        self.max_concurrency = max_concurrency
+        self.priority = priority
 
     def include_router(self, router: Router) -> None:
         if router is self or router._contains_router(self):
@@ -160,6 +331,20 @@ class Router:
             return
 
         self._entries.append(_IncludedRouter(router=router))
+        router._parents.append(self)
+        self._invalidate()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # defaults of the router affect all of its actors
+        if name in _ROUTER_DEFAULTS and hasattr(self, "_parents"):
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drops the cached materialization of the router and of all routers including it."""
+        self._materialized = None
+        for parent in self._parents:
+            parent._invalidate()
 
     def _contains_router(self, router: Router, seen: set[int] | None = None) -> bool:
         if seen is None:
@@ -176,6 +361,11 @@ class Router:
         return False
 
     def _materialize(self) -> _MaterializedRouter:
+        if self._materialized is None:
+            self._materialized = self._materialize_uncached()
+        return self._materialized
+
+    def _materialize_uncached(self) -> _MaterializedRouter:
         actors: list[ActorData] = []
         channels: dict[str, Channel] = {}
         self._materialize_into(
@@ -194,6 +384,10 @@ class Router:
             actors=actors,
             channels=list(channels.values()),
             _actors_per_channel_address=actors_per_channel_address,
+            _actor_index_per_channel_address={
+                address: _ActorIndex(channel_actors)
+                for address, channel_actors in actors_per_channel_address.items()
+            },
         )
 
     def _materialize_into(
@@ -241,6 +435,12 @@ class Router:
             converter=(
                 defaults.converter if isinstance(self.converter, _NotSet) else self.converter
             ),
+            max_concurrency=(
+                defaults.max_concurrency
+                if isinstance(self.max_concurrency, _NotSet)
+                else self.max_concurrency
+            ),
+            priority=(defaults.priority if isinstance(self.priority, _NotSet) else self.priority),
         )
 
     @staticmethod
@@ -295,19 +495,7 @@ class Router:
             *actor_middlewares,
         ]
 
-        composer = _compile_actor_middleware_pipeline(all_middlewares)
-
-        async def middleware_pipeline(
-            call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[Any, Any, Any]],
-            message: ReceivedMessageT,
-            actor: ActorData,
-            _composer: Callable = composer,
-            _all_middlewares: list[ActorMiddlewareT] = all_middlewares,
-        ) -> Any:
-            if _all_middlewares:
-                final = _composer(call_next)
-                return await final(message, actor)
-            return await call_next(message, actor)
+        middleware_pipeline = _ActorMiddlewarePipeline(all_middlewares)
 
         timeout_val = (
             definition.timeout
@@ -331,6 +519,18 @@ class Router:
             if definition.pool_executor is not None
             else (None if isinstance(defaults.pool_executor, _NotSet) else defaults.pool_executor)
         )
+        max_concurrency_val = (
+            definition.max_concurrency
+            if definition.max_concurrency is not None
+            else (
+                None if isinstance(defaults.max_concurrency, _NotSet) else defaults.max_concurrency
+            )
+        )
+        priority_val = (
+            definition.priority
+            if definition.priority is not None
+            else (None if isinstance(defaults.priority, _NotSet) else defaults.priority)
+        )
 
         actor_data = ActorData(
             fn=asyncify(
@@ -345,8 +545,11 @@ class Router:
             channel_address=channel_address,
             timeout=timeout_val,
             keep_alive=keep_alive_val,
-            converter=converter_cls(
-                definition.fn,
+            converter=_LazyConverter(
+                converter_cls,
+                definition.fn
+                if definition.batch_size is None
+                else _batch_item_fn(definition.fn, definition.fn_locals),
                 fn_locals=definition.fn_locals,
                 correlation_id=definition.correlation_id,
             ),
@@ -361,6 +564,10 @@ class Router:
             deprecated=definition.deprecated,
             on_error=definition.on_error,
             message_schema=definition.message_schema,
+            batch_size=definition.batch_size,
+            batch_linger=definition.batch_linger,
+            max_concurrency=max_concurrency_val,
+            priority=priority_val,
         )
         return actor_data, channel_obj
 
@@ -419,6 +626,10 @@ class Router:
         on_error: OnErrorAutoT = "nack",
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
+        batch_size: int | None = None,
+        batch_linger: float = 0.1,
     ) -> Callable[[YourFunc], YourFunc]: ...
 
     @overload
@@ -448,6 +659,10 @@ class Router:
         on_error: OnErrorAutoT = "nack",
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
+        batch_size: int | None = None,
+        batch_linger: float = 0.1,
     ) -> YourFunc: ...
 
     @overload
@@ -476,6 +691,10 @@ class Router:
         deprecated: bool = False,
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
+        batch_size: int | None = None,
+        batch_linger: float = 0.1,
     ) -> Callable[[YourFunc], YourFunc]: ...
 
     @overload
@@ -504,6 +723,10 @@ class Router:
         deprecated: bool = False,
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
+        batch_size: int | None = None,
+        batch_linger: float = 0.1,
     ) -> YourFunc: ...
 
     @overload
@@ -533,6 +756,8 @@ class Router:
         on_error: OnErrorManualT = "no_action",
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
     ) -> Callable[[YourFunc], YourFunc]: ...
 
     @overload
@@ -562,6 +787,8 @@ class Router:
         on_error: OnErrorManualT = "no_action",
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
     ) -> YourFunc: ...
 
     @overload
@@ -591,6 +818,8 @@ class Router:
         on_error: OnErrorManualT = "no_action",
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
     ) -> Callable[[ExplicitFunc], ExplicitFunc]: ...
 
     @overload
@@ -620,9 +849,11 @@ class Router:
         on_error: OnErrorManualT = "no_action",
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
     ) -> ExplicitFunc: ...
 
-    def actor(
+    def actor(  # noqa: C901
         self,
         fn: YourFunc | ExplicitFunc | None = None,
         /,
@@ -654,6 +885,10 @@ class Router:
         on_error: OnErrorAutoT | OnErrorManualT | None = None,
         correlation_id: CorrelationId | None = None,
         message_schema: ActorMessageMetadata | None = None,
+        max_concurrency: int | None = None,
+        priority: int | None = None,
+        batch_size: int | None = None,
+        batch_linger: float = 0.1,
     ) -> (
         YourFunc
         | ExplicitFunc
@@ -738,6 +973,28 @@ class Router:
                 errors). Has no effect when `confirmation_mode` is anything but ``"auto"``.
             correlation_id (CorrelationId | None, optional):
                 Correlation ID location descriptor for messages handled by the actor.
+            batch_size (int | None, optional):
+                If set, messages are collected into batches of up to this size and the actor
+                is called once per batch with a list of payloads. The actor must accept
+                exactly one argument, annotated as ``list[T]``, where ``T`` describes
+                the payload of a single message. The actor can return None to confirm all
+                messages, or a list of per-message results (``"ack"``, ``"nack"``,
+                ``"reject"``, ``"no_action"``, None or an exception instance to apply
+                `on_error`). Requires PydanticConverter. Defaults to None (no batching).
+            batch_linger (float, optional):
+                Maximum time in seconds to wait for a batch to fill up before calling
+                the actor with a partial batch. Defaults to 0.1.
+            max_concurrency (int | None, optional):
+                Maximum amount of messages this actor processes at the same time in a worker,
+                on top of the worker-wide tasks limit. Isolates slow actors, so they can't take
+                every slot from other actors. For batch actors, every message of a batch counts.
+                Messages waiting for a free slot still occupy broker's prefetch, so to isolate
+                a channel completely use `channel_concurrency_limits` of the worker instead.
+                Defaults to Router's default max_concurrency (no limit).
+            priority (int | None, optional):
+                Priority of the actor's messages, which don't have a `priority` header.
+                When the worker's tasks limit is saturated, messages with higher priority
+                are processed first. Defaults to Router's default priority (0).
 
         Returns:
             YourFunc: your initial function.
@@ -767,6 +1024,10 @@ class Router:
                 on_error=on_error,
                 correlation_id=correlation_id,
                 message_schema=message_schema,
+                batch_size=batch_size,
+                batch_linger=batch_linger,
+                max_concurrency=max_concurrency,
+                priority=priority,
             )
 
         if run_in_process is True and pool_executor is not None:
@@ -795,6 +1056,21 @@ class Router:
         for p in signature.parameters.values():
             validate_dependency(p.annotation)
 
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError("Batch size must be at least 1.")
+            if batch_linger < 0:
+                raise ValueError("Batch linger must be non-negative.")
+            if confirmation_mode in ("manual", "manual_explicit"):
+                raise ValueError(
+                    "Batch actors don't support 'manual' and 'manual_explicit' confirmation modes, "
+                    "return per-message results instead.",
+                )
+            _batch_item_fn(fn, fn_locals)
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1.")
+
         if on_error is None:
             on_error = "no_action" if confirmation_mode in ("manual", "manual_explicit") else "nack"
 
@@ -824,6 +1100,11 @@ class Router:
                 correlation_id=correlation_id,
                 fn_locals=fn_locals,
                 message_schema=message_schema,
+                batch_size=batch_size,
+                batch_linger=batch_linger,
+                max_concurrency=max_concurrency,
+                priority=priority,
             ),
         )
+        self._invalidate()
         return fn
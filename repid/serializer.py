@@ -1,10 +1,19 @@
 from typing import Any, Protocol
 
-from repid._utils import JSON_ENCODER, is_installed
+from repid._utils import is_installed, json_dumps
+from repid._utils.json_backend import JsonBackendT, get_json_backend, set_json_backend
 
 if is_installed("pydantic"):
     import pydantic
 
+__all__ = [
+    "JsonBackendT",
+    "SerializerT",
+    "default_serializer",
+    "get_json_backend",
+    "set_json_backend",
+]
+
 
 class SerializerT(Protocol):
     def __call__(self, data: Any) -> bytes: ...
@@ -15,4 +24,9 @@ def default_serializer(data: Any) -> bytes:
         if is_installed("pydantic", ">=2.0.0,<3.0.0"):
             return data.model_dump_json().encode()
         return data.json().encode()  # pragma: no cover
-    return JSON_ENCODER.encode(data).encode()
+    return json_dumps(data)
+
+
+def _content_type(serializer: SerializerT) -> str:
+    """Content type of the serialized payload, which is declared by codecs, JSON otherwise."""
+    return getattr(serializer, "content_type", "application/json")
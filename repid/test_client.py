@@ -9,10 +9,12 @@ from uuid import uuid4
 
 from typing_extensions import Self
 
-from repid._runner import _actor_run
+from repid._runner import _actor_leaf, _actor_run, _actor_run_batch
 from repid.connections.abc import CapabilitiesT, MessageAction, ServerT
 from repid.data import ActorExecutionContext, MessageData
+from repid.dependencies._scope import _WorkerScope
 from repid.message_registry import MessageRegistry
+from repid.serializer import _content_type
 
 if TYPE_CHECKING:
     from repid.main import Repid
@@ -267,11 +269,14 @@ class TestClient:
         self._producer_middleware_pipeline = app._producer_middleware_pipeline
         self._actor_publish = self._producer_middleware_pipeline(self._mock_server.publish)
         self._router = app._centralized_router._materialize()
+        self._worker_scope = _WorkerScope()
         self._actor_context = ActorExecutionContext(
             server=self._mock_server,
             publish=self._actor_publish,
             default_serializer=app.default_serializer,
+            worker_scope=self._worker_scope,
         )
+        self._actor_leaf = _actor_leaf(self._actor_context)
 
     @property
     def messages(self) -> MessageRegistry:
@@ -453,29 +458,34 @@ class TestClient:
             operation_id=operation_id,
             payload=serializer(payload),
             headers=headers,
-            content_type="application/json",
+            content_type=_content_type(serializer),
             server_name=server_name,
             server_specific_parameters=server_specific_parameters,
         )
 
     async def _process_message(self, test_message: TestMessage) -> TestMessage:
         # Find actors for this channel
-        actors = self._router._actors_per_channel_address.get(
-            test_message.channel,
-            [],
-        )
-        actor = next(filter(lambda actor: actor.routing_strategy(test_message), actors), None)
+        actors = self._router._actor_index_per_channel_address.get(test_message.channel)
+        actor = actors.match(test_message) if actors is not None else None
         if actor is None:
             if self.raise_on_actor_not_found:
                 raise ValueError(f"No actor found for channel '{test_message.channel}'")
             return test_message
 
         # _actor_run returns either the result or the exception
-        actor_result = await _actor_run(
-            actor=actor,
-            message=test_message,
-            actor_context=self._actor_context,
-        )
+        if actor.batch_size is None:
+            actor_result = await _actor_run(
+                actor=actor,
+                message=test_message,
+                leaf=self._actor_leaf,
+            )
+        else:
+            # messages are processed immediately, so every batch consists of a single message
+            (actor_result,) = await _actor_run_batch(
+                actor=actor,
+                messages=[test_message],
+                actor_context=self._actor_context,
+            )
 
         if isinstance(actor_result, Exception):
             test_message._exception = actor_result
@@ -620,3 +630,4 @@ class TestClient:
     ) -> None:
         """Stop the test client and cleanup."""
         self.clear()
+        await self._worker_scope.close()
@@ -527,7 +527,7 @@ def test_encode_annotation_keys_as_symbols() -> None:
         ),
     )
     assert frames[0].payload is not None
-    assert b"\xa3\tx-opt-key" in frames[0].payload
+    assert b"\xa3\tx-opt-key" in bytes(frames[0].payload)
 
 
 def test_application_properties_reject_nested_values() -> None:
@@ -554,7 +554,7 @@ def test_message_id_int_encodes_as_ulong() -> None:
         ),
     )
     assert frames[0].payload is not None
-    assert b"\x53\x01" in frames[0].payload
+    assert b"\x53\x01" in bytes(frames[0].payload)
 
 
 def test_message_id_rejects_float() -> None:
@@ -505,7 +505,7 @@ async def test_receiver_link_receive_message(receiver: ReceiverLink) -> None:
     received = []
 
     def on_message(
-        body: bytes,
+        body: bytes | memoryview,
         headers: dict[str, Any] | None,
         _delivery_id: int,
         _delivery_tag: bytes,
@@ -626,7 +626,7 @@ async def test_receiver_link_multi_frame_uses_first_transfer_delivery_metadata(
     received: list[tuple[int, bytes]] = []
 
     def on_message(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         delivery_id: int,
         delivery_tag: bytes,
@@ -692,7 +692,7 @@ async def test_receiver_link_credit_replenish(receiver: ReceiverLink) -> None:
     receiver._link_credit = 6
 
     def defer_credit(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         delivery_id: int,
         _delivery_tag: bytes,
@@ -740,9 +740,9 @@ async def test_receiver_link_prefetch_one_replenishes_credit(receiver: ReceiverL
 
 
 async def test_receiver_process_message_callback_async(receiver: ReceiverLink) -> None:
-    future: asyncio.Future[bytes] = asyncio.Future()
+    future: asyncio.Future[bytes | memoryview] = asyncio.Future()
 
-    async def on_message(body: bytes, *_: Any) -> None:
+    async def on_message(body: bytes | memoryview, *_: Any) -> None:
         future.set_result(body)
 
     receiver._callback = on_message
@@ -768,7 +768,7 @@ async def test_receiver_process_message_json_body(receiver: ReceiverLink) -> Non
     await receiver._handle_transfer(frames[0])
 
     assert len(received) == 1
-    assert json.loads(received[0].decode()) == {"key": "value"}
+    assert json.loads(bytes(received[0])) == {"key": "value"}
 
 
 async def test_receiver_process_message_str_body(receiver: ReceiverLink) -> None:
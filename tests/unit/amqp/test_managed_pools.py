@@ -341,7 +341,7 @@ async def test_receiver_pool_close_with_link_error() -> None:
 
 async def test_receiver_pool_on_reconnected_re_subscribe() -> None:
     async def callback(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         _delivery_id: int,
         _tag: bytes,
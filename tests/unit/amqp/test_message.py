@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from repid.connections.amqp._uamqp._decode import transfer_frames_to_message
-from repid.connections.amqp._uamqp._encode import message_to_transfer_frames
+from repid.connections.amqp._uamqp._decode import bytes_to_performative, transfer_frames_to_message
+from repid.connections.amqp._uamqp._encode import message_to_transfer_frames, performative_to_bytes
 from repid.connections.amqp._uamqp.message import Message
+from repid.connections.amqp._uamqp.performatives import TransferFrame
 
 
 def test_message_encoding_with_various_properties() -> None:
@@ -76,3 +77,18 @@ def test_message_with_footer() -> None:
     decoded_msg = transfer_frames_to_message(frames)
     assert decoded_msg.data == [b"data"]
     assert decoded_msg.footer == {"footer_key": "footer_value"}
+
+
+def test_message_decoding_keeps_data_as_view_into_frame() -> None:
+    msg = Message(data=[b"test data"])
+    frame = performative_to_bytes(next(message_to_transfer_frames(msg, 512, 0, b"tag", 1)))
+
+    transfer = bytes_to_performative(frame)
+    assert isinstance(transfer, TransferFrame)
+    decoded_msg = transfer_frames_to_message([transfer])
+
+    assert decoded_msg.data is not None
+    data = decoded_msg.data[0]
+    assert isinstance(data, memoryview)
+    assert data.obj is frame
+    assert data == b"test data"
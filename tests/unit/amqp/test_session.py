@@ -158,7 +158,7 @@ async def test_session_create_receiver_link_alias(monkeypatch: Any) -> None:
             pass
 
     async def callback(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         _delivery_id: int,
         _tag: bytes,
@@ -335,7 +335,7 @@ async def test_session_create_receiver_not_mapped(monkeypatch: Any) -> None:
             pass
 
     async def callback(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         _delivery_id: int,
         _tag: bytes,
@@ -429,7 +429,7 @@ async def test_session_create_receiver_default_name(monkeypatch: Any) -> None:
             pass
 
     async def callback(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         _delivery_id: int,
         _tag: bytes,
@@ -480,7 +480,7 @@ async def test_session_create_sender_not_usable_race() -> None:
 
 async def test_session_create_receiver_not_usable_race() -> None:
     async def callback(
-        _body: bytes,
+        _body: bytes | memoryview,
         _headers: dict[str, Any] | None,
         _delivery_id: int,
         _tag: bytes,
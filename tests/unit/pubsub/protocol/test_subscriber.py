@@ -176,6 +176,19 @@ async def test_request_iterator_initial_request() -> None:
     assert initial.stream_ack_deadline_seconds == 20
     assert initial.client_id == "cid"
     assert initial.max_outstanding_messages == 5
+    assert initial.max_outstanding_bytes == 0
+
+    await cast(AsyncGenerator[StreamingPullRequest, None], it).aclose()
+
+
+async def test_request_iterator_max_outstanding_bytes() -> None:
+    sub = _make_subscriber(max_outstanding_bytes=1024)
+    config = _make_config()
+
+    it = sub._request_iterator(config)
+    initial = await anext(it)
+
+    assert initial.max_outstanding_bytes == 1024
 
     await cast(AsyncGenerator[StreamingPullRequest, None], it).aclose()
 
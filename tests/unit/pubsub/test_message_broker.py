@@ -175,6 +175,19 @@ async def test_subscribe_creates_subscriber_via_factory() -> None:
         )
 
 
+async def test_subscribe_passes_max_outstanding_bytes() -> None:
+    server = message_broker.PubsubServer(default_project="p", max_outstanding_bytes=1024)
+    server._channel = MagicMock(spec=grpc.aio.Channel)
+
+    with patch(
+        "repid.connections.pubsub.message_broker.PubsubSubscriber.create",
+        new_callable=AsyncMock,
+    ) as mock_create:
+        await server.subscribe(channels_to_callbacks={"chan1": MagicMock()})
+
+        assert mock_create.call_args.kwargs["max_outstanding_bytes"] == 1024
+
+
 async def test_subscribe_raises_error_when_disconnected() -> None:
     server = message_broker.PubsubServer(default_project="p")
 
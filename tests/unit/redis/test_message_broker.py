@@ -75,7 +75,7 @@ def test_redis_build_message_fields() -> None:
     )
 
     assert fields[b"payload"] == payload
-    assert fields[b"headers"] == json.dumps(headers)
+    assert json.loads(fields[b"headers"]) == headers
     assert fields[b"content_type"] == content_type
     assert fields[b"reply_to"] == "reply-chan"
 
@@ -228,7 +228,7 @@ async def test_redis_publish(mock_redis_cls: MagicMock) -> None:
     args, kwargs = mock_client.xadd.call_args
     assert args[0] == "repid:test"
     assert args[1][b"payload"] == b"test"
-    assert args[1][b"headers"] == json.dumps({"h": "v"})
+    assert json.loads(args[1][b"headers"]) == {"h": "v"}
     assert args[1][b"content_type"] == "t"
     assert kwargs["id"] == "*"
 
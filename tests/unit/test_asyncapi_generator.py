@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import Annotated, Any, cast
 
 import pytest
 from pydantic import BaseModel
 
-from repid import Contact, ExternalDocs, Header, License, Repid, Router, Tag
+from repid import Contact, ExternalDocs, Header, License, MsgpackCodec, Repid, Router, Tag
 from repid.asyncapi import AsyncAPIGenerator
+from repid.asyncapi.models import MessageObject
 from repid.connections.amqp import AmqpServer
 from repid.connections.in_memory import InMemoryServer
 from repid.data.channel import Channel as ChannelData
@@ -1802,3 +1803,22 @@ def test_asyncapi_generator_actor_name_with_only_separators_uses_fallback_keys()
             "messages": [{"$ref": "#/channels/default/messages/message"}],
         },
     }
+
+
+def test_asyncapi_generator_actor_content_type_from_codec() -> None:
+    app = Repid()
+    router = Router()
+
+    @router.actor(
+        message_schema=ActorMessageMetadata(content_type=MsgpackCodec.content_type),
+    )
+    async def my_actor(x: int) -> None:
+        pass
+
+    app.include_router(router)
+
+    schema = app.generate_asyncapi_schema()
+
+    message = cast(MessageObject, schema["components"]["messages"]["my_actor"])
+    assert message["contentType"] == "application/msgpack"
+    assert message["payload"]["required"] == ["x"]
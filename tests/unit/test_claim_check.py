@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from repid import (
+    ClaimCheckActorMiddleware,
+    ClaimCheckMiddleware,
+    FileBlobStore,
+    Message,
+    Repid,
+    Router,
+    S3BlobStore,
+)
+from repid.claim_check import CLAIM_CHECK_HEADER
+from repid.data import MessageData
+from repid.test_client import TestClient
+
+PAYLOAD = b'{"rows": [' + b",".join(b"[1, 2, 3]" for _ in range(100)) + b"]}"
+
+
+async def test_file_blob_store(tmp_path: Path) -> None:
+    store = FileBlobStore(tmp_path)
+
+    await store.put("a/b", PAYLOAD)
+    assert await store.get("a/b") == PAYLOAD
+    assert b"".join([chunk async for chunk in store.stream("a/b", chunk_size=100)]) == PAYLOAD
+    assert [path.name for path in (tmp_path / "a").iterdir()] == ["b"]
+
+    await store.delete("a/b")
+    await store.delete("a/b")
+    assert not (tmp_path / "a" / "b").exists()
+
+
+@pytest.mark.parametrize("key", ["../outside", "/etc/passwd", "", "a/../.."])
+async def test_file_blob_store_invalid_key(tmp_path: Path, key: str) -> None:
+    store = FileBlobStore(tmp_path / "blobs")
+    with pytest.raises(ValueError, match="Invalid blob key"):
+        await store.get(key)
+
+
+async def test_s3_blob_store() -> None:
+    pytest.importorskip("aiobotocore")
+    body = MagicMock()
+    body.__aenter__ = AsyncMock(return_value=body)
+    body.__aexit__ = AsyncMock(return_value=None)
+    body.read = AsyncMock(return_value=PAYLOAD)
+
+    async def iter_chunks(chunk_size: int) -> Any:
+        for i in range(0, len(PAYLOAD), chunk_size):
+            yield PAYLOAD[i : i + chunk_size]
+
+    body.iter_chunks = iter_chunks
+    client = AsyncMock()
+    client.get_object.return_value = {"Body": body}
+
+    store = S3BlobStore("bucket", prefix="repid/", region_name="us-east-1")
+    with pytest.raises(RuntimeError, match="not connected"):
+        await store.get("key")
+
+    store._client = client
+    await store.put("key", PAYLOAD)
+    assert await store.get("key") == PAYLOAD
+    assert b"".join([chunk async for chunk in store.stream("key", chunk_size=100)]) == PAYLOAD
+    await store.delete("key")
+
+    client.put_object.assert_awaited_once_with(Bucket="bucket", Key="repid/key", Body=PAYLOAD)
+    client.delete_object.assert_awaited_once_with(Bucket="bucket", Key="repid/key")
+
+
+async def test_s3_blob_store_connection() -> None:
+    pytest.importorskip("aiobotocore")
+    store = S3BlobStore(
+        "bucket",
+        endpoint_url="http://localhost:9000",
+        region_name="us-east-1",
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+    )
+    async with store.connection():
+        assert store.is_connected
+    assert not store.is_connected
+
+
+async def _publish(middleware: ClaimCheckMiddleware, message: MessageData) -> MessageData:
+    sent: list[MessageData] = []
+
+    async def call_next(
+        _channel: str,
+        message: MessageData,
+        _server_specific_parameters: dict[str, Any] | None,
+    ) -> None:
+        sent.append(message)
+
+    await middleware(call_next, "default", message, None)
+    return sent[0]
+
+
+async def test_claim_check_middleware(tmp_path: Path) -> None:
+    store = FileBlobStore(tmp_path)
+    middleware = ClaimCheckMiddleware(store, threshold=100)
+
+    small = MessageData(payload=b'{"a": 1}')
+    assert await _publish(middleware, small) is small
+
+    message = MessageData(payload=PAYLOAD, headers={"topic": "a"}, content_type="application/json")
+    sent = await _publish(middleware, message)
+
+    assert sent.payload == b""
+    assert sent.content_type == "application/json"
+    assert sent.headers is not None
+    assert sent.headers["topic"] == "a"
+    assert await store.get(sent.headers[CLAIM_CHECK_HEADER]) == PAYLOAD
+
+    # already offloaded
+    assert await _publish(middleware, sent) is sent
+
+
+async def test_claim_check_middleware_deletes_blob_on_publish_error(tmp_path: Path) -> None:
+    store = FileBlobStore(tmp_path)
+    middleware = ClaimCheckMiddleware(store, threshold=100)
+
+    async def call_next(*_: Any) -> None:
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        await middleware(call_next, "default", MessageData(payload=PAYLOAD), None)
+    assert list(tmp_path.iterdir()) == []
+
+
+def _app(store: FileBlobStore, **actor_middleware_options: Any) -> tuple[Repid, Router]:
+    app = Repid(
+        producer_middlewares=[ClaimCheckMiddleware(store, threshold=100)],
+        actor_middlewares=[ClaimCheckActorMiddleware(store, **actor_middleware_options)],
+    )
+    return app, Router()
+
+
+async def test_claim_check_end_to_end(tmp_path: Path) -> None:
+    store = FileBlobStore(tmp_path)
+    app, router = _app(store)
+
+    received = []
+
+    @router.actor
+    async def big_actor(rows: list[list[int]]) -> None:
+        received.append(len(rows))
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message(
+            channel="default",
+            payload=PAYLOAD,
+            headers={"topic": "big_actor"},
+        )
+
+        processed = client.get_processed_messages()
+        assert processed[0].payload == b""
+        assert processed[0].success is True
+
+    assert received == [100]
+    # deleted after ack
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_claim_check_keeps_blob_if_not_acked(tmp_path: Path) -> None:
+    store = FileBlobStore(tmp_path)
+    app, router = _app(store)
+
+    @router.actor(on_error="nack")
+    async def failing_actor(rows: list[list[int]]) -> None:
+        raise ValueError(len(rows))
+
+    app.include_router(router)
+
+    async with TestClient(app, raise_on_actor_error=False) as client:
+        await client.send_message(
+            channel="default",
+            payload=PAYLOAD,
+            headers={"topic": "failing_actor"},
+        )
+
+        processed = client.get_processed_messages()
+        assert isinstance(processed[0].exception, ValueError)
+
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+async def test_claim_check_without_fetching(tmp_path: Path) -> None:
+    store = FileBlobStore(tmp_path)
+    app, router = _app(store, fetch=False)
+
+    received = []
+
+    @router.actor
+    async def streaming_actor(message: Message) -> None:
+        assert message.payload == b""
+        assert message.headers is not None
+        async for chunk in store.stream(message.headers[CLAIM_CHECK_HEADER], chunk_size=64):
+            received.append(chunk)
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message(
+            channel="default",
+            payload=PAYLOAD,
+            headers={"topic": "streaming_actor"},
+        )
+
+    assert b"".join(received) == PAYLOAD
+    assert len(received) > 1
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from repid._utils import is_installed
+from repid.codecs import (
+    _CODECS,
+    CborCodec,
+    CodecT,
+    JsonCodec,
+    MsgpackCodec,
+    get_codec,
+    register_codec,
+)
+
+_REQUIRES_MSGPACK = pytest.mark.skipif(
+    not is_installed("msgpack"),
+    reason="msgpack is not installed",
+)
+_REQUIRES_CBOR = pytest.mark.skipif(
+    not is_installed("cbor2"),
+    reason="cbor2 is not installed",
+)
+
+_CODEC_CLASSES = [
+    JsonCodec,
+    pytest.param(MsgpackCodec, marks=_REQUIRES_MSGPACK),
+    pytest.param(CborCodec, marks=_REQUIRES_CBOR),
+]
+
+
+class _Item(BaseModel):
+    sku: str
+    amount: int
+
+
+@pytest.fixture
+def codecs() -> Iterator[None]:
+    registered = dict(_CODECS)
+    yield
+    _CODECS.clear()
+    _CODECS.update(registered)
+
+
+@pytest.mark.parametrize("codec_cls", _CODEC_CLASSES)
+def test_codec_roundtrip(codec_cls: type[CodecT]) -> None:
+    codec = codec_cls()
+    data = {"a": 1, "b": [1.5, "x", None, True], "c": {"d": "e"}}
+    encoded = codec(data)
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == data
+
+
+@pytest.mark.parametrize("codec_cls", _CODEC_CLASSES)
+def test_codec_encodes_json_compatible_types(codec_cls: type[CodecT]) -> None:
+    codec = codec_cls()
+    decoded = codec.decode(codec({"item": _Item(sku="SKU-1", amount=2)}))
+    assert decoded == {"item": {"sku": "SKU-1", "amount": 2}}
+
+
+def test_msgpack_codec_encodes_types_as_json() -> None:
+    pytest.importorskip("msgpack")
+    codec = MsgpackCodec()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    decoded = codec.decode(codec({"id": uuid.UUID(int=1), "created_at": created_at}))
+    assert decoded == {"id": str(uuid.UUID(int=1)), "created_at": created_at.isoformat()}
+
+
+def test_cbor_codec_encodes_native_types() -> None:
+    pytest.importorskip("cbor2")
+    codec = CborCodec()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    decoded = codec.decode(codec({"id": uuid.UUID(int=1), "created_at": created_at}))
+    assert decoded == {"id": uuid.UUID(int=1), "created_at": created_at}
+
+
+@pytest.mark.parametrize(
+    ("content_type", "expected"),
+    [
+        pytest.param(None, JsonCodec, id="none"),
+        pytest.param("", JsonCodec, id="empty"),
+        pytest.param("application/json", JsonCodec, id="json"),
+        pytest.param("application/json; charset=utf-8", JsonCodec, id="json_with_parameters"),
+        pytest.param("application/msgpack", MsgpackCodec, id="msgpack", marks=_REQUIRES_MSGPACK),
+        pytest.param(
+            "application/x-msgpack",
+            MsgpackCodec,
+            id="msgpack_alias",
+            marks=_REQUIRES_MSGPACK,
+        ),
+        pytest.param(
+            "Application/CBOR",
+            CborCodec,
+            id="cbor_case_insensitive",
+            marks=_REQUIRES_CBOR,
+        ),
+    ],
+)
+def test_get_codec(content_type: str | None, expected: type) -> None:
+    assert isinstance(get_codec(content_type), expected)
+
+
+@pytest.mark.parametrize(
+    ("codec_cls", "dependency"),
+    [(MsgpackCodec, "msgpack"), (CborCodec, "cbor2")],
+)
+def test_codec_requires_package(
+    codec_cls: type[CodecT],
+    dependency: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("repid.codecs.is_installed", lambda _: False)
+
+    with pytest.raises(ValueError, match=f"requires '{dependency}' package"):
+        codec_cls()
+
+
+def test_get_codec_unsupported() -> None:
+    with pytest.raises(ValueError, match="Unsupported content type: text/plain"):
+        get_codec("text/plain")
+
+
+@pytest.mark.usefixtures("codecs")
+def test_register_codec() -> None:
+    class ReversedCodec:
+        content_type = "application/x-reversed"
+
+        def __call__(self, data: Any) -> bytes:
+            return str(data).encode()[::-1]
+
+        def decode(self, payload: bytes | memoryview) -> Any:
+            return bytes(payload)[::-1].decode()
+
+    codec = ReversedCodec()
+    register_codec(codec)
+    register_codec(codec, content_type="application/x-alias")
+
+    assert get_codec("application/x-reversed") is codec
+    assert get_codec("application/x-alias") is codec
+    assert get_codec("application/x-reversed").decode(codec("abc")) == "abc"
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from repid import (
+    CompressionMiddleware,
+    Repid,
+    Router,
+    register_compression_dictionary,
+    set_max_decompressed_size,
+)
+from repid._utils import is_installed
+from repid.compression import (
+    COMPRESSION_DICTIONARY_HEADER,
+    CONTENT_ENCODING_HEADER,
+    CompressionAlgorithmT,
+    decompress_payload,
+)
+from repid.data import MessageData
+from repid.test_client import TestClient
+
+_REQUIRES_ZSTD = pytest.mark.skipif(
+    not is_installed("zstandard"),
+    reason="zstandard is not installed",
+)
+_REQUIRES_LZ4 = pytest.mark.skipif(not is_installed("lz4"), reason="lz4 is not installed")
+
+PAYLOAD = json.dumps({"items": [{"sku": f"SKU-{i}", "amount": i} for i in range(50)]}).encode()
+
+
+async def _publish(
+    middleware: CompressionMiddleware,
+    message: MessageData,
+    channel: str = "default",
+) -> MessageData:
+    sent: list[MessageData] = []
+
+    async def call_next(
+        _channel: str,
+        message: MessageData,
+        _server_specific_parameters: dict[str, Any] | None,
+    ) -> None:
+        sent.append(message)
+
+    await middleware(call_next, channel, message, None)
+    return sent[0]
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        pytest.param("zstd", marks=_REQUIRES_ZSTD),
+        "gzip",
+        pytest.param("lz4", marks=_REQUIRES_LZ4),
+    ],
+)
+async def test_compression_roundtrip(algorithm: CompressionAlgorithmT) -> None:
+    message = MessageData(payload=PAYLOAD, headers={"topic": "a"}, content_type="application/json")
+    sent = await _publish(CompressionMiddleware(algorithm, threshold=100), message)
+
+    assert len(sent.payload) < len(PAYLOAD)
+    assert sent.headers == {"topic": "a", CONTENT_ENCODING_HEADER: algorithm}
+    assert sent.content_type == "application/json"
+    assert decompress_payload(sent) == PAYLOAD
+
+
+async def test_compression_gzip_is_compatible_with_gzip_module() -> None:
+    sent = await _publish(CompressionMiddleware("gzip", threshold=0), MessageData(payload=PAYLOAD))
+    assert gzip.decompress(sent.payload) == PAYLOAD
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(MessageData(payload=b'{"a": 1}'), id="below_threshold"),
+        pytest.param(MessageData(payload=os.urandom(2048)), id="incompressible"),
+        pytest.param(
+            MessageData(payload=PAYLOAD, headers={CONTENT_ENCODING_HEADER: "br"}),
+            id="already_encoded",
+        ),
+    ],
+)
+async def test_compression_skipped(message: MessageData) -> None:
+    assert await _publish(CompressionMiddleware("gzip", threshold=100), message) is message
+
+
+async def test_compression_dictionary_per_channel() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    samples = [
+        json.dumps({"order_id": i, "status": "created", "customer": {"id": i * 7}}).encode()
+        for i in range(1000)
+    ]
+    dictionary = zstandard.train_dictionary(1024, list(samples)).as_bytes()
+    middleware = CompressionMiddleware(threshold=0, dictionaries={"orders": dictionary})
+    payload = samples[0]
+
+    with_dictionary = await _publish(middleware, MessageData(payload=payload), channel="orders")
+    without_dictionary = await _publish(middleware, MessageData(payload=payload), channel="other")
+
+    assert with_dictionary.headers is not None
+    dictionary_id = with_dictionary.headers[COMPRESSION_DICTIONARY_HEADER]
+    assert dictionary_id == register_compression_dictionary(dictionary)
+    assert len(with_dictionary.payload) < len(payload)
+    # too small to get any smaller without the dictionary
+    assert without_dictionary.headers is None
+    assert decompress_payload(with_dictionary) == payload
+
+
+def test_decompress_payload_unknown_dictionary() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    message = MessageData(
+        payload=zstandard.ZstdCompressor().compress(PAYLOAD),
+        headers={CONTENT_ENCODING_HEADER: "zstd", COMPRESSION_DICTIONARY_HEADER: "unknown"},
+    )
+    with pytest.raises(ValueError, match="Unknown compression dictionary 'unknown'"):
+        decompress_payload(message)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        pytest.param(None, PAYLOAD, id="no_headers"),
+        pytest.param({"topic": "a"}, PAYLOAD, id="no_encoding"),
+        pytest.param({CONTENT_ENCODING_HEADER: "identity"}, PAYLOAD, id="identity"),
+    ],
+)
+def test_decompress_payload_not_compressed(
+    headers: dict[str, str] | None,
+    expected: bytes,
+) -> None:
+    message = MessageData(payload=PAYLOAD, headers=headers)
+    assert decompress_payload(message) == expected
+
+
+def test_decompress_payload_unsupported_encoding() -> None:
+    message = MessageData(payload=PAYLOAD, headers={CONTENT_ENCODING_HEADER: "br"})
+    with pytest.raises(ValueError, match="Unsupported content encoding: br"):
+        decompress_payload(message)
+
+
+def test_compression_middleware_invalid_options() -> None:
+    with pytest.raises(ValueError, match="Unknown compression algorithm 'brotli'"):
+        CompressionMiddleware("brotli")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="only supported with zstd"):
+        CompressionMiddleware("gzip", dictionaries={"orders": b"dictionary"})
+
+
+async def test_compression_end_to_end() -> None:
+    pytest.importorskip("zstandard")
+    app = Repid(producer_middlewares=[CompressionMiddleware(threshold=100)])
+    router = Router()
+
+    received = []
+
+    @router.actor
+    async def compressed_actor(items: list[dict[str, Any]]) -> None:
+        received.append(items)
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message_json(
+            channel="default",
+            payload=json.loads(PAYLOAD),
+            headers={"topic": "compressed_actor"},
+        )
+
+        processed = client.get_processed_messages()
+        assert processed[0].headers is not None
+        assert processed[0].headers[CONTENT_ENCODING_HEADER] == "zstd"
+        assert processed[0].success is True
+        assert received == [json.loads(PAYLOAD)["items"]]
+
+
+@pytest.fixture
+def max_decompressed_size() -> Iterator[None]:
+    yield
+    set_max_decompressed_size()
+
+
+@pytest.mark.usefixtures("max_decompressed_size")
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        pytest.param("zstd", marks=_REQUIRES_ZSTD),
+        "gzip",
+        pytest.param("lz4", marks=_REQUIRES_LZ4),
+    ],
+)
+async def test_decompress_payload_over_limit(algorithm: CompressionAlgorithmT) -> None:
+    sent = await _publish(
+        CompressionMiddleware(algorithm, threshold=0),
+        MessageData(payload=PAYLOAD),
+    )
+
+    set_max_decompressed_size(len(PAYLOAD))
+    assert decompress_payload(sent) == PAYLOAD
+
+    set_max_decompressed_size(len(PAYLOAD) - 1)
+    with pytest.raises(ValueError, match=f"limit of {len(PAYLOAD) - 1} bytes"):
+        decompress_payload(sent)
+
+    set_max_decompressed_size(None)
+    assert decompress_payload(sent) == PAYLOAD
+
+
+@pytest.mark.usefixtures("max_decompressed_size")
+def test_decompress_payload_zstd_stream_over_limit() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    # compressed as a stream, so the size isn't known from the frame header
+    message = MessageData(
+        payload=zstandard.ZstdCompressor(write_content_size=False).compress(PAYLOAD),
+        headers={CONTENT_ENCODING_HEADER: "zstd"},
+    )
+
+    assert decompress_payload(message) == PAYLOAD
+
+    set_max_decompressed_size(len(PAYLOAD) - 1)
+    with pytest.raises(ValueError, match="can't be decompressed within the limit"):
+        decompress_payload(message)
+
+
+@pytest.mark.parametrize("algorithm", ["gzip", pytest.param("lz4", marks=_REQUIRES_LZ4)])
+async def test_decompress_payload_incomplete(algorithm: CompressionAlgorithmT) -> None:
+    sent = await _publish(
+        CompressionMiddleware(algorithm, threshold=0),
+        MessageData(payload=PAYLOAD),
+    )
+    message = MessageData(payload=sent.payload[:-8], headers=sent.headers)
+
+    with pytest.raises(ValueError, match="Compressed payload is incomplete"):
+        decompress_payload(message)
+
+
+def test_set_max_decompressed_size_invalid() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        set_max_decompressed_size(0)
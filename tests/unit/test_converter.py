@@ -1,18 +1,57 @@
 from __future__ import annotations
 
+import gzip
 import json
+import uuid
+from datetime import datetime, timezone
 from typing import Annotated
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 from repid import FullPayload, Header
-from repid.converter import BasicConverter, ConverterT, PydanticConverter
+from repid._utils import is_installed
+from repid.codecs import CborCodec, CodecT, MsgpackCodec, get_codec
+from repid.compression import CONTENT_ENCODING_HEADER
+from repid.converter import (
+    BasicConverter,
+    ConverterT,
+    MsgspecConverter,
+    PydanticConverter,
+    PydanticDictConverter,
+)
 from repid.data import ActorExecutionContext, MessageData
 from repid.dependencies import Depends
 from repid.serializer import default_serializer
 
+if is_installed("msgspec"):
+    import msgspec
+
+    class _Location(msgspec.Struct):
+        lat: float
+        lon: float
+
+    class _Reading(msgspec.Struct):
+        sensor: str
+        location: _Location
+        values: list[float] = []
+
+
+_REQUIRES_MSGPACK = pytest.mark.skipif(
+    not is_installed("msgpack"),
+    reason="msgpack is not installed",
+)
+_REQUIRES_CBOR = pytest.mark.skipif(
+    not is_installed("cbor2"),
+    reason="cbor2 is not installed",
+)
+
+_MSGSPEC_CONVERTER = pytest.param(
+    MsgspecConverter,
+    marks=pytest.mark.skipif(not is_installed("msgspec"), reason="msgspec is not installed"),
+)
+
 _CONVERTER_CONTEXT = ActorExecutionContext(
     server=Mock(),
     publish=AsyncMock(),
@@ -27,7 +66,7 @@ _CONVERTER_CONTEXT = ActorExecutionContext(
         pytest.param(b'{"a": 5}', {"a": 5, "b": 1}, id="partial_dict"),
     ],
 )
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_parses_payload_args_kwargs(
     converter: type[ConverterT],
     payload: bytes,
@@ -56,7 +95,7 @@ async def test_converter_parses_payload_args_kwargs(
         pytest.param(b'{"a": 5}', [5], {"b": 1}, id="partial_dict"),
     ],
 )
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_parses_payload_positional_args(
     converter: type[ConverterT],
     payload: bytes,
@@ -160,7 +199,7 @@ async def test_pydantic_converter_validation_errors(
         )
 
 
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_not_json_error(converter: type[ConverterT]) -> None:
     async def fn(a: int, b: float) -> None: ...
 
@@ -177,7 +216,7 @@ async def test_converter_not_json_error(converter: type[ConverterT]) -> None:
         )
 
 
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_header_in_depends(converter: type[ConverterT]) -> None:
     def _header_dep(h: Annotated[str, Header(name="X-Custom")]) -> str:
         return f"got: {h}"
@@ -210,7 +249,7 @@ async def test_converter_header_in_depends(converter: type[ConverterT]) -> None:
         {"X-Other": "whatever", "X-Custom": "header_value"},
     ],
 )
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_header(converter: type[ConverterT], input_headers: dict) -> None:
     async def _fn_with_header(d: Annotated[str, Header(name="X-Custom")]) -> None: ...
 
@@ -242,7 +281,7 @@ async def test_converter_header(converter: type[ConverterT], input_headers: dict
         {"X-Custom": "default_value"},
     ],
 )
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_header_defaults(converter: type[ConverterT], input_headers: dict) -> None:
     async def _fn_with_header(
         d: Annotated[str, Header(name="X-Custom")] = "default_value",
@@ -274,7 +313,7 @@ async def test_converter_header_defaults(converter: type[ConverterT], input_head
         b'{"h": "default_value", "extra": 123}',
     ],
 )
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_payload_in_depends(
     input_payload: bytes,
     converter: type[ConverterT],
@@ -306,7 +345,7 @@ async def test_converter_payload_in_depends(
 
 
 @pytest.mark.parametrize("input_payload", [b"", b"{}", b'{"h": "default_value"}'])
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_payload_in_depends_with_default(
     input_payload: bytes,
     converter: type[ConverterT],
@@ -338,7 +377,7 @@ async def test_converter_payload_in_depends_with_default(
 
 
 @pytest.mark.parametrize("input_headers", [None, {}, {"X-Other": None}])
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_header_in_depends_with_default(
     input_headers: dict | None,
     converter: type[ConverterT],
@@ -409,7 +448,7 @@ async def test_pydantic_converter_generates_input_schema() -> None:
     assert schema.examples is None
 
 
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_unsupported_content_type(converter: type[ConverterT]) -> None:
     async def fn(a: int) -> None: ...
 
@@ -426,6 +465,134 @@ async def test_converter_unsupported_content_type(converter: type[ConverterT]) -
         )
 
 
+@pytest.mark.parametrize(
+    "codec_cls",
+    [
+        pytest.param(MsgpackCodec, marks=_REQUIRES_MSGPACK),
+        pytest.param(CborCodec, marks=_REQUIRES_CBOR),
+    ],
+)
+@pytest.mark.parametrize(
+    "converter",
+    [BasicConverter, PydanticConverter, PydanticDictConverter, _MSGSPEC_CONVERTER],
+)
+async def test_converter_decodes_binary_content_type(
+    converter: type[ConverterT],
+    codec_cls: type[CodecT],
+) -> None:
+    async def fn(a: int, b: list[str], c: float = 1.5) -> None: ...
+
+    codec = codec_cls()
+    conv = converter(fn, correlation_id=None, fn_locals=None)
+    args, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=codec({"a": 5, "b": ["x", "y"]}),
+            headers=None,
+            content_type=codec.content_type,
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert args == []
+    assert kwargs == {"a": 5, "b": ["x", "y"], "c": 1.5}
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/json", pytest.param("application/msgpack", marks=_REQUIRES_MSGPACK)],
+)
+@pytest.mark.parametrize(
+    "converter",
+    [BasicConverter, PydanticConverter, PydanticDictConverter, _MSGSPEC_CONVERTER],
+)
+async def test_converter_decompresses_payload(
+    converter: type[ConverterT],
+    content_type: str,
+) -> None:
+    async def fn(a: int, b: list[str]) -> None: ...
+
+    codec = get_codec(content_type)
+    conv = converter(fn, correlation_id=None, fn_locals=None)
+    _, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=gzip.compress(codec({"a": 5, "b": ["x"]})),
+            headers={CONTENT_ENCODING_HEADER: "gzip"},
+            content_type=content_type,
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert kwargs == {"a": 5, "b": ["x"]}
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/json", pytest.param("application/msgpack", marks=_REQUIRES_MSGPACK)],
+)
+@pytest.mark.parametrize(
+    "converter",
+    [BasicConverter, PydanticConverter, PydanticDictConverter, _MSGSPEC_CONVERTER],
+)
+async def test_converter_accepts_memoryview_payload(
+    converter: type[ConverterT],
+    content_type: str,
+) -> None:
+    async def fn(a: int, b: list[str]) -> None: ...
+
+    codec = get_codec(content_type)
+    conv = converter(fn, correlation_id=None, fn_locals=None)
+    _, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=memoryview(b"--" + codec({"a": 5, "b": ["x"]}))[2:],  # type: ignore[arg-type]
+            headers=None,
+            content_type=content_type,
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert kwargs == {"a": 5, "b": ["x"]}
+
+
+@pytest.mark.parametrize(
+    "converter",
+    [PydanticConverter, PydanticDictConverter, _MSGSPEC_CONVERTER],
+)
+async def test_converter_validates_binary_content_type(converter: type[ConverterT]) -> None:
+    pytest.importorskip("msgpack")
+
+    async def fn(created_at: datetime, user_id: uuid.UUID) -> None: ...
+
+    codec = MsgpackCodec()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    conv = converter(fn, correlation_id=None, fn_locals=None)
+    _, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=codec({"created_at": created_at, "user_id": uuid.UUID(int=1)}),
+            headers=None,
+            content_type="application/x-msgpack",
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert kwargs == {"created_at": created_at, "user_id": uuid.UUID(int=1)}
+
+    errors = (
+        (ValidationError, msgspec.ValidationError)
+        if converter is MsgspecConverter
+        else ValidationError
+    )
+    with pytest.raises(errors):
+        await conv.convert_inputs(
+            message=MessageData(  # type: ignore[arg-type]
+                payload=codec({"created_at": "not a date", "user_id": uuid.UUID(int=1)}),
+                headers=None,
+                content_type="application/msgpack",
+            ),
+            actor=None,  # type: ignore[arg-type]
+            actor_context=_CONVERTER_CONTEXT,
+        )
+
+
 async def test_basic_converter_payload_not_dict() -> None:
     async def fn(a: int) -> None: ...
 
@@ -490,7 +657,7 @@ async def test_basic_converter_get_input_schema_raises() -> None:
 
 
 @pytest.mark.parametrize("payload", [b"", b"{}"])
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_empty_payload(payload: bytes, converter: type[ConverterT]) -> None:
     async def fn(a: int = 5) -> None: ...
 
@@ -508,7 +675,7 @@ async def test_converter_empty_payload(payload: bytes, converter: type[Converter
     assert kwargs == {"a": 5}
 
 
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_positional_only_with_dependency_raises(
     converter: type[ConverterT],
 ) -> None:
@@ -535,7 +702,7 @@ async def test_pydantic_converter_var_kwargs_raises() -> None:
         PydanticConverter(fn, correlation_id=None, fn_locals=None)
 
 
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_header_no_name_uses_param_name(converter: type[ConverterT]) -> None:
     def _header_dep_no_name(custom_header: Annotated[str, Header()]) -> str:
         return f"got: {custom_header}"
@@ -558,7 +725,7 @@ async def test_converter_header_no_name_uses_param_name(converter: type[Converte
 
 
 @pytest.mark.parametrize("input_headers", [None, {}, {"X-Other": None}])
-@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter])
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
 async def test_converter_header_default_uses_param_name(
     input_headers: dict | None,
     converter: type[ConverterT],
@@ -869,3 +1036,248 @@ def test_basic_converter_full_payload_model_raises() -> None:
 
     with pytest.raises(ValueError, match="FullPayload\\(\\) requires PydanticConverter"):
         BasicConverter(fn, fn_locals=locals(), correlation_id=None)
+
+
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
+async def test_converter_without_dependencies_skips_resolution(
+    converter: type[ConverterT],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fn(a: int, /, b: int = 1) -> None: ...
+
+    resolve = AsyncMock()
+    monkeypatch.setattr("repid.converter._resolve_dependencies", resolve)
+
+    conv = converter(fn, correlation_id=None, fn_locals=None)
+    args, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=b'{"a": 5, "b": 3}',
+            headers={"b": "ignored"},
+            content_type="application/json",
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+
+    assert args == [5]
+    assert kwargs == {"b": 3}
+    resolve.assert_not_awaited()
+
+
+@pytest.mark.parametrize("converter", [BasicConverter, PydanticConverter, _MSGSPEC_CONVERTER])
+async def test_converter_single_dependency(converter: type[ConverterT]) -> None:
+    async def fn(a: int, tenant: Annotated[str, Header(name="X-Tenant")]) -> None: ...
+
+    conv = converter(fn, correlation_id=None, fn_locals=None)
+    args, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=b'{"a": 5}',
+            headers={"X-Tenant": "acme"},
+            content_type="application/json",
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+
+    assert args == []
+    assert kwargs == {"a": 5, "tenant": "acme"}
+
+
+async def _convert(
+    conv: ConverterT,
+    payload: bytes,
+    headers: dict[str, str] | None = None,
+) -> tuple[list, dict]:
+    return await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=payload,
+            headers=headers,
+            content_type="application/json",
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+
+
+async def test_pydantic_dict_converter_parses_payload() -> None:
+    async def fn(
+        a: int,
+        /,
+        b: str,
+        c: list[int] = [],  # noqa: B006
+        d: list[int] = Field(default_factory=lambda: [1]),  # noqa: B008
+    ) -> None: ...
+
+    conv = PydanticDictConverter(fn, correlation_id=None, fn_locals=None)
+
+    args, kwargs = await _convert(conv, b'{"a": "5", "b": "x"}')
+    assert args == [5]
+    assert kwargs == {"b": "x", "c": [], "d": [1]}
+    kwargs["c"].append(1)
+
+    _, kwargs = await _convert(conv, b'{"a": 5, "b": "y", "c": [2]}')
+    assert kwargs == {"b": "y", "c": [2], "d": [1]}
+
+    _, kwargs = await _convert(conv, b'{"a": 5, "b": "z"}')
+    assert kwargs["c"] == []  # defaults aren't shared between messages
+
+    with pytest.raises(ValidationError):
+        await _convert(conv, b'{"a": "not a number", "b": "x"}')
+
+
+async def test_pydantic_dict_converter_headers() -> None:
+    def _dep(
+        tenant: Annotated[str, Header(name="X-Tenant")],
+        retries: Annotated[int, Header(name="X-Retries")] = 0,
+    ) -> str:
+        return f"{tenant}:{retries}"
+
+    async def raw(a: int, tenant: Annotated[str, Header(name="X-Tenant")]) -> None: ...
+
+    async def typed(a: int, dep: Annotated[str, Depends(_dep)]) -> None: ...
+
+    raw_conv = PydanticDictConverter(raw, correlation_id=None, fn_locals=None)
+    typed_conv = PydanticDictConverter(typed, correlation_id=None, fn_locals=locals())
+
+    assert raw_conv._headers_adapter is None
+    assert await _convert(raw_conv, b'{"a": 1}', {"X-Tenant": "acme"}) == (
+        [],
+        {"a": 1, "tenant": "acme"},
+    )
+    with pytest.raises(ValidationError, match="X-Tenant"):
+        await _convert(raw_conv, b'{"a": 1}', {})
+
+    assert await _convert(typed_conv, b'{"a": 1}', {"X-Tenant": "acme", "X-Retries": "3"}) == (
+        [],
+        {"a": 1, "dep": "acme:3"},
+    )
+    assert await _convert(typed_conv, b'{"a": 1}', {"X-Tenant": "acme"}) == (
+        [],
+        {"a": 1, "dep": "acme:0"},
+    )
+    with pytest.raises(ValidationError):
+        await _convert(typed_conv, b'{"a": 1}', {"X-Tenant": "acme", "X-Retries": "many"})
+
+
+async def test_pydantic_dict_converter_rejects_full_payload() -> None:
+    class Model(BaseModel):
+        a: int
+
+    async def fn(payload: Annotated[Model, FullPayload()]) -> None: ...
+
+    with pytest.raises(ValueError, match=r"FullPayload\(\) requires PydanticConverter"):
+        PydanticDictConverter(fn, correlation_id=None, fn_locals=locals())
+
+
+async def test_pydantic_dict_converter_input_schema() -> None:
+    async def fn(
+        a: int,
+        tenant: Annotated[str, Header(name="X-Tenant")],
+        b: str = "x",
+    ) -> None: ...
+
+    schema = PydanticDictConverter(fn, correlation_id=None, fn_locals=None).get_input_schema()
+
+    assert schema.content_type == "application/json"
+    assert schema.payload_schema is not None
+    assert schema.payload_schema["properties"].keys() == {"a", "b"}
+    assert schema.payload_schema["required"] == ["a"]
+    assert schema.headers_schema is not None
+    assert schema.headers_schema["required"] == ["X-Tenant"]
+
+
+async def test_msgspec_converter_parses_payload() -> None:
+    pytest.importorskip("msgspec")
+
+    async def fn(
+        a: int,
+        /,
+        b: str,
+        c: list[int] = [1],  # noqa: B006
+    ) -> None: ...
+
+    conv = MsgspecConverter(fn, correlation_id=None, fn_locals=None)
+
+    args, kwargs = await _convert(conv, b'{"a": 5, "b": "x"}')
+    assert args == [5]
+    assert kwargs == {"b": "x", "c": [1]}
+    kwargs["c"].append(2)
+
+    _, kwargs = await _convert(conv, b'{"a": 5, "b": "z"}')
+    assert kwargs["c"] == [1]  # defaults aren't shared between messages
+
+    with pytest.raises(msgspec.ValidationError, match="Expected `int`, got `str`"):
+        await _convert(conv, b'{"a": "5", "b": "x"}')
+
+
+async def test_msgspec_converter_full_payload() -> None:
+    pytest.importorskip("msgspec")
+
+    async def fn(reading: Annotated[_Reading, FullPayload()], request_id: str) -> None: ...
+
+    async def only_list(values: Annotated[list[int], FullPayload()]) -> None: ...
+
+    conv = MsgspecConverter(fn, correlation_id=None, fn_locals=None)
+    list_conv = MsgspecConverter(only_list, correlation_id=None, fn_locals=None)
+
+    _, kwargs = await _convert(
+        conv,
+        b'{"sensor": "s1", "location": {"lat": 1.5, "lon": 2}, "request_id": "r"}',
+    )
+    assert kwargs["request_id"] == "r"
+    assert isinstance(kwargs["reading"], _Reading)
+    assert kwargs["reading"].location == _Location(lat=1.5, lon=2.0)
+
+    assert await _convert(list_conv, b"[1, 2]") == ([], {"values": [1, 2]})
+
+    async def invalid(values: Annotated[list[int], FullPayload()], other: int) -> None: ...
+
+    with pytest.raises(ValueError, match="non-struct type can't be combined"):
+        MsgspecConverter(invalid, correlation_id=None, fn_locals=None)
+
+
+async def test_msgspec_converter_headers() -> None:
+    pytest.importorskip("msgspec")
+
+    def _dep(
+        tenant: Annotated[str, Header(name="X-Tenant")],
+        retries: Annotated[int, Header(name="X-Retries")] = 0,
+    ) -> str:
+        return f"{tenant}:{retries}"
+
+    async def fn(a: int, dep: Annotated[str, Depends(_dep)]) -> None: ...
+
+    conv = MsgspecConverter(fn, correlation_id=None, fn_locals=locals())
+
+    assert await _convert(conv, b'{"a": 1}', {"X-Tenant": "acme", "X-Retries": "3"}) == (
+        [],
+        {"a": 1, "dep": "acme:3"},
+    )
+    assert await _convert(conv, b'{"a": 1}', {"X-Tenant": "acme"}) == (
+        [],
+        {"a": 1, "dep": "acme:0"},
+    )
+    with pytest.raises(msgspec.ValidationError, match="X-Tenant"):
+        await _convert(conv, b'{"a": 1}', {})
+
+
+async def test_msgspec_converter_input_schema() -> None:
+    pytest.importorskip("msgspec")
+
+    async def fn(
+        reading: _Reading,
+        tenant: Annotated[str, Header(name="X-Tenant")],
+        b: str = "x",
+    ) -> None: ...
+
+    schema = MsgspecConverter(fn, correlation_id=None, fn_locals=None).get_input_schema()
+
+    assert schema.content_type == "application/json"
+    assert schema.payload_schema["title"] == "fn_payload"
+    assert schema.payload_schema["required"] == ["reading"]
+    assert schema.payload_schema["properties"]["reading"] == {
+        "$ref": "#/components/schemas/_Reading",
+    }
+    assert set(schema.payload_schema["$defs"]) == {"_Reading", "_Location"}
+    assert schema.headers_schema is not None
+    assert schema.headers_schema["properties"] == {"X-Tenant": {"type": "string"}}
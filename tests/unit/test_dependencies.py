@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import AsyncIterator, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any
 from unittest.mock import AsyncMock, Mock
@@ -8,7 +10,7 @@ import pytest
 from annotated_types import Gt
 from pydantic import ValidationError
 
-from repid import Header, Message, Repid, Router
+from repid import Header, Message, MsgpackCodec, Repid, Router
 from repid.connections.abc import MessageAction
 from repid.converter import BasicConverter, DefaultConverter
 from repid.data import ActorExecutionContext, MessageData
@@ -42,6 +44,14 @@ def test_depends_raises_on_both_run_in_process_and_pool_executor() -> None:
         dep.override(lambda: None, run_in_process=True, pool_executor=executor)
 
 
+def test_depends_raises_on_inline_with_executor() -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"'inline' can't be combined with 'run_in_process' or 'pool_executor'\.",
+    ):
+        Depends(lambda: None, inline=True, run_in_process=True)
+
+
 async def test_simple_message_dependency() -> None:
     app = Repid()
     router = Router()
@@ -173,6 +183,26 @@ async def test_message_dependency_reply() -> None:
         assert reply_msg.payload == b'{"response":"ok"}'
 
 
+async def test_message_dependency_reply_with_codec() -> None:
+    pytest.importorskip("msgpack")
+
+    app = Repid()
+    router = Router()
+
+    @router.actor
+    async def myactor(m: Message) -> None:
+        await m.reply_json(payload={"response": "ok"}, channel="default", serializer=MsgpackCodec())
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message_json(channel="default", payload={}, headers={"topic": "myactor"})
+
+        _, reply_msg = client._sent_messages[0]._reply_messages[0]
+        assert reply_msg.content_type == "application/msgpack"
+        assert MsgpackCodec().decode(reply_msg.payload) == {"response": "ok"}
+
+
 async def test_message_dependency_reply_fallback() -> None:
     def _default_serializer(data: object) -> bytes:
         _ = data
@@ -768,3 +798,192 @@ def test_get_dependency_skips_class_metadata() -> None:
     header_instance = Header()
     result = get_dependency(Annotated[str, header_instance])
     assert result is header_instance
+
+
+async def test_shared_dependency_is_resolved_once_per_message() -> None:
+    calls = 0
+
+    async def _shared() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    shared = Depends(_shared)
+
+    def _left(s: Annotated[int, shared]) -> int:
+        return s
+
+    async def _right(s: Annotated[int, shared]) -> int:
+        return s
+
+    async def _fn(
+        left: Annotated[int, Depends(_left)],
+        right: Annotated[int, Depends(_right)],
+        s: Annotated[int, shared],
+    ) -> None:
+        pass
+
+    conv = DefaultConverter(_fn, correlation_id=None, fn_locals=locals())
+
+    for expected in (1, 2):
+        _, kwargs = await conv.convert_inputs(
+            message=MessageData(  # type: ignore[arg-type]
+                payload=b"{}",
+                headers=None,
+                content_type="application/json",
+            ),
+            actor=None,  # type: ignore[arg-type]
+            actor_context=_CONVERTER_CONTEXT,
+        )
+        assert kwargs == {"left": expected, "right": expected, "s": expected}
+    assert calls == 2
+
+
+async def test_inline_dependency_runs_on_event_loop() -> None:
+    thread_ids: list[int] = []
+
+    def _inline(arg: int) -> int:
+        thread_ids.append(threading.get_ident())
+        return arg * 2
+
+    async def _fn(d: Annotated[int, Depends(_inline, inline=True)]) -> None:
+        pass
+
+    conv = BasicConverter(_fn, correlation_id=None, fn_locals=locals())
+
+    _, kwargs = await conv.convert_inputs(
+        message=MessageData(  # type: ignore[arg-type]
+            payload=b'{"arg": 2}',
+            headers=None,
+            content_type="application/json",
+        ),
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert kwargs == {"d": 4}
+    assert thread_ids == [threading.get_ident()]
+
+
+async def test_dependency_plan_picks_up_override() -> None:
+    def _original() -> str:
+        return "original"
+
+    async def _sub() -> str:
+        return "sub"
+
+    dep = Depends(_original)
+
+    async def _fn(d: Annotated[str, dep]) -> None:
+        pass
+
+    conv = BasicConverter(_fn, correlation_id=None, fn_locals=locals())
+    message: Any = MessageData(payload=b"{}", headers=None, content_type="application/json")
+
+    _, kwargs = await conv.convert_inputs(
+        message=message,
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert kwargs == {"d": "original"}
+
+    def _overridden(s: Annotated[str, Depends(_sub)]) -> str:
+        return "overridden " + s
+
+    dep.override(_overridden, inline=True)
+
+    _, kwargs = await conv.convert_inputs(
+        message=message,
+        actor=None,  # type: ignore[arg-type]
+        actor_context=_CONVERTER_CONTEXT,
+    )
+    assert kwargs == {"d": "overridden sub"}
+
+
+async def test_worker_scoped_dependency_is_shared_until_shutdown() -> None:
+    app = Repid()
+    router = Router()
+    events: list[str] = []
+
+    def _settings() -> dict[str, str]:
+        events.append("settings")
+        return {"url": "http://example.com"}
+
+    settings = Depends(_settings, scope="worker")
+
+    async def _client(s: Annotated[dict[str, str], settings]) -> AsyncIterator[str]:
+        events.append("client setup")
+        yield s["url"]
+        events.append("client teardown")
+
+    client = Depends(_client, scope="worker")
+
+    async def _per_message(c: Annotated[str, client], arg1: str) -> str:
+        return f"{c}/{arg1}"
+
+    received: list[str] = []
+
+    @router.actor
+    async def myactor(
+        url: Annotated[str, Depends(_per_message)],
+        c: Annotated[str, client],
+    ) -> None:
+        received.append(url)
+        assert c == "http://example.com"
+
+    app.include_router(router)
+
+    async with TestClient(app) as test_client:
+        for arg in ("a", "b"):
+            await test_client.send_message_json(
+                channel="default",
+                payload={"arg1": arg},
+                headers={"topic": "myactor"},
+            )
+        assert events == ["settings", "client setup"]
+
+    assert received == ["http://example.com/a", "http://example.com/b"]
+    assert events == ["settings", "client setup", "client teardown"]
+
+
+def test_worker_scoped_dependency_validation() -> None:
+    def _with_payload(arg: str) -> str:
+        return arg
+
+    with pytest.raises(ValueError, match="can't use arguments from the payload"):
+        Depends(_with_payload, scope="worker")
+
+    def _with_message_scoped(h: Annotated[str, Header()]) -> str:
+        return h
+
+    with pytest.raises(ValueError, match="can only depend on other worker-scoped"):
+        Depends(_with_message_scoped, scope="worker")
+
+    def _generator() -> Iterator[int]:
+        yield 1
+
+    with pytest.raises(ValueError, match=r"only supported with scope='worker'"):
+        Depends(_generator)
+
+    with pytest.raises(ValueError, match="Unknown dependency scope 'app'"):
+        Depends(_generator, scope="app")  # type: ignore[arg-type]
+
+
+async def test_worker_scoped_dependency_requires_worker() -> None:
+    async def _client() -> str:
+        return "client"
+
+    async def _fn(c: Annotated[str, Depends(_client, scope="worker")]) -> None:
+        pass
+
+    conv = BasicConverter(_fn, correlation_id=None, fn_locals=locals())
+
+    with pytest.raises(ValueError, match="can only be resolved inside of a worker"):
+        await conv.convert_inputs(
+            message=MessageData(  # type: ignore[arg-type]
+                payload=b"{}",
+                headers=None,
+                content_type="application/json",
+            ),
+            actor=None,  # type: ignore[arg-type]
+            actor_context=_CONVERTER_CONTEXT,
+        )
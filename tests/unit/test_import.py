@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+import repid
+import repid.connections
+
+BROKER_MODULES = (
+    "aiobotocore",
+    "aiokafka",
+    "grpc",
+    "nats",
+    "redis",
+    "repid.connections.amqp",
+    "repid.connections.in_memory",
+    "repid.connections.kafka",
+    "repid.connections.nats",
+    "repid.connections.pubsub",
+    "repid.connections.redis",
+    "repid.connections.sqs",
+)
+
+
+def _imported_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # lines look like `import time:  self [us] | cumulative | <indent>module`
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_import_repid_does_not_import_brokers() -> None:
+    imported = _imported_modules("import repid")
+
+    assert "repid" in imported
+    assert not {module for module in imported if module.startswith(BROKER_MODULES)}
+
+
+def test_server_import_imports_only_its_broker() -> None:
+    imported = _imported_modules("from repid import AmqpServer")
+
+    assert "repid.connections.amqp.message_broker" in imported
+    assert not {
+        module
+        for module in imported
+        if module.startswith(BROKER_MODULES) and not module.startswith("repid.connections.amqp")
+    }
+
+
+def test_import_repid_without_google_package() -> None:
+    # `None` in sys.modules makes any import of the package fail, as if it wasn't installed
+    imported = _imported_modules("import sys; sys.modules['google'] = None; import repid")
+
+    assert "repid.connections" in imported
+
+
+@pytest.mark.parametrize("name", repid.connections.__all__)
+def test_lazy_names_are_importable(name: str) -> None:
+    assert getattr(repid, name) is getattr(repid.connections, name)
+
+
+def test_star_import_includes_servers() -> None:
+    namespace: dict[str, object] = {}
+    exec("from repid import *", namespace)
+
+    for name in repid.connections.__all__:
+        assert namespace[name] is getattr(repid.connections, name)
+    assert namespace["Repid"] is repid.Repid
+    assert set(repid.connections.__all__) <= set(dir(repid))
+
+
+def test_all_includes_public_names() -> None:
+    public = {
+        name
+        for name, value in vars(repid).items()
+        if not name.startswith("_") and not isinstance(value, ModuleType)
+    }
+
+    assert public - {"annotations", "Any", "TYPE_CHECKING"} <= set(repid.__all__)
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="UnknownServer"):
+        repid.UnknownServer  # noqa: B018
+    with pytest.raises(AttributeError, match="UnknownServer"):
+        repid.connections.UnknownServer  # noqa: B018
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from repid import Repid, Router
+from repid._limiter import _AdaptiveLimiter
+from repid._runner import _Runner
+from repid.connections.in_memory import InMemoryServer
+from repid.data import ActorExecutionContext, MessageData
+from repid.serializer import default_serializer
+
+
+def test_adaptive_limiter_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="Adaptive limits"):
+        _AdaptiveLimiter(initial_limit=10, max_limit=5)
+
+    with pytest.raises(ValueError, match="Adaptive limits"):
+        _AdaptiveLimiter(min_limit=0)
+
+
+async def test_adaptive_limiter_acquire_release() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=1)
+
+    await limiter.acquire()
+    assert limiter.locked()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await waiter
+    assert limiter.in_flight == 1
+
+    limiter.release()
+    assert limiter.in_flight == 0
+    assert not limiter.locked()
+
+
+async def test_adaptive_limiter_cancelled_waiter_passes_slot_on() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=1)
+    await limiter.acquire()
+
+    cancelled = asyncio.create_task(limiter.acquire())
+    other = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    await asyncio.wait_for(other, timeout=1.0)
+    assert limiter.in_flight == 1
+
+
+async def test_adaptive_limiter_grows_while_latency_is_stable() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=10, max_limit=100)
+    for _ in range(10):
+        await limiter.acquire()
+
+    for _ in range(20):
+        limiter.observe(0.01)
+
+    assert limiter.limit > 10
+    assert not limiter.locked()
+
+
+async def test_adaptive_limiter_grow_wakes_up_waiters() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=1, max_limit=100)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    for _ in range(10):
+        limiter.observe(0.01)
+
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert limiter.in_flight == 2
+
+
+def test_adaptive_limiter_does_not_grow_when_underused() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=10)
+
+    for _ in range(20):
+        limiter.observe(0.01)
+
+    assert limiter.limit == 10
+
+
+def test_adaptive_limiter_shrinks_when_latency_rises() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=100, min_limit=5, max_limit=100)
+    limiter.in_flight = 100
+
+    for _ in range(100):
+        limiter.observe(0.01)
+    for _ in range(50):
+        limiter.observe(1.0)
+
+    assert limiter.limit < 100
+    assert limiter.limit >= 5
+
+
+def test_adaptive_limiter_halves_on_loop_lag() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=40, lag_threshold=0.1)
+
+    limiter.observe_lag(0.01)
+    assert limiter.limit == 40
+
+    limiter.observe_lag(0.5)
+    assert limiter.limit == 20
+
+
+async def test_adaptive_limiter_probes_loop_lag() -> None:
+    limiter = _AdaptiveLimiter(initial_limit=40, lag_threshold=0.01, lag_probe_interval=0.01)
+    limiter.start()
+    limiter.start()  # idempotent
+
+    await asyncio.sleep(0.02)
+    blocking_start = asyncio.get_running_loop().time()
+    while asyncio.get_running_loop().time() - blocking_start < 0.05:
+        pass
+    await asyncio.sleep(0.02)
+
+    await limiter.stop()
+    await limiter.stop()  # idempotent
+
+    assert limiter.limit < 40
+
+
+async def test_runner_with_adaptive_limit() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    @router.actor
+    async def test_actor() -> None:
+        await asyncio.sleep(0)
+
+    async with server.connection():
+        runner = _Runner(
+            actor_context=ActorExecutionContext(
+                server=server,
+                publish=AsyncMock(),
+                default_serializer=default_serializer,
+            ),
+            max_tasks=50,
+            tasks_concurrency_limit="adaptive",
+        )
+        assert isinstance(runner._limiter, _AdaptiveLimiter)
+
+        for _ in range(50):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=b"",
+                    headers={"topic": "test_actor"},
+                    content_type="application/json",
+                ),
+            )
+
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert runner.processed == 50
+    assert runner._limiter.in_flight == 0
+
+
+async def test_run_worker_with_adaptive_limit() -> None:
+    server = InMemoryServer()
+    app = Repid()
+    app.servers.register_server("default", server, is_default=True)
+    router = Router()
+
+    @router.actor
+    async def test_actor() -> None:
+        pass
+
+    app.include_router(router)
+
+    async with server.connection():
+        await app.send_message(channel="default", payload=b"", headers={"topic": "test_actor"})
+        info = await asyncio.wait_for(
+            app.run_worker(messages_limit=1, tasks_limit="adaptive", register_signals=[]),
+            timeout=5.0,
+        )
+
+    assert info.processed == 1
@@ -1,7 +1,7 @@
 import httpx
 import pytest
 
-from repid import Repid, Router
+from repid import CborCodec, Repid, Router
 from repid.connections.in_memory import InMemoryServer
 
 
@@ -88,6 +88,31 @@ async def test_send_message_json(fake_repid: Repid) -> None:
     assert received == "hello"
 
 
+async def test_send_message_json_with_codec(fake_repid: Repid) -> None:
+    pytest.importorskip("cbor2")
+
+    received = None
+    router = Router()
+
+    @router.actor
+    async def test_actor(arg1: str) -> None:
+        nonlocal received
+        received = arg1
+
+    fake_repid.include_router(router)
+
+    async with fake_repid.servers.default.connection():
+        await fake_repid.send_message_json(
+            channel="default",
+            payload={"arg1": "hello"},
+            headers={"topic": "test_actor"},
+            serializer=CborCodec(),
+        )
+        await fake_repid.run_worker(messages_limit=1)
+
+    assert received == "hello"
+
+
 async def test_send_message_basic_via_operation(fake_repid: Repid) -> None:
     received = None
     router = Router()
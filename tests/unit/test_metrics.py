@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+
+from repid import Metrics, MetricsServer, MetricsServerSettings, Repid, Router
+from repid._runner import _Runner
+from repid.connections.in_memory import InMemoryServer
+from repid.data import ActorExecutionContext, MessageData
+from repid.metrics import Histogram
+from repid.serializer import default_serializer
+
+
+def test_histogram_buckets() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == 5.65
+
+
+def test_metrics_render() -> None:
+    metrics = Metrics(latency_buckets=(0.1, 1.0))
+    metrics.messages_received["my_actor"] += 2
+    metrics.messages_processed[("my_actor", "acked")] += 2
+    metrics.unrouted_messages['strange"channel'] += 1
+    metrics.observe_latency("my_actor", 0.05)
+    metrics.observe_latency("my_actor", 0.5)
+    metrics.register_gauge("repid_tasks_in_flight", "In flight.", lambda: 3)
+
+    rendered = metrics.render()
+
+    assert "# TYPE repid_messages_received_total counter\n" in rendered
+    assert 'repid_messages_received_total{actor="my_actor"} 2\n' in rendered
+    assert 'repid_messages_processed_total{actor="my_actor",action="acked"} 2\n' in rendered
+    assert 'repid_messages_unrouted_total{channel="strange\\"channel"} 1\n' in rendered
+    assert "repid_messages_poison_total" not in rendered
+    assert "repid_limiter_waits_total 0\n" in rendered
+    assert "# TYPE repid_actor_latency_seconds histogram\n" in rendered
+    assert 'repid_actor_latency_seconds_bucket{actor="my_actor",le="0.1"} 1\n' in rendered
+    assert 'repid_actor_latency_seconds_bucket{actor="my_actor",le="1.0"} 2\n' in rendered
+    assert 'repid_actor_latency_seconds_bucket{actor="my_actor",le="+Inf"} 2\n' in rendered
+    assert 'repid_actor_latency_seconds_count{actor="my_actor"} 2\n' in rendered
+    assert "# TYPE repid_tasks_in_flight gauge\nrepid_tasks_in_flight 3\n" in rendered
+
+
+def test_metrics_merge() -> None:
+    metrics = Metrics(latency_buckets=(0.1, 1.0))
+    metrics.messages_received["my_actor"] += 2
+    metrics.limiter_waits += 1
+    metrics.observe_latency("my_actor", 0.05)
+    metrics.register_gauge("repid_tasks_in_flight", "In flight.", lambda: 3)
+
+    counters, gauges = metrics._snapshot()
+    counters.messages_received["other_actor"] += 1
+    counters.observe_latency("my_actor", 0.5)
+    metrics._merge(counters)
+
+    assert metrics.messages_received == {"my_actor": 4, "other_actor": 1}
+    assert metrics.limiter_waits == 2
+    assert metrics.actor_latency["my_actor"].counts == [2, 1, 0]
+    assert metrics.actor_latency["my_actor"].count == 3
+    assert gauges == {"repid_tasks_in_flight": ("In flight.", 3)}
+
+
+async def test_runner_metrics() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    @router.actor
+    async def acked() -> None:
+        pass
+
+    @router.actor
+    async def failing() -> None:
+        raise ValueError("Oops")
+
+    metrics = Metrics()
+
+    async with server.connection():
+        for topic in ("acked", "acked", "failing", "unknown"):
+            await server.publish(
+                channel="default",
+                message=MessageData(payload=b"", headers={"topic": topic}),
+            )
+        runner = _Runner(
+            actor_context=ActorExecutionContext(
+                server=server,
+                publish=AsyncMock(),
+                default_serializer=default_serializer,
+            ),
+            max_tasks=3,
+            metrics=metrics,
+        )
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert metrics.messages_received == {"acked": 2, "failing": 1}
+    assert metrics.messages_processed == {("acked", "acked"): 2, ("failing", "nacked"): 1}
+    assert metrics.unrouted_messages["default"] >= 1  # rejected messages are redelivered
+    assert metrics.actor_latency["acked"].count == 2
+    assert "repid_tasks_concurrency_limit 1000\n" in metrics.render()
+
+
+async def test_metrics_server() -> None:
+    metrics = Metrics()
+    metrics.messages_received["my_actor"] += 1
+    server = MetricsServer(metrics, MetricsServerSettings(port=10202))
+
+    await server.start()
+
+    async with httpx.AsyncClient() as client:
+        response = await client.get("http://localhost:10202/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'repid_messages_received_total{actor="my_actor"} 1' in response.text
+
+        response = await client.get("http://localhost:10202/other")
+        assert response.status_code == 404
+
+    await server.stop()
+
+
+async def test_run_worker_with_metrics_server() -> None:
+    server = InMemoryServer()
+    app = Repid()
+    app.servers.register_server("default", server, is_default=True)
+    router = Router()
+
+    @router.actor
+    async def test_actor() -> None:
+        pass
+
+    app.include_router(router)
+
+    async with server.connection():
+        await app.send_message(channel="default", payload=b"", headers={"topic": "test_actor"})
+        info = await asyncio.wait_for(
+            app.run_worker(
+                messages_limit=1,
+                metrics_server=MetricsServerSettings(port=10203),
+                register_signals=[],
+            ),
+            timeout=5.0,
+        )
+
+    assert info.processed == 1
@@ -7,7 +7,7 @@ from typing import Any, TypeVar
 
 import pytest
 
-from repid import ActorData, Message, MessageData, Repid, Router
+from repid import ActorData, ActorHookMiddleware, Message, MessageData, Repid, Router
 from repid.connections.abc import MessageAction, ReceivedMessageT
 from repid.connections.in_memory import InMemoryServer
 from repid.middlewares import (
@@ -501,7 +501,7 @@ async def test_actor_middleware_mutation() -> None:
         return await call_next(message, actor)
 
     async def actor_handler_mock(message: ReceivedMessageT, actor: ActorData) -> str:  # noqa: ARG001
-        return message.payload.decode()  # test that leaf sees mutated payload
+        return bytes(message.payload).decode()  # test that leaf sees mutated payload
 
     pipeline_factory = _compile_actor_middleware_pipeline([middleware])
     pipeline = pipeline_factory(actor_handler_mock)
@@ -569,3 +569,148 @@ async def test_actor_middleware_sees_message_action() -> None:
 
     assert action_before is None
     assert action_after == MessageAction.acked
+
+
+async def test_actor_hook_middleware_order() -> None:
+    calls: list[Any] = []
+
+    async def middleware(
+        call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[None, None, T]],
+        message: ReceivedMessageT,
+        actor: ActorData,
+    ) -> T:
+        calls.append("enter")
+        r = await call_next(message, actor)
+        calls.append("exit")
+        return r
+
+    def hooks(name: str) -> ActorHookMiddleware:
+        return ActorHookMiddleware(
+            before=lambda *_: calls.append(f"before_{name}"),
+            after=lambda _m, _a, result, exc: calls.append((f"after_{name}", result, exc)),
+        )
+
+    async def leaf(message: ReceivedMessageT, actor: ActorData) -> str:  # noqa: ARG001
+        calls.append("leaf")
+        return "ok"
+
+    pipeline_factory = _compile_actor_middleware_pipeline(
+        [hooks("a"), ActorHookMiddleware(), hooks("b"), middleware, hooks("c")],
+    )
+    res = await pipeline_factory(leaf)(None, None)  # type: ignore[arg-type]
+
+    assert res == "ok"
+    assert calls == [
+        "before_a",
+        "before_b",
+        "enter",
+        "before_c",
+        "leaf",
+        ("after_c", "ok", None),
+        "exit",
+        ("after_b", "ok", None),
+        ("after_a", "ok", None),
+    ]
+
+
+async def test_actor_hook_middleware_errors() -> None:
+    calls: list[Any] = []
+    error = ValueError("denied")
+    after_error = RuntimeError("after")
+
+    def before_b(*_: Any) -> None:
+        raise error
+
+    def after_c(*_: Any) -> None:
+        raise after_error
+
+    async def leaf(message: ReceivedMessageT, actor: ActorData) -> str:  # noqa: ARG001
+        calls.append("leaf")
+        return "ok"
+
+    a = ActorHookMiddleware(after=lambda _m, _a, result, exc: calls.append(("a", result, exc)))
+    b = ActorHookMiddleware(
+        before=before_b,
+        after=lambda _m, _a, result, exc: calls.append(("b", result, exc)),
+    )
+    c = ActorHookMiddleware(after=after_c)
+
+    # `after` of the hook, which `before` has failed, isn't called
+    with pytest.raises(ValueError, match="denied"):
+        await _compile_actor_middleware_pipeline([a, b])(leaf)(None, None)  # type: ignore[arg-type]
+    assert calls == [("a", None, error)]
+
+    # error raised in `after` is seen by the outer hooks
+    calls.clear()
+    with pytest.raises(RuntimeError, match="after"):
+        await _compile_actor_middleware_pipeline([a, c])(leaf)(None, None)  # type: ignore[arg-type]
+    assert calls == ["leaf", ("a", None, after_error)]
+
+
+async def test_actor_hook_middleware_called_directly() -> None:
+    calls: list[str] = []
+    hooks = ActorHookMiddleware(
+        before=lambda *_: calls.append("before"),
+        after=lambda *_: calls.append("after"),
+    )
+
+    async def leaf(message: ReceivedMessageT, actor: ActorData) -> str:  # noqa: ARG001
+        calls.append("leaf")
+        return "ok"
+
+    assert await hooks(leaf, None, None) == "ok"  # type: ignore[arg-type]
+    assert calls == ["before", "leaf", "after"]
+
+
+async def test_actor_middleware_pipeline_compiled_once_per_leaf() -> None:
+    async def middleware(
+        call_next: Callable[[ReceivedMessageT, ActorData], Coroutine[None, None, T]],
+        message: ReceivedMessageT,
+        actor: ActorData,
+    ) -> T:
+        return await call_next(message, actor)
+
+    router = Router(middlewares=[middleware, ActorHookMiddleware()])
+
+    @router.actor
+    async def actor() -> None: ...
+
+    pipeline = router.actors[0].middleware_pipeline
+
+    async def leaf(message: ReceivedMessageT, actor: ActorData) -> str:  # noqa: ARG001
+        return "ok"
+
+    async def other_leaf(message: ReceivedMessageT, actor: ActorData) -> str:  # noqa: ARG001
+        return "other"
+
+    assert await pipeline(leaf, None, router.actors[0]) == "ok"  # type: ignore[arg-type]
+    chain = pipeline._chain  # type: ignore[attr-defined]
+    assert await pipeline(leaf, None, router.actors[0]) == "ok"  # type: ignore[arg-type]
+    assert pipeline._chain is chain  # type: ignore[attr-defined]
+
+    assert await pipeline(other_leaf, None, router.actors[0]) == "other"  # type: ignore[arg-type]
+    assert pipeline._chain is not chain  # type: ignore[attr-defined]
+
+
+async def test_actor_hook_middleware_end_to_end() -> None:
+    calls: list[Any] = []
+    app = Repid(
+        actor_middlewares=[
+            ActorHookMiddleware(
+                before=lambda message, actor: calls.append((actor.name, message.is_acted_on)),
+                after=lambda message, _a, result, exc: calls.append((message.action, result, exc)),
+            ),
+        ],
+    )
+    router = Router()
+
+    @router.actor
+    async def hooked_actor() -> str:
+        return "done"
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message(channel="default", payload=b"", headers={"topic": "hooked_actor"})
+
+    assert calls == [("hooked_actor", False), (MessageAction.acked, "done", None)]
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from repid import Message, MessageProfile, Profiler, Repid, Router
+from repid._runner import _Runner
+from repid.connections.in_memory import InMemoryServer
+from repid.data import ActorExecutionContext, MessageData
+from repid.profiling import _current_profile, _stage
+from repid.serializer import default_serializer
+
+
+async def _run(router: Router, server: InMemoryServer, profiler: Profiler, amount: int) -> None:
+    runner = _Runner(
+        actor_context=ActorExecutionContext(
+            server=server,
+            publish=AsyncMock(),
+            default_serializer=default_serializer,
+        ),
+        max_tasks=amount,
+        profiler=profiler,
+    )
+    await asyncio.wait_for(
+        runner.run(
+            channels_to_actors=router._actors_per_channel_address,
+            graceful_termination_timeout=1.0,
+        ),
+        timeout=5.0,
+    )
+
+
+def test_profiler_validation() -> None:
+    with pytest.raises(ValueError, match="Sample rate must be at least 1"):
+        Profiler(sample_every=0)
+
+
+def test_profiler_sampling() -> None:
+    profiler = Profiler(sink=lambda _: None, sample_every=3)
+
+    sampled = [profiler._sample("default", str(i)) is not None for i in range(7)]
+
+    assert sampled == [False, False, True, False, False, True, False]
+
+
+def test_stage_without_profile_is_noop() -> None:
+    assert _current_profile.get() is None
+    with _stage("decode"):
+        pass
+
+
+async def test_runner_profiles_message_stages() -> None:
+    server = InMemoryServer()
+    router = Router()
+    profiles: list[MessageProfile] = []
+
+    @router.actor
+    async def my_actor(arg: int, message: Message) -> None:  # noqa: ARG001
+        await asyncio.sleep(0.01)
+
+    async with server.connection():
+        await server.publish(
+            channel="default",
+            message=MessageData(
+                payload=b'{"arg": 1}',
+                headers={"topic": "my_actor"},
+                content_type="application/json",
+            ),
+        )
+        await _run(router, server, Profiler(sink=profiles.append, sample_every=1), 1)
+
+    assert len(profiles) == 1
+    profile = profiles[0]
+    assert profile.actor_name == "my_actor"
+    assert profile.channel == "default"
+    assert profile.batch_size == 1
+    assert {
+        "route",
+        "admission",
+        "schedule",
+        "decode",
+        "dependencies",
+        "actor",
+        "ack",
+        "handler",
+        "middleware",
+    } <= profile.stages.keys()
+    assert profile.stages["actor"] >= 0.01
+    assert profile.stages["handler"] >= profile.stages["actor"]
+
+
+async def test_runner_profiles_sampled_messages_only() -> None:
+    server = InMemoryServer()
+    router = Router()
+    profiles: list[MessageProfile] = []
+
+    @router.actor
+    async def my_actor() -> None:
+        pass
+
+    async with server.connection():
+        for _ in range(10):
+            await server.publish(
+                channel="default",
+                message=MessageData(payload=b"", headers={"topic": "my_actor"}),
+            )
+        await _run(router, server, Profiler(sink=profiles.append, sample_every=5), 10)
+
+    assert len(profiles) == 2
+
+
+async def test_runner_profiles_batches() -> None:
+    server = InMemoryServer()
+    router = Router()
+    profiles: list[MessageProfile] = []
+
+    @router.actor(batch_size=3, batch_linger=0.05)
+    async def my_actor(items: list[dict]) -> None:
+        pass
+
+    async with server.connection():
+        for _ in range(3):
+            await server.publish(
+                channel="default",
+                message=MessageData(payload=b"{}", headers={"topic": "my_actor"}),
+            )
+        await _run(router, server, Profiler(sink=profiles.append, sample_every=3), 3)
+
+    assert len(profiles) == 1
+    assert profiles[0].batch_size == 3
+    assert {"schedule", "actor", "ack"} <= profiles[0].stages.keys()
+
+
+async def test_profiling_sink_error_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    server = InMemoryServer()
+    app = Repid()
+    app.servers.register_server("default", server, is_default=True)
+    router = Router()
+
+    @router.actor
+    async def my_actor() -> None:
+        pass
+
+    app.include_router(router)
+
+    def failing_sink(profile: MessageProfile) -> None:  # noqa: ARG001
+        raise RuntimeError("Sink is broken")
+
+    async with server.connection():
+        await app.send_message(channel="default", payload=b"", headers={"topic": "my_actor"})
+        info = await asyncio.wait_for(
+            app.run_worker(
+                messages_limit=1,
+                profiler=Profiler(sink=failing_sink, sample_every=1),
+                register_signals=[],
+            ),
+            timeout=5.0,
+        )
+
+    assert info.processed == 1
+    assert "profiling.sink.error" in caplog.messages
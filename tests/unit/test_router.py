@@ -9,10 +9,17 @@ import pytest
 from repid import Router
 from repid._utils import NotSet
 from repid.connections.abc import ReceivedMessageT
-from repid.converter import BasicConverter
+from repid.converter import BasicConverter, _LazyConverter
 from repid.data import ActorData, Channel, MessageData
 from repid.middlewares import ActorMiddlewareT
-from repid.router import catch_all_routing_strategy, topic_based_routing_strategy
+from repid.router import (
+    _ActorIndex,
+    _HeaderGlobMatcher,
+    catch_all_routing_strategy,
+    glob_header_routing_strategy,
+    header_routing_strategy,
+    topic_based_routing_strategy,
+)
 
 
 class TrackingThreadPoolExecutor(ThreadPoolExecutor):
@@ -175,6 +182,93 @@ def test_catch_all_routing_strategy() -> None:
     assert result is True
 
 
+def test_header_routing_strategy() -> None:
+    strategy = header_routing_strategy("action")(actor_name="test_actor")
+
+    assert strategy(MessageData(payload=b"", headers={"action": "test_actor"})) is True
+    assert strategy(MessageData(payload=b"", headers={"topic": "test_actor"})) is False
+    assert strategy(MessageData(payload=b"", headers=None)) is False
+
+
+def test_header_routing_strategy_explicit_value() -> None:
+    strategy = header_routing_strategy("action", "send")(actor_name="test_actor")
+
+    assert strategy(MessageData(payload=b"", headers={"action": "send"})) is True
+    assert strategy(MessageData(payload=b"", headers={"action": "test_actor"})) is False
+
+
+def test_glob_header_routing_strategy() -> None:
+    strategy = glob_header_routing_strategy("topic", "user.*")(actor_name="test_actor")
+
+    assert isinstance(strategy, _HeaderGlobMatcher)
+    assert strategy(MessageData(payload=b"", headers={"topic": "user.created"})) is True
+    assert strategy(MessageData(payload=b"", headers={"topic": "order.created"})) is False
+    assert strategy(MessageData(payload=b"", headers={"action": "user.created"})) is False
+    assert strategy(MessageData(payload=b"", headers=None)) is False
+
+
+def test_glob_header_routing_strategy_without_wildcards_is_exact() -> None:
+    strategy = glob_header_routing_strategy("topic")(actor_name="test_actor")
+
+    assert not isinstance(strategy, _HeaderGlobMatcher)
+    assert strategy(MessageData(payload=b"", headers={"topic": "test_actor"})) is True
+
+
+def test_actor_index_matches_first_registered_actor() -> None:
+    router = Router()
+
+    @router.actor(routing_strategy=glob_header_routing_strategy("topic", "user.*"))
+    async def user_events() -> None:
+        pass
+
+    @router.actor(name="user.created")
+    async def user_created() -> None:
+        pass
+
+    @router.actor(name="order.created")
+    async def order_created() -> None:
+        pass
+
+    @router.actor(routing_strategy=header_routing_strategy("action", "order.created"))
+    async def order_action() -> None:
+        pass
+
+    @router.actor(routing_strategy=catch_all_routing_strategy)
+    async def fallback() -> None:
+        pass
+
+    @router.actor(name="never_reached")
+    async def never_reached() -> None:
+        pass
+
+    index = router._materialize()._actor_index_per_channel_address["default"]
+
+    def match(headers: dict[str, str] | None) -> str | None:
+        actor = index.match(MessageData(payload=b"", headers=headers))
+        return actor.name if actor is not None else None
+
+    assert match({"topic": "user.created"}) == "user_events"
+    assert match({"topic": "order.created"}) == "order.created"
+    assert match({"topic": "other", "action": "order.created"}) == "order_action"
+    assert match({"topic": "order.created", "action": "order.created"}) == "order.created"
+    assert match({"topic": "never_reached"}) == "fallback"
+    assert match(None) == "fallback"
+
+
+def test_actor_index_no_match() -> None:
+    router = Router()
+
+    @router.actor
+    async def my_actor() -> None:
+        pass
+
+    index = router._materialize()._actor_index_per_channel_address["default"]
+
+    assert index.match(MessageData(payload=b"", headers={"topic": "other"})) is None
+    assert index.match(MessageData(payload=b"", headers=None)) is None
+    assert _ActorIndex([]).match(MessageData(payload=b"", headers=None)) is None
+
+
 def test_include_router_propagates_timeout() -> None:
     router1 = Router(timeout=30.0)
     router2 = Router()
@@ -242,7 +336,9 @@ def test_include_router_propagates_converter() -> None:
 
     router1.include_router(router2)
 
-    assert type(router1.actors[0].converter) is BasicConverter
+    converter = router1.actors[0].converter
+    assert isinstance(converter, _LazyConverter)
+    assert type(converter._resolve()) is BasicConverter
     assert router2.converter is NotSet
 
 
@@ -442,3 +538,69 @@ def test_actor_raises_on_invalid_confirmation_mode_and_on_error(confirmation_mod
         @router.actor(confirmation_mode=confirmation_mode, on_error="reject")  # type: ignore[call-overload]
         def my_actor() -> None:
             pass
+
+
+def test_materialization_is_cached_until_router_changes() -> None:
+    router = Router()
+    nested = Router()
+    router.include_router(nested)
+
+    @nested.actor
+    async def first() -> None:
+        pass
+
+    materialized = router._materialize()
+    assert router._materialize() is materialized
+    assert [actor.name for actor in router.actors] == ["first"]
+
+    @nested.actor
+    async def second() -> None:
+        pass
+
+    assert [actor.name for actor in router.actors] == ["first", "second"]
+
+    nested.timeout = 5.0
+    assert [actor.timeout for actor in router.actors] == [5.0, 5.0]
+
+    router.include_router(Router(channel="other"))
+    assert router._materialize() is not materialized
+
+
+def test_converter_is_built_on_first_use() -> None:
+    router = Router(converter=BasicConverter)
+
+    @router.actor
+    async def my_actor(*args: int) -> None:
+        pass
+
+    (actor,) = router.actors
+    assert isinstance(actor.converter, _LazyConverter)
+    assert actor.converter._converter is None
+
+    converter = actor.converter._resolve()
+
+    assert isinstance(converter, BasicConverter)
+    assert actor.converter._resolve() is converter
+
+
+async def test_converter_build_error_is_raised_on_first_use(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    router = Router()
+
+    @router.actor
+    async def my_actor(*args: int) -> None:
+        pass
+
+    (actor,) = router.actors
+
+    with pytest.raises(ValueError, match=r"\*args and \*\*kwargs are unsupported") as first:
+        actor.converter.get_input_schema()
+    assert "actor.converter.error" in caplog.messages
+
+    # the converter isn't built again, the same error is raised without logging it again
+    caplog.clear()
+    with pytest.raises(ValueError, match=r"\*args and \*\*kwargs are unsupported") as second:
+        actor.converter.get_input_schema()
+    assert second.value is first.value
+    assert "actor.converter.error" not in caplog.messages
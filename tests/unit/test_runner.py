@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
+import time
 from typing import Literal
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from repid import Repid, Router, ServerT
-from repid._runner import _keep_alive_loop, _run_with_keepalive, _Runner
+from repid import Metrics, Repid, Router, ServerT
+from repid._runner import _message_priority, _remaining_timeout, _run_with_keepalive, _Runner
+from repid._timers import _get_timers
 from repid.connections.in_memory import InMemoryServer
 from repid.data import ActorExecutionContext, MessageData
 from repid.health_check_server import HealthCheckServer, HealthCheckStatus
+from repid.router import _ActorIndex
 from repid.serializer import default_serializer
 from repid.test_client import TestClient
 
@@ -762,7 +764,7 @@ async def test_runner_unrouted_message_reject_below_threshold() -> None:
 
     for _ in range(2):
         msg = _make_unrouted_message("msg-poison")
-        await runner._message_handler([], msg)
+        await runner._message_handler(_ActorIndex([]), msg)
         msg.reject.assert_called_once()
         msg.nack.assert_not_called()
 
@@ -774,10 +776,10 @@ async def test_runner_unrouted_message_nack_at_threshold(
     runner = _Runner(actor_context=_make_actor_context(server), max_unrouted_retries=3)
 
     for _ in range(2):
-        await runner._message_handler([], _make_unrouted_message("msg-poison"))
+        await runner._message_handler(_ActorIndex([]), _make_unrouted_message("msg-poison"))
 
     msg = _make_unrouted_message("msg-poison")
-    await runner._message_handler([], msg)
+    await runner._message_handler(_ActorIndex([]), msg)
     msg.nack.assert_called_once()
     msg.reject.assert_not_called()
 
@@ -794,7 +796,7 @@ async def test_runner_unrouted_message_counter_cleared_after_nack() -> None:
     runner = _Runner(actor_context=_make_actor_context(server), max_unrouted_retries=2)
 
     for _ in range(2):
-        await runner._message_handler([], _make_unrouted_message("msg-poison"))
+        await runner._message_handler(_ActorIndex([]), _make_unrouted_message("msg-poison"))
 
     assert "msg-poison" not in runner._unrouted_seen_counts
 
@@ -805,40 +807,39 @@ async def test_runner_unrouted_message_no_id_always_reject() -> None:
 
     for _ in range(3):
         msg = _make_unrouted_message(None)
-        await runner._message_handler([], msg)
+        await runner._message_handler(_ActorIndex([]), msg)
         msg.reject.assert_called_once()
         msg.nack.assert_not_called()
 
 
-async def test_keep_alive_loop_calls_keep_alive() -> None:
+async def test_keep_alive_calls_keep_alive() -> None:
     message = Mock()
     message.is_acted_on = False
     message.keep_alive = AsyncMock()
     message.message_id = "test-msg"
 
-    task = asyncio.create_task(_keep_alive_loop(message, interval=0))
+    keep_alive = _get_timers().keep_alive(message, interval=0)
     await asyncio.sleep(0.05)
-    task.cancel()
-    with suppress(asyncio.CancelledError):
-        await task
+    keep_alive.stop()
 
     assert message.keep_alive.call_count >= 1
 
 
-async def test_keep_alive_loop_exits_when_message_acted_on() -> None:
+async def test_keep_alive_exits_when_message_acted_on() -> None:
     message = Mock()
     message.is_acted_on = True
     message.keep_alive = AsyncMock()
     message.message_id = "test-msg"
 
-    task = asyncio.create_task(_keep_alive_loop(message, interval=0))
+    timers = _get_timers()
+    timers.keep_alive(message, interval=0)
     await asyncio.sleep(0.05)
 
-    assert task.done()
+    assert len(timers) == 0
     message.keep_alive.assert_not_called()
 
 
-async def test_keep_alive_loop_logs_error_and_continues(
+async def test_keep_alive_logs_error_and_continues(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     message = Mock()
@@ -846,13 +847,11 @@ async def test_keep_alive_loop_logs_error_and_continues(
     message.keep_alive = AsyncMock(side_effect=RuntimeError("broker error"))
     message.message_id = "test-msg"
 
-    task = asyncio.create_task(_keep_alive_loop(message, interval=0))
+    keep_alive = _get_timers().keep_alive(message, interval=0)
     await asyncio.sleep(0.05)
-    task.cancel()
-    with suppress(asyncio.CancelledError):
-        await task
+    keep_alive.stop()
 
-    assert message.keep_alive.call_count >= 1
+    assert message.keep_alive.call_count >= 2
     warning = next(
         (r for r in caplog.records if r.message == "message.keep_alive.error"),
         None,
@@ -950,3 +949,482 @@ async def test_run_with_keepalive_task_cancelled_on_actor_timeout() -> None:
     call_count_after_timeout = message.keep_alive.call_count
     await asyncio.sleep(0.05)
     assert message.keep_alive.call_count == call_count_after_timeout
+
+
+@pytest.mark.parametrize("eager_execution", [False, True])
+async def test_runner_eager_execution(eager_execution: bool) -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    processed = 0
+
+    @router.actor()
+    async def sync_actor() -> None:
+        nonlocal processed
+        processed += 1
+
+    async with server.connection():
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=10,
+            eager_execution=eager_execution,
+        )
+        for _ in range(10):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=b"",
+                    headers={"topic": "sync_actor"},
+                    content_type="application/json",
+                ),
+            )
+
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert processed == 10
+    assert runner.processed == 10
+    assert not runner._tasks
+
+
+async def test_runner_message_received_after_cancel_is_rejected() -> None:
+    server = Mock()
+    server.capabilities = {"supports_lightweight_pause": False}
+
+    called = False
+
+    async def fn() -> None:
+        nonlocal called
+        called = True
+
+    actor = _make_mock_actor(AsyncMock(side_effect=fn))
+    actor.max_concurrency = None
+    actor.batch_size = None
+    message = Mock()
+    message.is_acted_on = False
+    message.reject = AsyncMock()
+
+    runner = _Runner(actor_context=_make_actor_context(server))
+    runner.cancel_event.set()
+
+    index = Mock()
+    index.match.return_value = actor
+    await runner._message_handler(index, message)
+    await asyncio.gather(*runner._tasks)
+
+    assert not called
+    message.reject.assert_awaited_once()
+    assert runner.processed == 1
+
+
+async def test_runner_max_inflight_bytes_validation() -> None:
+    server = InMemoryServer()
+    with pytest.raises(ValueError, match="Max in-flight bytes must be at least 1"):
+        _Runner(actor_context=_make_actor_context(server), max_inflight_bytes=0)
+
+
+@pytest.mark.parametrize("supports_lightweight_pause", [True, False])
+async def test_runner_max_inflight_bytes(supports_lightweight_pause: bool) -> None:
+    server = InMemoryServer()
+    capabilities = {
+        **server.capabilities,
+        "supports_lightweight_pause": supports_lightweight_pause,
+    }
+    router = Router()
+    metrics = Metrics()
+
+    running = 0
+    max_running = 0
+
+    @router.actor
+    async def my_actor(data: str) -> None:  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    async with server.connection():
+        for _ in range(10):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=default_serializer({"data": "x" * 88}),  # 100 bytes
+                    headers={"topic": "my_actor"},
+                    content_type="application/json",
+                ),
+            )
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=10,
+            max_inflight_bytes=250,
+            metrics=metrics,
+        )
+        runner.server = Mock(wraps=server, capabilities=capabilities)
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert runner.processed == 10
+    # messages are admitted while the limit isn't reached yet
+    assert max_running == 3
+    assert runner._inflight_bytes == 0
+    assert (metrics.subscriber_pauses["*"] > 0) is supports_lightweight_pause
+
+
+async def test_runner_max_inflight_bytes_admits_oversized_message() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    @router.actor
+    async def my_actor(data: str) -> None:
+        pass
+
+    async with server.connection():
+        for _ in range(2):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=default_serializer({"data": "x" * 1000}),
+                    headers={"topic": "my_actor"},
+                    content_type="application/json",
+                ),
+            )
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=2,
+            max_inflight_bytes=10,
+        )
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert runner.processed == 2
+
+
+async def test_runner_saturated_limiter_admits_higher_priority_first() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    processed: list[str] = []
+    release = asyncio.Event()
+
+    @router.actor
+    async def my_actor(name: str) -> None:
+        if name == "blocker":
+            await release.wait()
+        processed.append(name)
+
+    async with server.connection():
+        for name, headers in (
+            ("blocker", {}),
+            ("blocker", {}),
+            ("low", {}),
+            ("high", {"priority": "10"}),
+        ):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=default_serializer({"name": name}),
+                    headers={"topic": "my_actor", **headers},
+                    content_type="application/json",
+                ),
+            )
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=4,
+            tasks_concurrency_limit=2,
+        )
+        # keep the subscriber delivering, so that both messages wait for the limiter together
+        runner.server = Mock(
+            wraps=server,
+            capabilities={**server.capabilities, "supports_lightweight_pause": False},
+        )
+        run_task = asyncio.create_task(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+        )
+        while len(runner._priority_waiters) < 2:
+            await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.wait_for(run_task, timeout=5.0)
+
+    assert processed == ["blocker", "blocker", "high", "low"]
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        (None, 5),
+        ({}, 5),
+        ({"priority": "-3"}, -3),
+        ({"priority": "urgent"}, 5),
+    ],
+)
+async def test_message_priority(headers: dict[str, str] | None, expected: int) -> None:
+    router = Router()
+
+    @router.actor(priority=5)
+    async def my_actor() -> None:
+        pass
+
+    (actor,) = router.actors
+    message = Mock(headers=headers, message_id="id")
+
+    assert _message_priority(actor, message) == expected
+
+
+async def test_router_priority_defaults() -> None:
+    router = Router(priority=1)
+
+    @router.actor
+    async def default_actor() -> None:
+        pass
+
+    @router.actor(priority=7)
+    async def urgent_actor() -> None:
+        pass
+
+    assert {actor.name: actor.priority for actor in router.actors} == {
+        "default_actor": 1,
+        "urgent_actor": 7,
+    }
+
+
+async def test_send_message_sets_priority_header() -> None:
+    app = Repid()
+    server = InMemoryServer()
+    app.servers.register_server("default", server, is_default=True)
+
+    async with server.connection():
+        await app.send_message_json(
+            channel="default",
+            payload={},
+            headers={"topic": "my_actor"},
+            priority=3,
+        )
+        message = server.queues["default"].queue.get_nowait()
+
+    assert message.headers == {"topic": "my_actor", "priority": "3"}
+
+
+async def test_runner_expired_message_is_nacked_without_processing() -> None:
+    server = InMemoryServer()
+    router = Router()
+    metrics = Metrics()
+
+    processed: list[str] = []
+
+    @router.actor
+    async def my_actor(name: str) -> None:
+        processed.append(name)
+
+    async with server.connection():
+        for name, deadline in (("expired", time.time() - 1), ("fresh", time.time() + 60)):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=default_serializer({"name": name}),
+                    headers={"topic": "my_actor", "deadline": str(deadline)},
+                    content_type="application/json",
+                ),
+            )
+        runner = _Runner(actor_context=_make_actor_context(server), max_tasks=1, metrics=metrics)
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+        assert processed == ["fresh"]
+        assert metrics.expired_messages == {"my_actor": 1}
+        assert server.queues["default"].queue.empty()
+        assert not server.queues["default"].processing
+
+
+async def test_runner_message_expired_while_waiting_is_nacked() -> None:
+    server = InMemoryServer()
+    router = Router()
+    metrics = Metrics()
+
+    processed: list[str] = []
+    release = asyncio.Event()
+
+    @router.actor
+    async def my_actor(name: str) -> None:
+        if name == "blocker":
+            await release.wait()
+        processed.append(name)
+
+    async with server.connection():
+        for name, headers in (
+            ("blocker", {}),
+            ("stale", {"deadline": str(time.time() + 0.05)}),
+            ("fresh", {}),
+        ):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=default_serializer({"name": name}),
+                    headers={"topic": "my_actor", **headers},
+                    content_type="application/json",
+                ),
+            )
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=2,
+            tasks_concurrency_limit=1,
+            metrics=metrics,
+        )
+        run_task = asyncio.create_task(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+        )
+        await asyncio.sleep(0.1)
+        release.set()
+        await asyncio.wait_for(run_task, timeout=5.0)
+
+    assert processed == ["blocker", "fresh"]
+    assert metrics.expired_messages == {"my_actor": 1}
+
+
+async def test_runner_saturated_limiter_admits_earliest_deadline_first() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    processed: list[str] = []
+    release = asyncio.Event()
+
+    @router.actor
+    async def my_actor(name: str) -> None:
+        if name == "blocker":
+            await release.wait()
+        processed.append(name)
+
+    now = time.time()
+    async with server.connection():
+        for name, headers in (
+            ("blocker", {}),
+            ("blocker", {}),
+            ("late", {"deadline": str(now + 60)}),
+            ("early", {"deadline": str(now + 30)}),
+        ):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=default_serializer({"name": name}),
+                    headers={"topic": "my_actor", **headers},
+                    content_type="application/json",
+                ),
+            )
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=4,
+            tasks_concurrency_limit=2,
+        )
+        runner.server = Mock(
+            wraps=server,
+            capabilities={**server.capabilities, "supports_lightweight_pause": False},
+        )
+        run_task = asyncio.create_task(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+        )
+        while len(runner._priority_waiters) < 2:
+            await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.wait_for(run_task, timeout=5.0)
+
+    assert processed == ["blocker", "blocker", "early", "late"]
+
+
+@pytest.mark.parametrize(
+    ("actor_timeout", "ttl", "expected"),
+    [
+        (None, None, None),
+        (10.0, None, 10.0),
+        (None, 5.0, 5.0),
+        (10.0, 5.0, 5.0),
+        (1.0, 5.0, 1.0),
+        (None, -5.0, 0.0),
+    ],
+)
+def test_remaining_timeout(
+    actor_timeout: float | None,
+    ttl: float | None,
+    expected: float | None,
+) -> None:
+    actor = Mock(timeout=actor_timeout)
+    headers = None if ttl is None else {"deadline": str(time.time() + ttl)}
+
+    timeout = _remaining_timeout(actor, [Mock(headers=headers)])
+
+    assert timeout == pytest.approx(expected, abs=0.1)
+
+
+async def test_runner_actor_timeout_is_limited_by_deadline() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    @router.actor(timeout=10.0)
+    async def my_actor() -> None:
+        await asyncio.sleep(10.0)
+
+    async with server.connection():
+        await server.publish(
+            channel="default",
+            message=MessageData(
+                payload=b"",
+                headers={"topic": "my_actor", "deadline": str(time.time() + 0.1)},
+            ),
+        )
+        runner = _Runner(actor_context=_make_actor_context(server), max_tasks=1)
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=2.0,
+        )
+
+    assert runner.processed == 1
+
+
+async def test_send_message_sets_deadline_header() -> None:
+    app = Repid()
+    server = InMemoryServer()
+    app.servers.register_server("default", server, is_default=True)
+
+    async with server.connection():
+        await app.send_message(channel="default", payload=b"", deadline=1700000000.5)
+        await app.send_message(channel="default", payload=b"", ttl=30.0)
+        with pytest.raises(ValueError, match="either 'deadline' or 'ttl'"):
+            await app.send_message(channel="default", payload=b"", deadline=1.0, ttl=1.0)
+
+        absolute = server.queues["default"].queue.get_nowait()
+        relative = server.queues["default"].queue.get_nowait()
+
+    assert absolute.headers == {"deadline": "1700000000.5"}
+    assert relative.headers is not None
+    assert float(relative.headers["deadline"]) == pytest.approx(time.time() + 30.0, abs=1.0)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Literal, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import BaseModel
+
+from repid import Repid, Router
+from repid._runner import _actor_run_batch, _Runner
+from repid.connections.abc import ReceivedMessageT
+from repid.connections.in_memory import InMemoryServer
+from repid.converter import PydanticConverter
+from repid.data import ActorExecutionContext, MessageData
+from repid.serializer import default_serializer
+from repid.test_client import TestClient
+
+
+class Item(BaseModel):
+    value: int
+
+
+def _make_actor_context(server: Mock | InMemoryServer) -> ActorExecutionContext:
+    return ActorExecutionContext(
+        server=server,
+        publish=AsyncMock(),
+        default_serializer=default_serializer,
+    )
+
+
+def _make_message(payload: bytes) -> Mock:
+    message = Mock()
+    message.payload = payload
+    message.headers = {"topic": "batch_actor"}
+    message.content_type = "application/json"
+    message.is_acted_on = False
+
+    async def act() -> None:
+        message.is_acted_on = True
+
+    message.ack = AsyncMock(side_effect=act)
+    message.nack = AsyncMock(side_effect=act)
+    message.reject = AsyncMock(side_effect=act)
+    return message
+
+
+async def test_batch_actor_via_test_client() -> None:
+    app = Repid()
+    router = Router()
+
+    received: list[list[Item]] = []
+
+    @router.actor(batch_size=10, converter=PydanticConverter)
+    async def batch_actor(items: list[Item]) -> None:
+        received.append(items)
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message_json(
+            channel="default",
+            payload={"value": 1},
+            headers={"topic": "batch_actor"},
+        )
+        assert client.get_processed_messages()[0].acked
+
+    assert received == [[Item(value=1)]]
+
+
+async def test_runner_flushes_batch_when_full_and_after_linger() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    received: list[list[int]] = []
+
+    @router.actor(batch_size=2, batch_linger=0.05, converter=PydanticConverter)
+    async def batch_actor(items: list[int]) -> None:
+        received.append(items)
+
+    async with server.connection():
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=3,
+            tasks_concurrency_limit=10,
+        )
+
+        for value in range(3):
+            await server.publish(
+                channel="default",
+                message=MessageData(
+                    payload=str(value).encode(),
+                    headers={"topic": "batch_actor"},
+                    content_type="application/json",
+                ),
+            )
+
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert received == [[0, 1], [2]]
+    assert runner.processed == 3
+
+
+async def test_batch_actor_per_message_results() -> None:
+    router = Router()
+
+    error = RuntimeError("Intentional error")
+
+    @router.actor(batch_size=4, converter=PydanticConverter)
+    async def batch_actor(
+        items: list[int],
+    ) -> list[Literal["ack", "nack", "reject"] | Exception]:
+        assert items == [1, 2, 3, 4]
+        return ["ack", "nack", "reject", error]
+
+    actor = router._actors_per_channel_address["default"][0]
+    messages = [_make_message(str(value).encode()) for value in range(1, 5)]
+
+    results = await _actor_run_batch(
+        actor,
+        cast(list[ReceivedMessageT], messages),
+        _make_actor_context(InMemoryServer()),
+    )
+
+    assert results == ["ack", "nack", "reject", error]
+    messages[0].ack.assert_awaited_once()
+    messages[1].nack.assert_awaited_once()
+    messages[2].reject.assert_awaited_once()
+    messages[3].nack.assert_awaited_once()
+
+
+async def test_batch_actor_conversion_error_only_affects_its_message() -> None:
+    router = Router()
+
+    received: list[list[int]] = []
+
+    @router.actor(batch_size=2, on_error="reject", converter=PydanticConverter)
+    async def batch_actor(items: list[int]) -> None:
+        received.append(items)
+
+    actor = router._actors_per_channel_address["default"][0]
+    messages = [_make_message(b"1"), _make_message(b'"not a number"')]
+
+    results = await _actor_run_batch(
+        actor,
+        cast(list[ReceivedMessageT], messages),
+        _make_actor_context(InMemoryServer()),
+    )
+
+    assert received == [[1]]
+    assert results[0] is None
+    assert isinstance(results[1], Exception)
+    messages[0].ack.assert_awaited_once()
+    messages[1].reject.assert_awaited_once()
+
+
+async def test_batch_actor_invalid_result_fails_whole_batch() -> None:
+    router = Router()
+
+    @router.actor(batch_size=2, converter=PydanticConverter)
+    async def batch_actor(items: list[int]) -> list[str]:
+        return ["ack"] * (len(items) + 1)
+
+    actor = router._actors_per_channel_address["default"][0]
+    messages = [_make_message(b"1"), _make_message(b"2")]
+
+    results = await _actor_run_batch(
+        actor,
+        cast(list[ReceivedMessageT], messages),
+        _make_actor_context(InMemoryServer()),
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    for message in messages:
+        message.nack.assert_awaited_once()
+
+
+async def test_batch_actor_invalid_per_message_result() -> None:
+    router = Router()
+
+    @router.actor(batch_size=1, converter=PydanticConverter)
+    async def batch_actor(items: list[int]) -> list[str]:  # noqa: ARG001
+        return ["unknown"]
+
+    actor = router._actors_per_channel_address["default"][0]
+    message = _make_message(b"1")
+
+    (result,) = await _actor_run_batch(
+        actor,
+        [cast(ReceivedMessageT, message)],
+        _make_actor_context(InMemoryServer()),
+    )
+
+    assert isinstance(result, ValueError)
+    assert "invalid per-message result" in str(result)
+
+
+async def test_batch_actor_ack_first() -> None:
+    router = Router()
+
+    @router.actor(batch_size=2, confirmation_mode="ack_first", converter=PydanticConverter)
+    async def batch_actor(items: list[int]) -> None:
+        pass
+
+    actor = router._actors_per_channel_address["default"][0]
+    messages = [_make_message(b"1"), _make_message(b"2")]
+
+    await _actor_run_batch(
+        actor,
+        cast(list[ReceivedMessageT], messages),
+        _make_actor_context(InMemoryServer()),
+    )
+
+    for message in messages:
+        message.ack.assert_awaited_once()
+
+
+def test_batch_actor_validation() -> None:
+    router = Router()
+
+    with pytest.raises(ValueError, match="Batch size"):
+
+        @router.actor(batch_size=0)
+        async def zero_batch(items: list[int]) -> None:
+            pass
+
+    with pytest.raises(ValueError, match="linger"):
+
+        @router.actor(batch_size=1, batch_linger=-1.0)
+        async def negative_linger(items: list[int]) -> None:
+            pass
+
+    with pytest.raises(ValueError, match=r"list\[T\]"):
+
+        @router.actor(batch_size=1)
+        async def not_a_list(item: int) -> None:
+            pass
+
+    with pytest.raises(ValueError, match=r"list\[T\]"):
+
+        @router.actor(batch_size=1)
+        async def too_many_args(items: list[int], other: int) -> None:
+            pass
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from repid import Repid, Router
+from repid._runner import _Runner
+from repid.connections.in_memory import InMemoryServer
+from repid.data import ActorExecutionContext, MessageData
+from repid.serializer import default_serializer
+
+
+def _make_actor_context(server: InMemoryServer) -> ActorExecutionContext:
+    return ActorExecutionContext(
+        server=server,
+        publish=AsyncMock(),
+        default_serializer=default_serializer,
+    )
+
+
+async def _publish(server: InMemoryServer, channel: str, topic: str, amount: int) -> None:
+    for _ in range(amount):
+        await server.publish(
+            channel=channel,
+            message=MessageData(
+                payload=b"",
+                headers={"topic": topic},
+                content_type="application/json",
+            ),
+        )
+
+
+def test_max_concurrency_validation() -> None:
+    router = Router()
+
+    with pytest.raises(ValueError, match="Max concurrency must be at least 1"):
+
+        @router.actor(max_concurrency=0)
+        async def actor() -> None:
+            pass
+
+    with pytest.raises(ValueError, match="Max concurrency must be at least 1"):
+        Router(max_concurrency=0)
+
+
+def test_max_concurrency_router_default() -> None:
+    parent = Router(max_concurrency=3)
+    child = Router()
+
+    @child.actor
+    async def inherited() -> None:
+        pass
+
+    @child.actor(max_concurrency=1)
+    async def overridden() -> None:
+        pass
+
+    parent.include_router(child)
+
+    actors = {actor.name: actor for actor in parent.actors}
+    assert actors["inherited"].max_concurrency == 3
+    assert actors["overridden"].max_concurrency == 1
+
+
+async def test_channel_concurrency_limits_validation() -> None:
+    server = InMemoryServer()
+    with pytest.raises(ValueError, match="Channel concurrency limits must be at least 1"):
+        _Runner(
+            actor_context=_make_actor_context(server),
+            channel_concurrency_limits={"default": 0},
+        )
+
+
+async def test_slow_actor_does_not_starve_others() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    slow_running = 0
+    max_slow_running = 0
+    release_slow = asyncio.Event()
+    fast_processed = 0
+
+    @router.actor(max_concurrency=2)
+    async def slow() -> None:
+        nonlocal slow_running, max_slow_running
+        slow_running += 1
+        max_slow_running = max(max_slow_running, slow_running)
+        await release_slow.wait()
+        slow_running -= 1
+
+    @router.actor
+    async def fast() -> None:
+        nonlocal fast_processed
+        fast_processed += 1
+        if fast_processed == 5:
+            release_slow.set()
+
+    async with server.connection():
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=15,
+            tasks_concurrency_limit=20,
+        )
+        await _publish(server, "default", "slow", 10)
+        await _publish(server, "default", "fast", 5)
+
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert runner.processed == 15
+    assert fast_processed == 5
+    assert max_slow_running == 2
+
+
+async def test_channel_concurrency_limit() -> None:
+    server = InMemoryServer()
+    router = Router()
+
+    running = 0
+    max_running = 0
+    other_processed = 0
+
+    @router.actor(channel="limited")
+    async def limited() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    @router.actor(channel="other")
+    async def other() -> None:
+        nonlocal other_processed
+        other_processed += 1
+
+    async with server.connection():
+        runner = _Runner(
+            actor_context=_make_actor_context(server),
+            max_tasks=13,
+            channel_concurrency_limits={"limited": 3},
+        )
+        await _publish(server, "limited", "limited", 10)
+        await _publish(server, "other", "other", 3)
+
+        await asyncio.wait_for(
+            runner.run(
+                channels_to_actors=router._actors_per_channel_address,
+                graceful_termination_timeout=1.0,
+            ),
+            timeout=5.0,
+        )
+
+    assert runner.processed == 13
+    assert other_processed == 3
+    assert max_running <= 3
+
+
+async def test_run_worker_with_channel_concurrency_limits() -> None:
+    server = InMemoryServer()
+    app = Repid()
+    app.servers.register_server("default", server, is_default=True)
+    router = Router()
+
+    @router.actor(max_concurrency=1)
+    async def test_actor() -> None:
+        pass
+
+    app.include_router(router)
+
+    async with server.connection():
+        await app.send_message(channel="default", payload=b"", headers={"topic": "test_actor"})
+        await app.send_message(channel="default", payload=b"", headers={"topic": "test_actor"})
+        info = await asyncio.wait_for(
+            app.run_worker(
+                messages_limit=2,
+                channel_concurrency_limits={"default": 1},
+                register_signals=[],
+            ),
+            timeout=5.0,
+        )
+
+    assert info.processed == 2
@@ -1,6 +1,19 @@
+from __future__ import annotations
+
+import decimal
+import json
+import math
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+
+import pytest
 from pydantic import BaseModel
 
-from repid.serializer import default_serializer
+from repid._utils import is_installed, json_loads
+from repid.serializer import JsonBackendT, default_serializer, get_json_backend, set_json_backend
 
 
 def test_default_serializer_with_dict() -> None:
@@ -32,3 +45,82 @@ def test_default_serializer_pydantic_inside_of_dict() -> None:
     assert b'"model"' in out
     assert b'"key"' in out
     assert b'"value"' in out
+
+
+@dataclass
+class _Point:
+    x: int
+    at: datetime
+
+
+_COMPATIBLE_VALUES: list[Any] = [
+    {"key": "value", "list": [1, 2.5, None, True], "nested": {"a": []}},
+    datetime(2020, 1, 2, 3, 4, 5, 123, tzinfo=timezone.utc),
+    date(2020, 1, 2),
+    time(1, 2, 3),
+    timedelta(minutes=1, microseconds=5),
+    uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    decimal.Decimal("1.10"),
+    _Point(x=1, at=datetime(2020, 1, 1)),
+    {1: "int key", None: "none key", False: "bool key"},
+    {"non-ascii": "héllo ✓"},
+    {"big": 2**70 + 1, "negative": -(2**63) - 1},
+]
+
+
+@pytest.fixture
+def json_backend() -> Iterator[None]:
+    backend = get_json_backend()
+    yield
+    set_json_backend(backend)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("value", _COMPATIBLE_VALUES)
+def test_orjson_backend_output_is_same_as_json(value: Any, json_backend: None) -> None:  # noqa: ARG001
+    pytest.importorskip("orjson")
+
+    set_json_backend("json")
+    expected = default_serializer(value)
+    set_json_backend("orjson")
+
+    assert default_serializer(value) == expected
+    assert json_loads(expected) == json.loads(expected)
+
+
+def test_json_backend_loads_falls_back_to_json(json_backend: None) -> None:  # noqa: ARG001
+    pytest.importorskip("orjson")
+    set_json_backend("orjson")
+
+    assert math.isnan(json_loads(b'{"a": NaN}')["a"])
+    assert json_loads(b'{"a": "12345678901234567890"}') == {"a": "12345678901234567890"}
+    for data in (b"[1180591620717411303425]", "[1180591620717411303425]"):
+        assert json_loads(data) == [2**70 + 1]
+        assert type(json_loads(data)[0]) is int
+    assert json_loads(memoryview(b"[-9223372036854775809]")) == [-(2**63) - 1]
+    assert json_loads('{"a": "b"}') == {"a": "b"}
+    with pytest.raises(json.JSONDecodeError):
+        json_loads(b"{")
+
+
+def test_json_backend_switch(json_backend: None) -> None:  # noqa: ARG001
+    set_json_backend("json")
+    assert get_json_backend() == "json"
+
+    with pytest.raises(ValueError, match="Unknown JSON backend 'ujson'"):
+        set_json_backend("ujson")  # type: ignore[arg-type]
+
+    if not is_installed("msgspec"):
+        with pytest.raises(ValueError, match="JSON backend 'msgspec' is not installed"):
+            set_json_backend("msgspec")
+
+    set_json_backend()
+    assert get_json_backend() != "json" or not (is_installed("orjson") or is_installed("msgspec"))
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+def test_json_backend_loads_memoryview(backend: JsonBackendT, json_backend: None) -> None:  # noqa: ARG001
+    pytest.importorskip(backend)
+    set_json_backend(backend)
+
+    assert json_loads(memoryview(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+    assert math.isnan(json_loads(memoryview(b'{"a": NaN}'))["a"])
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from repid import Repid, Router
+from repid._supervisor import (
+    _ChildHealthReporter,
+    _ChildMetricsReporter,
+    _ChildProcess,
+    _WorkerSupervisor,
+)
+from repid.connections.in_memory import InMemoryServer
+from repid.data import MessageData
+from repid.health_check_server import (
+    HealthCheckServer,
+    HealthCheckServerSettings,
+    HealthCheckStatus,
+)
+from repid.metrics import Metrics, MetricsServerSettings
+
+
+@pytest.fixture(autouse=True)
+def kill_leftover_children() -> Iterator[None]:
+    yield
+    for child in multiprocessing.active_children():
+        child.kill()
+        child.join()
+
+
+class _IdleWorker:
+    """Stands in for a worker without messages, which runs until it's stopped by SIGUSR1."""
+
+    def __init__(self) -> None:
+        self.health_check_server: HealthCheckServer | None = None
+
+    async def run(self) -> SimpleNamespace:
+        stopped = asyncio.Event()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, stopped.set)
+        if self.health_check_server is not None:
+            self.health_check_server.health_status = HealthCheckStatus.OK
+        await stopped.wait()
+        return SimpleNamespace(processed=0)
+
+
+def _make_app(router: Router) -> tuple[Repid, InMemoryServer]:
+    server = InMemoryServer()
+    app = Repid()
+    app.servers.register_server("default", server, is_default=True)
+    app.include_router(router)
+    return app, server
+
+
+def _prefill(server: InMemoryServer, topic: str, amount: int) -> None:
+    async def publish() -> None:
+        async with server.connection():
+            for _ in range(amount):
+                await server.publish(
+                    channel="default",
+                    message=MessageData(
+                        payload=b"",
+                        headers={"topic": topic},
+                        content_type="application/json",
+                    ),
+                )
+
+    asyncio.run(publish())
+
+
+def test_run_worker_processes_combines_processed_count() -> None:
+    router = Router()
+
+    @router.actor
+    async def test_actor() -> None:
+        pass
+
+    app, server = _make_app(router)
+    _prefill(server, "test_actor", 3)
+
+    # every child inherits its own copy of the in-memory queue
+    info = app.run_worker_processes(processes=2, messages_limit=3, register_signals=[])
+
+    assert info.processed == 6
+
+
+def test_run_worker_processes_restarts_crashed_child(tmp_path: Path) -> None:
+    marker = tmp_path / "crashed"
+    router = Router()
+
+    @router.actor
+    async def crashing_actor() -> None:
+        if not marker.exists():
+            marker.touch()
+            os._exit(1)
+
+    app, server = _make_app(router)
+    _prefill(server, "crashing_actor", 1)
+
+    info = app.run_worker_processes(processes=1, messages_limit=1, register_signals=[])
+
+    assert marker.exists()
+    assert info.processed == 1
+
+
+def test_run_worker_processes_forwards_stop_signal() -> None:
+    router = Router()
+
+    @router.actor
+    async def stop_actor() -> None:
+        os.kill(os.getppid(), signal.SIGUSR1)
+
+    app, server = _make_app(router)
+    _prefill(server, "stop_actor", 1)
+
+    info = app.run_worker_processes(
+        processes=1,
+        graceful_shutdown_time=1.0,
+        register_signals=[signal.SIGUSR1],
+    )
+
+    assert info.processed == 1
+
+
+def test_run_worker_processes_no_server() -> None:
+    app = Repid()
+
+    with pytest.raises(ValueError, match="No default server configured"):
+        app.run_worker_processes(processes=1)
+
+    with pytest.raises(ValueError, match="Server 'missing' not found"):
+        app.run_worker_processes(processes=1, server_name="missing")
+
+
+async def test_run_worker_processes_connected_server_raises() -> None:
+    app, server = _make_app(Router())
+
+    async with server.connection():
+        with pytest.raises(ValueError, match="must not be connected"):
+            app.run_worker_processes(processes=1)
+
+
+def test_supervisor_invalid_processes() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        _WorkerSupervisor(processes=0, server=InMemoryServer(), worker_factory=Mock())
+
+
+def test_supervisor_combined_health_status() -> None:
+    supervisor = _WorkerSupervisor(processes=2, server=InMemoryServer(), worker_factory=Mock())
+    healthy = _ChildProcess(process=Mock(), conn=Mock())
+    unhealthy = _ChildProcess(
+        process=Mock(),
+        conn=Mock(),
+        health_status=HealthCheckStatus.UNHEALTHY,
+    )
+
+    supervisor._children = {0: healthy, 1: healthy}
+    assert supervisor.health_status == HealthCheckStatus.OK
+
+    supervisor._children = {0: healthy, 1: unhealthy}
+    assert supervisor.health_status == HealthCheckStatus.UNHEALTHY
+
+
+def test_supervisor_collects_child_reports() -> None:
+    supervisor = _WorkerSupervisor(processes=1, server=InMemoryServer(), worker_factory=Mock())
+    conn = Mock()
+    conn.poll.side_effect = [True, True, False]
+    conn.recv.side_effect = [("health", 503), ("exit", 7)]
+    child = _ChildProcess(process=Mock(), conn=conn)
+
+    supervisor._collect_reports(child)
+
+    assert child.health_status == HealthCheckStatus.UNHEALTHY
+    assert supervisor.processed == 7
+
+
+async def test_child_health_reporter_forwards_status() -> None:
+    conn = Mock()
+    reporter = _ChildHealthReporter(conn)
+
+    await reporter.start()
+    reporter.health_status = HealthCheckStatus.UNHEALTHY
+    await reporter.stop()
+
+    assert reporter.health_status == HealthCheckStatus.UNHEALTHY
+    conn.send.assert_called_once_with(("health", 503))
+
+
+def test_run_worker_processes_with_metrics_server() -> None:
+    router = Router()
+
+    @router.actor
+    async def test_actor() -> None:
+        pass
+
+    app, server = _make_app(router)
+    _prefill(server, "test_actor", 1)
+
+    info = app.run_worker_processes(
+        processes=2,
+        messages_limit=1,
+        register_signals=[],
+        metrics_server=MetricsServerSettings(address="127.0.0.1", port=10204),
+    )
+
+    assert info.processed == 2
+
+
+async def test_child_metrics_reporter_sends_snapshots() -> None:
+    conn = Mock()
+    metrics = Metrics()
+    metrics.messages_received["my_actor"] += 1
+    reporter = _ChildMetricsReporter(metrics, conn, interval=0.01)
+
+    await reporter.start()
+    await asyncio.sleep(0.05)
+    await reporter.stop()
+
+    assert conn.send.call_count > 1
+    kind, (counters, gauges) = conn.send.call_args.args[0]
+    assert kind == "metrics"
+    assert counters.messages_received == {"my_actor": 1}
+    assert gauges == {}
+
+
+def test_supervisor_combines_child_metrics() -> None:
+    supervisor = _WorkerSupervisor(
+        processes=2,
+        server=InMemoryServer(),
+        worker_factory=Mock(),
+        metrics_server=MetricsServerSettings(),
+    )
+    assert supervisor.metrics is not None
+    processes = []
+    for slot in range(2):
+        metrics = Metrics()
+        metrics.messages_received["my_actor"] += slot + 1
+        metrics.register_gauge("repid_tasks_in_flight", "In flight.", Mock(return_value=slot))
+        conn = Mock()
+        conn.poll.side_effect = [True] + [False] * 3
+        conn.recv.return_value = ("metrics", metrics._snapshot())
+        process = Mock()
+        process.is_alive.return_value = True
+        processes.append(process)
+        supervisor._children[slot] = _ChildProcess(process=process, conn=conn)
+
+    supervisor._check_children()
+    rendered = supervisor.metrics.render()
+
+    assert 'repid_messages_received_total{actor="my_actor"} 3\n' in rendered
+    assert (
+        "# TYPE repid_tasks_in_flight gauge\n"
+        'repid_tasks_in_flight{worker="0"} 0\n'
+        'repid_tasks_in_flight{worker="1"} 1\n'
+    ) in rendered
+
+    # counters of exited children are kept, their gauges are not
+    processes[1].is_alive.return_value = False
+    processes[1].exitcode = 0
+    supervisor._check_children()
+    rendered = supervisor.metrics.render()
+
+    assert 'repid_messages_received_total{actor="my_actor"} 3\n' in rendered
+    assert 'repid_tasks_in_flight{worker="1"}' not in rendered
+
+
+def test_supervisor_restart_backoff() -> None:
+    supervisor = _WorkerSupervisor(processes=1, server=InMemoryServer(), worker_factory=Mock())
+    supervisor.restart_backoff = 1.0
+    supervisor.max_restart_backoff = 5.0
+    child = _ChildProcess(process=Mock(), conn=Mock())
+
+    delays = [supervisor._restart_delay(0, child) for _ in range(5)]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    # a child which has been running for long enough resets the backoff
+    child.started_at -= 10.0
+    assert supervisor._restart_delay(0, child) == 1.0
+
+
+def test_supervisor_delays_restart_of_crashed_child() -> None:
+    supervisor = _WorkerSupervisor(processes=1, server=InMemoryServer(), worker_factory=Mock())
+    supervisor.restart_backoff = 60.0
+    conn = Mock()
+    conn.poll.return_value = False
+    process = Mock()
+    process.is_alive.return_value = False
+    process.exitcode = 1
+    supervisor._children = {0: _ChildProcess(process=process, conn=conn)}
+    supervisor._spawn = Mock()  # type: ignore[method-assign]
+
+    supervisor._check_children()
+
+    assert supervisor._children == {}
+    assert 0 in supervisor._pending_restarts
+    assert supervisor.health_status == HealthCheckStatus.UNHEALTHY
+    supervisor._spawn.assert_not_called()
+
+    supervisor._pending_restarts[0] = 0.0
+    supervisor._check_children()
+
+    supervisor._spawn.assert_called_once_with(0)
+    assert supervisor.restarts == 1
+    assert supervisor._pending_restarts == {}
+
+
+def test_supervisor_restores_signal_mask() -> None:
+    app, _ = _make_app(Router())
+    before = signal.pthread_sigmask(signal.SIG_BLOCK, [])
+
+    app.run_worker_processes(processes=1, messages_limit=0, register_signals=[signal.SIGUSR1])
+
+    assert signal.pthread_sigmask(signal.SIG_BLOCK, []) == before
+
+
+def test_supervisor_terminates_children_if_supervising_fails() -> None:
+    app, _ = _make_app(Router())
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+
+        with pytest.raises(OSError, match="address already in use"):
+            app.run_worker_processes(
+                processes=2,
+                graceful_shutdown_time=1.0,
+                register_signals=[],
+                health_check_server=HealthCheckServerSettings(address="127.0.0.1", port=port),
+            )
+
+    assert multiprocessing.active_children() == []
+
+
+def test_supervisor_child_stops_when_supervisor_exits() -> None:
+    supervisor = _WorkerSupervisor(
+        processes=1,
+        server=InMemoryServer(),
+        worker_factory=_IdleWorker,  # type: ignore[arg-type]
+        register_signals=[signal.SIGUSR1],
+    )
+    supervisor._lifeline = lifeline = os.pipe()
+    child = supervisor._spawn(0)
+    assert child.conn.poll(10.0)  # the worker is running
+
+    # the kernel closes the supervisor's end of the lifeline when it's killed
+    for fd in lifeline:
+        os.close(fd)
+    child.process.join(10.0)
+
+    # the child has been stopped gracefully with its stop signal
+    assert child.process.exitcode == 0
@@ -2,7 +2,7 @@ from typing import Annotated, Literal
 
 import pytest
 
-from repid import Header, Message, Repid, Router
+from repid import Header, Message, MsgpackCodec, Repid, Router
 from repid.connections.abc import MessageAction
 from repid.data import MessageData
 from repid.test_client import TestClient, TestMessage
@@ -755,3 +755,30 @@ async def test_test_client_include_router_after_creation() -> None:
 
         with pytest.raises(ValueError, match="No actor found for channel 'default'"):
             await client.process_next()
+
+
+async def test_test_client_send_message_with_codec() -> None:
+    pytest.importorskip("msgpack")
+
+    app = Repid(default_serializer=MsgpackCodec())
+    router = Router()
+
+    received = []
+
+    @router.actor
+    async def codec_actor(arg1: str) -> None:
+        received.append(arg1)
+
+    app.include_router(router)
+
+    async with TestClient(app) as client:
+        await client.send_message_json(
+            channel="default",
+            payload={"arg1": "hello"},
+            headers={"topic": "codec_actor"},
+        )
+
+        processed = client.get_processed_messages()
+        assert processed[0].content_type == "application/msgpack"
+        assert processed[0].success is True
+        assert received == ["hello"]
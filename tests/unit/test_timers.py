@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from repid._timers import _get_timers, _Timers
+
+
+async def test_timers_are_shared_per_loop() -> None:
+    assert _get_timers() is _get_timers()
+    assert _get_timers().loop is asyncio.get_running_loop()
+
+
+async def test_timers_fire_in_deadline_order() -> None:
+    timers = _Timers(asyncio.get_running_loop())
+    fired: list[str] = []
+
+    timers.call_later(0.03, fired.append, "late")
+    timers.call_later(0.01, fired.append, "early")
+    cancelled = timers.call_later(0.02, fired.append, "cancelled")
+    cancelled.cancel()
+    cancelled.cancel()  # idempotent
+
+    assert len(timers) == 2
+    await asyncio.sleep(0.06)
+
+    assert fired == ["early", "late"]
+    assert len(timers) == 0
+
+
+async def test_timers_round_deadlines_up_to_resolution() -> None:
+    loop = asyncio.get_running_loop()
+    timers = _Timers(loop, resolution=0.5)
+
+    timer = timers.call_at(loop.time(), Mock())
+
+    assert timer.when >= loop.time()
+    assert timer.when / 0.5 == pytest.approx(round(timer.when / 0.5))
+
+
+async def test_timers_compact_cancelled() -> None:
+    timers = _Timers(asyncio.get_running_loop())
+
+    for timer in [timers.call_later(60, Mock()) for _ in range(300)]:
+        timer.cancel()
+
+    assert len(timers) == 0
+    assert len(timers._heap) < 300
+
+
+async def test_timeout_raises_timeout_error() -> None:
+    timers = _Timers(asyncio.get_running_loop())
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with timers.timeout(0.01):
+            await asyncio.sleep(10)
+
+    assert len(timers) == 0
+
+
+async def test_timeout_not_reached() -> None:
+    timers = _Timers(asyncio.get_running_loop())
+
+    async with timers.timeout(10):
+        await asyncio.sleep(0)
+
+    assert len(timers) == 0
+    await asyncio.sleep(0)  # the task isn't cancelled afterwards
+
+
+async def test_keep_alives_due_at_once_are_sent_together() -> None:
+    timers = _Timers(asyncio.get_running_loop(), resolution=0.05)
+    messages = []
+    for _ in range(10):
+        message = Mock()
+        message.is_acted_on = False
+        message.keep_alive = AsyncMock()
+        messages.append(message)
+
+    keep_alives = [timers.keep_alive(message, interval=0.01) for message in messages]
+    await asyncio.sleep(0.08)
+    for keep_alive in keep_alives:
+        keep_alive.stop()
+
+    call_counts = {message.keep_alive.call_count for message in messages}
+    assert len(call_counts) == 1
+    assert call_counts.pop() >= 1
+    assert len(timers) == 0
+
+
+async def test_timeout_keeps_outer_cancellation() -> None:
+    timers = _Timers(asyncio.get_running_loop())
+    entered = asyncio.Event()
+
+    async def sleeper() -> None:
+        async with timers.timeout(0.01):
+            entered.set()
+            try:
+                await asyncio.sleep(10)
+            finally:
+                # the task is cancelled again while the timeout's cancel is in flight
+                asyncio.current_task().cancel()  # type: ignore[union-attr]
+                await asyncio.sleep(0)
+
+    task = asyncio.create_task(sleeper())
+    await entered.wait()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
@@ -110,6 +110,7 @@ def test_json_encoder(obj: object, expected: str) -> None:
         ("pytest", True),
         ("flask", False),
         ("blabla", False),
+        ("blabla.submodule", False),
     ],
 )
 def test_is_imported(dependency: str, result: bool) -> None:
@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import signal
-from typing import Any
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from typing import Annotated, Any
 
 import httpx
 import pytest
 
-from repid import Router
-from repid._worker import _Worker
+from repid import Depends, Router
+from repid._worker import _Worker, _worker_dependencies
 from repid.asyncapi import AsyncAPI3Schema
 from repid.asyncapi_server import AsyncAPIServerSettings
 from repid.connections.in_memory import InMemoryServer
+from repid.converter import _LazyConverter
 from repid.data import ActorExecutionContext, MessageData
+from repid.dependencies._scope import _WorkerScope
 from repid.health_check_server import HealthCheckServerSettings
 from repid.serializer import default_serializer
 
@@ -250,3 +254,67 @@ async def test_worker_run_cancel() -> None:
 
         with pytest.raises(asyncio.CancelledError):
             await asyncio.wait_for(task, timeout=3.0)
+
+
+async def test_worker_scoped_dependencies_lifecycle() -> None:
+    router = Router()
+    events: list[str] = []
+
+    async def _client() -> AsyncIterator[str]:
+        events.append("setup")
+        yield "client"
+        events.append("teardown")
+
+    client = Depends(_client, scope="worker")
+
+    @router.actor
+    async def test_actor(c: Annotated[str, client]) -> None:
+        events.append(c)
+
+    server = InMemoryServer()
+
+    async with server.connection():
+        for _ in range(2):
+            await server.publish(
+                channel="default",
+                message=MessageData(payload=b"", headers={"topic": "test_actor"}),
+            )
+
+        worker = _Worker(
+            actor_context=replace(_make_actor_context(server), worker_scope=_WorkerScope()),
+            router=router._materialize(),
+            graceful_shutdown_time=0.1,
+            messages_limit=2,
+            register_signals=[],
+        )
+
+        await asyncio.wait_for(worker.run(), timeout=3.0)
+
+    assert events == ["setup", "client", "client", "teardown"]
+
+
+def test_worker_dependencies_are_collected_without_building_converters() -> None:
+    router = Router()
+
+    async def _connection() -> AsyncIterator[str]:
+        yield "connection"
+
+    connection = Depends(_connection, scope="worker")
+
+    async def _repository(conn: Annotated[str, connection]) -> str:
+        return conn
+
+    @router.actor
+    async def test_actor(repo: Annotated[str, Depends(_repository)]) -> None:
+        pass
+
+    @router.actor
+    async def other_actor() -> None:
+        pass
+
+    actors = router._materialize().actors
+
+    assert _worker_dependencies(actors) == [connection]
+    for actor in actors:
+        assert isinstance(actor.converter, _LazyConverter)
+        assert actor.converter._converter is None